@@ -0,0 +1,86 @@
+"""
+CPU micro-benchmark for the simulated BFCL environments.
+
+It replays the ground-truth calls of every entry of a BFCL parquet file through `execute_multi_turn_func_call`, as
+if `--repeat` rollouts of the same prompt were running, and reports the number of executed calls per second.
+
+Usage:
+    python -m bfcl_env.benchmark --data data/bfcl_train.parquet --repeat 16
+"""
+
+import argparse
+import json
+import time
+
+import pandas as pd
+
+from bfcl_env.multi_turn_utils import (
+    execute_multi_turn_func_call,
+    release_multi_turn_instances,
+)
+from bfcl_env.scenario_cache import configure_scenario_cache, get_scenario_cache
+
+
+def load_entries(data_path: str, limit: int = 0) -> list[dict]:
+    dataframe = pd.read_parquet(data_path)
+    entries = []
+    for extra_info in dataframe["extra_info"]:
+        interaction_kwargs = extra_info["interaction_kwargs"]
+        entries.append(
+            {
+                "id": interaction_kwargs["id"],
+                "initial_config": json.loads(interaction_kwargs["initial_config"]),
+                "involved_classes": list(interaction_kwargs["involved_classes"]),
+                "ground_truth": [list(turn) for turn in interaction_kwargs["ground_truth"]],
+            }
+        )
+    return entries[:limit] if limit else entries
+
+
+def replay_entries(entries: list[dict], repeat: int, is_augmented: bool) -> dict:
+    num_calls = 0
+    start = time.perf_counter()
+    for entry in entries:
+        long_context = "long_context" in entry["id"] or "composite" in entry["id"]
+        for rollout_index in range(repeat):
+            model_name = f"benchmark_{rollout_index}"
+            for turn_ground_truth in entry["ground_truth"]:
+                execute_multi_turn_func_call(
+                    turn_ground_truth,
+                    entry["initial_config"],
+                    entry["involved_classes"],
+                    model_name,
+                    entry["id"],
+                    long_context=long_context,
+                    is_augmented=is_augmented,
+                )
+                num_calls += len(turn_ground_truth)
+            release_multi_turn_instances(model_name, entry["id"])
+    elapsed = time.perf_counter() - start
+    return {
+        "entries": len(entries),
+        "rollouts": len(entries) * repeat,
+        "calls": num_calls,
+        "seconds": round(elapsed, 3),
+        "calls_per_second": round(num_calls / elapsed, 1) if elapsed > 0 else float("inf"),
+        "scenario_cache": get_scenario_cache().stats(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--data", default="data/bfcl_train.parquet", help="BFCL parquet file to replay.")
+    parser.add_argument("--repeat", type=int, default=16, help="Number of rollouts replayed per entry.")
+    parser.add_argument("--limit", type=int, default=0, help="Only replay the first N entries (0 for all).")
+    parser.add_argument("--augmented", action="store_true", help="Use the augmented environment classes.")
+    parser.add_argument("--no-scenario-cache", action="store_true", help="Load every scenario from scratch.")
+    args = parser.parse_args()
+
+    configure_scenario_cache(enabled=not args.no_scenario_cache)
+
+    entries = load_entries(args.data, args.limit)
+    print(json.dumps(replay_entries(entries, args.repeat, args.augmented)))
+
+
+if __name__ == "__main__":
+    main()
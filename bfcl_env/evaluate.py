@@ -0,0 +1,282 @@
+"""
+Offline evaluator for decoded model responses on a BFCL parquet file. It runs `multi_turn_checker` and
+`multi_turn_irrelevance_checker` on CPU only, across a process pool, without any rollout.
+
+The responses are read from a JSON Lines file with one entry per line, in the format of the BFCL result files:
+`{"id": "multi_turn_base_1", "result": [[["ls(a=True)"], ...], ...]}`, where `result` holds, for each turn, the
+decoded function calls of each step of the model. The result of each entry is appended to `--output` as soon as it
+is scored. Entries whose result is already in `--output` for the same response are not scored again, so an
+interrupted evaluation resumes where it stopped and re-scoring a checkpoint only scores the responses that changed.
+The accuracy, overall and by category, is printed at the end.
+
+Usage:
+    python -m bfcl_env.evaluate --data data/bfcl_test.parquet --responses results.jsonl --output scores.jsonl
+"""
+
+import argparse
+import concurrent.futures
+import hashlib
+import json
+import os
+import time
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional
+
+from bfcl_env.benchmark import load_entries
+from bfcl_env.multi_turn_checker import multi_turn_checker, multi_turn_irrelevance_checker
+
+MODEL_NAME = "offline_eval"
+
+
+def load_responses(responses_path: str) -> Dict[str, Any]:
+    """
+    Load the decoded model responses, by entry id. Later lines override earlier ones.
+
+    Args:
+        responses_path (str): JSON Lines file with an `id` and a `result` per line.
+
+    Returns:
+        responses (Dict[str, Any]): The `result` of each entry.
+    """
+    responses = {}
+    with open(responses_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                responses[record["id"]] = record["result"]
+    return responses
+
+
+def get_response_hash(result: Any, is_augmented: bool) -> str:
+    """Return a key of a response, which identifies the results that can be reused for it."""
+    payload = json.dumps([result, is_augmented], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def get_category(entry_id: str) -> str:
+    """Return the test category of an entry, e.g. `multi_turn_base` for `multi_turn_base_1`."""
+    return entry_id.rsplit("_", 1)[0]
+
+
+def score_entry(entry: dict, result: Any, is_augmented: bool = False, keep_details: bool = False) -> dict:
+    """
+    Score the decoded responses of a model on one entry, like the BFCL multi turn evaluation: the execution of the
+    model calls is checked against the ground truth turn by turn, then the turns without ground truth are checked to
+    have no calls.
+
+    Args:
+        entry (dict): The entry, as returned by `load_entries`.
+        result (Any): The decoded function calls of each step of each turn.
+        is_augmented (bool): Whether to use the augmented environment classes.
+        keep_details (bool): Whether to keep the details of the failures (e.g. the execution results).
+
+    Returns:
+        score (dict): The `valid` flag, and the `error_type` and `error_message` of a failure.
+    """
+    ground_truth = entry["ground_truth"]
+    if not isinstance(result, list) or not all(
+        isinstance(turn, list) and all(isinstance(step, list) for step in turn) for turn in result
+    ):
+        checker_result = {
+            "valid": False,
+            "error_message": "The result must be a list of turns, each a list of steps, each a list of calls.",
+            "error_type": "multi_turn:invalid_result_format",
+        }
+    elif len(result) != len(ground_truth):
+        checker_result = {
+            "valid": False,
+            "error_message": f"Model was force-terminated during inference phase. The length of the model result "
+            f"turns ({len(result)}) does not match the length of the ground truth turns ({len(ground_truth)}).",
+            "error_type": "multi_turn:force_terminated",
+        }
+    else:
+        try:
+            checker_result = multi_turn_checker(
+                result,
+                ground_truth,
+                entry,
+                get_category(entry["id"]),
+                MODEL_NAME,
+                is_augmented=is_augmented,
+            )
+            if checker_result["valid"]:
+                checker_result = multi_turn_irrelevance_checker(result, ground_truth)
+        except Exception as e:
+            checker_result = {
+                "valid": False,
+                "error_message": f"{type(e).__name__}: {e}",
+                "error_type": "multi_turn:checker_error",
+            }
+
+    score = {"valid": checker_result["valid"]}
+    if not checker_result["valid"]:
+        score["error_type"] = checker_result.get("error_type")
+        score["error_message"] = checker_result.get("error_message")
+        if keep_details:
+            score["details"] = {
+                key: value for key, value in checker_result.items() if key not in ("valid", "error_type", "error_message")
+            }
+    return score
+
+
+def load_cached_scores(output_path: str) -> Dict[str, dict]:
+    """Load the scores already written to the output file, by entry id. Unreadable lines are ignored."""
+    cached_scores = {}
+    if not os.path.exists(output_path):
+        return cached_scores
+    with open(output_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+                cached_scores[record["id"]] = record
+            except (json.JSONDecodeError, KeyError, TypeError):
+                # e.g. the last line of an interrupted run
+                continue
+    return cached_scores
+
+
+def evaluate(
+    entries: List[dict],
+    responses: Dict[str, Any],
+    output_path: str,
+    num_workers: int = 0,
+    is_augmented: bool = False,
+    keep_details: bool = False,
+) -> dict:
+    """
+    Score every entry that has a response, reusing the scores in the output file for the responses that did not
+    change, and write the scores to the output file as they are computed.
+
+    Args:
+        entries (List[dict]): The entries, as returned by `load_entries`.
+        responses (Dict[str, Any]): The decoded responses, by entry id.
+        output_path (str): JSON Lines file the scores are read from and written to.
+        num_workers (int): Number of worker processes. Defaults to scoring in the current process.
+        is_augmented (bool): Whether to use the augmented environment classes.
+        keep_details (bool): Whether to keep the details of the failures in the output file.
+
+    Returns:
+        summary (dict): The accuracy, overall and by category, and the number of entries scored and reused.
+    """
+    start = time.perf_counter()
+    cached_scores = load_cached_scores(output_path)
+    records: List[dict] = []
+    pending = []
+    num_missing = 0
+    for entry in entries:
+        if entry["id"] not in responses:
+            num_missing += 1
+            continue
+        response_hash = get_response_hash(responses[entry["id"]], is_augmented)
+        cached_score = cached_scores.get(entry["id"])
+        if cached_score is not None and cached_score.get("response_hash") == response_hash:
+            records.append(cached_score)
+        else:
+            pending.append((entry, response_hash))
+
+    # Only keep the scores that are still valid, then append the new ones as they are computed
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    temp_path = output_path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+    os.replace(temp_path, output_path)
+    num_reused = len(records)
+
+    with open(output_path, "a", encoding="utf-8") as f:
+        for entry, response_hash, score in _score_entries(pending, responses, num_workers, is_augmented, keep_details):
+            record = {
+                "id": entry["id"],
+                "category": get_category(entry["id"]),
+                "response_hash": response_hash,
+                **score,
+            }
+            f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+            f.flush()
+            records.append(record)
+
+    summary = summarize(records)
+    summary.update(
+        {
+            "scored": len(records) - num_reused,
+            "reused": num_reused,
+            "missing": num_missing,
+            "seconds": round(time.perf_counter() - start, 3),
+        }
+    )
+    return summary
+
+
+def summarize(records: Iterable[dict]) -> dict:
+    """Return the accuracy of the scores, overall and by category."""
+    num_correct = defaultdict(int)
+    num_total = defaultdict(int)
+    for record in records:
+        category = record.get("category") or get_category(record["id"])
+        num_total[category] += 1
+        num_correct[category] += bool(record["valid"])
+    total = sum(num_total.values())
+    return {
+        "entries": total,
+        "accuracy": round(sum(num_correct.values()) / total, 4) if total else 0.0,
+        "categories": {
+            category: {
+                "correct": num_correct[category],
+                "total": num_total[category],
+                "accuracy": round(num_correct[category] / num_total[category], 4),
+            }
+            for category in sorted(num_total)
+        },
+    }
+
+
+def _score_entries(
+    pending: List[tuple], responses: Dict[str, Any], num_workers: int, is_augmented: bool, keep_details: bool
+) -> Iterable[tuple]:
+    """Yield `(entry, response_hash, score)` for each pending entry, in the order they are scored."""
+    if num_workers <= 0:
+        for entry, response_hash in pending:
+            yield entry, response_hash, score_entry(entry, responses[entry["id"]], is_augmented, keep_details)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=num_workers) as executor:
+        futures = {
+            executor.submit(score_entry, entry, responses[entry["id"]], is_augmented, keep_details): (
+                entry,
+                response_hash,
+            )
+            for entry, response_hash in pending
+        }
+        for future in concurrent.futures.as_completed(futures):
+            entry, response_hash = futures[future]
+            yield entry, response_hash, future.result()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--data", default="data/bfcl_test.parquet", help="BFCL parquet file with the ground truth.")
+    parser.add_argument("--responses", required=True, help="JSON Lines file with the decoded model responses.")
+    parser.add_argument("--output", required=True, help="JSON Lines file the scores are written to and resumed from.")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="Number of worker processes (0 for none)."
+    )
+    parser.add_argument("--limit", type=int, default=0, help="Only evaluate the first N entries (0 for all).")
+    parser.add_argument("--augmented", action="store_true", help="Use the augmented environment classes.")
+    parser.add_argument("--details", action="store_true", help="Keep the details of the failures in the output.")
+    args = parser.parse_args(argv)
+
+    entries = load_entries(args.data, args.limit)
+    responses = load_responses(args.responses)
+    summary = evaluate(
+        entries,
+        responses,
+        args.output,
+        num_workers=args.workers,
+        is_augmented=args.augmented,
+        keep_details=args.details,
+    )
+    print(json.dumps(summary))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+from typing import Any, NoReturn
+
+
+def _read_only(self, *args, **kwargs) -> NoReturn:
+    raise TypeError(f"'{type(self).__name__}' object is read-only")
+
+
+class FrozenDict(dict):
+    """
+    A dict that cannot be modified, used for data shared by every API instance of the process (e.g. the long context
+    extensions). It is a real dict, so it is equal to, serialized and printed like the dict it was built from.
+    Copies (`dict(value)`, `value.copy()`) are plain dicts, which is how instances take their own modifiable version
+    of a shared record.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "FrozenDict":
+        return self
+
+    def __reduce__(self):
+        # The default reduction fills an empty instance item by item
+        return type(self), (dict(self),)
+
+
+class FrozenList(list):
+    """
+    A list that cannot be modified, the list counterpart of `FrozenDict`. Copies (`list(value)`, `value.copy()`,
+    slices) are plain lists.
+    """
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __copy__(self) -> "FrozenList":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "FrozenList":
+        return self
+
+    def __reduce__(self):
+        return type(self), (list(self),)
+
+
+def freeze(value: Any) -> Any:
+    """
+    Return a version of a piece of data made of dicts, lists and scalars that cannot be modified, at any depth.
+
+    Args:
+        value (Any): The value to freeze.
+
+    Returns:
+        frozen_value (Any): The value, with its dicts and lists replaced with `FrozenDict` and `FrozenList`.
+    """
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    return value
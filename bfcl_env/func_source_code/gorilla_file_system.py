@@ -1,25 +1,34 @@
 import datetime
+import functools
+import itertools
 import subprocess
+import sys
 from copy import deepcopy
 from typing import Dict, List, Optional, Union
 
-from bfcl_env.func_source_code.long_context import (
-    FILE_CONTENT_EXTENSION, FILES_TAIL_USED, POPULATE_FILE_EXTENSION)
+from bfcl_env.func_source_code import long_context as long_context_data
 
 
 class File:
 
-    def __init__(self, name: str, content: str = "") -> None:
+    # Long context scenarios hold many nodes, so they do not carry a `__dict__`
+    __slots__ = ("name", "content", "_last_modified", "_shared")
+
+    def __init__(self, name: str, content: str = "", shared: bool = False) -> None:
         """
         Initialize a file with a name and optional content.
 
         Args:
             name (str): The name of the file.
             content (str, optional): The initial content of the file. Defaults to an empty string.
+            shared (bool, optional): Whether the file is shared by several directories (e.g. the files populated for
+                long context). Shared files are never written, see `Directory._get_writable_file`. Defaults to False.
         """
-        self.name: str = name
+        self.name: str = sys.intern(name)
         self.content: str = content
-        self._last_modified: datetime.datetime = datetime.datetime.now()
+        # Only set when the file is written, nothing compares it
+        self._last_modified: Optional[datetime.datetime] = None
+        self._shared: bool = shared
 
     def _write(self, new_content: str) -> None:
         """
@@ -58,9 +67,50 @@ class File:
             return False
         return self.name == other.name and self.content == other.content
 
+    def _state_hash(self, hash_value) -> int:
+        """
+        Hash the file consistently with `__eq__`, see `bfcl_env.state_tracking.structural_hash`.
+
+        Args:
+            hash_value (Callable[[Any], int]): The function used to hash the state of the file.
+        """
+        return hash_value((self.name, self.content))
+
+    def _fork(self, memo: dict) -> "File":
+        """
+        Copy the file. The content is shared with the original, since strings are immutable. Shared files are not
+        copied at all.
+
+        Args:
+            memo (dict): The nodes already copied, keyed by the id of the original node.
+
+        Returns:
+            file (File): The copied file.
+        """
+        if self._shared:
+            return self
+        forked_file = memo.get(id(self))
+        if forked_file is None:
+            forked_file = File.__new__(File)
+            forked_file.name = self.name
+            forked_file.content = self.content
+            forked_file._last_modified = self._last_modified
+            forked_file._shared = False
+            memo[id(self)] = forked_file
+        return forked_file
+
+
+# The files populated in the innermost directories for long context are empty and only replaced when written, so
+# every scenario shares the same ones. They are only created by the first long context scenario, which loads the data
+@functools.lru_cache(maxsize=None)
+def _get_populated_files() -> Dict[str, File]:
+    return {name: File(name, shared=True) for name in long_context_data.POPULATE_FILE_EXTENSION}
+
 
 class Directory:
 
+    __slots__ = ("name", "parent", "contents", "_paths_index", "_size", "_aliases")
+
     def __init__(self, name: str, parent: Optional["Directory"] = None) -> None:
         """
         Initialize a directory with a name.
@@ -68,9 +118,14 @@ class Directory:
         Args:
             name (str): The name of the directory.
         """
-        self.name: str = name
+        self.name: str = sys.intern(name)
         self.parent: Optional["Directory"] = parent
         self.contents: Dict[str, Union["File", "Directory"]] = {}
+        # Caches of the subtree, see `_get_paths_index`, `_get_size` and `_invalidate`
+        self._paths_index: Optional[tuple] = None
+        self._size: Optional[int] = None
+        # Directories sharing items with this one, see `_add_alias`
+        self._aliases: List["Directory"] = []
 
     def _add_file(self, file_name: str, content: str = "") -> None:
         """
@@ -85,7 +140,7 @@ class Directory:
                 f"File '{file_name}' already exists in directory '{self.name}'."
             )
         new_file = File(file_name, content)
-        self.contents[file_name] = new_file
+        self.contents[new_file.name] = new_file
 
     def _add_directory(self, dir_name: str) -> None:
         """
@@ -99,7 +154,7 @@ class Directory:
                 f"Directory '{dir_name}' already exists in directory '{self.name}'."
             )
         new_dir = Directory(dir_name, self)
-        self.contents[dir_name] = new_dir
+        self.contents[new_dir.name] = new_dir
 
     def _get_item(self, item_name: str) -> Union["File", "Directory", None]:
         """
@@ -113,6 +168,101 @@ class Directory:
         """
         return self.contents.get(item_name)
 
+    def _get_writable_file(self, file_name: str) -> "File":
+        """
+        Get a file of the directory that is about to be written. A shared file is replaced with a copy first.
+
+        Args:
+            file_name (str): The name of the file, which must be in the directory.
+
+        Returns:
+            file (File): The file, owned by the directory. Directories are returned as they are.
+        """
+        item = self.contents[file_name]
+        if isinstance(item, File) and item._shared:
+            item = self.contents[file_name] = File(item.name, item.content)
+        return item
+
+    def _get_paths_index(self) -> tuple:
+        """
+        Get the index of the paths of the subtree of the directory, built once and kept until the subtree changes.
+
+        Returns:
+            index (tuple): `(paths, name_positions)`, where `paths` are the paths of the items of the subtree relative to
+                the directory (e.g. "/folder/file.txt"), in depth-first order, and `name_positions` the positions in
+                `paths` of the items with each name, in increasing order. The index is shared and must not be mutated.
+        """
+        index = self._paths_index
+        if index is not None:
+            return index
+        paths = []
+        name_positions = {}
+        for item_name, item in self.contents.items():
+            item_path = f"/{item_name}"
+            name_positions.setdefault(item_name, []).append(len(paths))
+            paths.append(item_path)
+            if isinstance(item, Directory):
+                item_paths, item_name_positions = item._get_paths_index()
+                offset = len(paths)
+                for name, positions in item_name_positions.items():
+                    name_positions.setdefault(name, []).extend(offset + position for position in positions)
+                paths.extend(item_path + path for path in item_paths)
+        index = self._paths_index = (paths, name_positions)
+        return index
+
+    def _get_size(self) -> int:
+        """
+        Get the size in bytes of the files of the subtree of the directory, computed once and kept until the subtree
+        changes.
+
+        Returns:
+            size (int): The size of the subtree.
+        """
+        size = self._size
+        if size is not None:
+            return size
+        size = 0
+        for item in self.contents.values():
+            if isinstance(item, Directory):
+                size += item._get_size()
+            else:
+                size += len(item._read().encode("utf-8"))
+        self._size = size
+        return size
+
+    def _add_alias(self, other: "Directory") -> None:
+        """
+        Record that the directory and another one share items, e.g. after a directory is copied or moved, so a change
+        under either of them also invalidates the caches of the other.
+
+        Args:
+            other (Directory): The other directory.
+        """
+        self._aliases.append(other)
+        other._aliases.append(self)
+
+    def _invalidate(self, sizes_only: bool = False) -> None:
+        """
+        Drop the cached indexes of the directory, of its ancestors and of the directories sharing items with them,
+        after the contents of the directory changed.
+
+        Args:
+            sizes_only (bool): Whether only the content of a file changed, which keeps the paths.
+        """
+        seen = set()
+        stack = [self]
+        while stack:
+            directory = stack.pop()
+            if id(directory) in seen:
+                continue
+            seen.add(id(directory))
+            directory._size = None
+            if not sizes_only:
+                directory._paths_index = None
+            if directory.parent is not None:
+                stack.append(directory.parent)
+            stack.extend(directory._aliases)
+
     def _list_contents(self) -> List[str]:
         """
         List the names of all contents in the directory.
@@ -130,12 +280,58 @@ class Directory:
             return False
         return self.name == other.name and self.contents == other.contents
 
+    def _state_hash(self, hash_value) -> int:
+        """
+        Hash the directory and its contents consistently with `__eq__`, see `bfcl_env.state_tracking.structural_hash`.
+
+        Args:
+            hash_value (Callable[[Any], int]): The function used to hash the state of the directory.
+        """
+        return hash_value(
+            (
+                self.name,
+                frozenset(
+                    (item_name, item._state_hash(hash_value))
+                    for item_name, item in self.contents.items()
+                ),
+            )
+        )
+
+    def _fork(self, memo: dict) -> "Directory":
+        """
+        Copy the directory, its parents and its contents. Nodes reachable more than once are copied once.
+
+        Args:
+            memo (dict): The nodes already copied, keyed by the id of the original node.
+
+        Returns:
+            directory (Directory): The copied directory.
+        """
+        forked_dir = memo.get(id(self))
+        if forked_dir is not None:
+            return forked_dir
+        forked_dir = Directory.__new__(Directory)
+        memo[id(self)] = forked_dir
+        forked_dir.name = self.name
+        forked_dir.parent = self.parent._fork(memo) if self.parent else None
+        forked_dir.contents = {
+            item_name: item._fork(memo) for item_name, item in self.contents.items()
+        }
+        # The caches are never mutated
+        forked_dir._paths_index = self._paths_index
+        forked_dir._size = self._size
+        forked_dir._aliases = [alias._fork(memo) for alias in self._aliases]
+        return forked_dir
+
 
 DEFAULT_STATE = {"root": Directory("/", None)}
 
 
 class GorillaFileSystem:
 
+    # The current directory is a node of the tree under `root`, see `bfcl_env.state_tracking`
+    _state_aliases = {"_current_dir": ("root",)}
+
     def __init__(self) -> None:
         """
         Initialize the Gorilla file system with a root directory
@@ -149,6 +345,36 @@ class GorillaFileSystem:
             return False
         return self.root == other.root
 
+    def _fork(self) -> "GorillaFileSystem":
+        """
+        Return an independent copy of the file system, used to branch a loaded scenario without loading it again.
+        File contents are shared with the original file system.
+
+        Returns:
+            file_system (GorillaFileSystem): The copied file system.
+        """
+        forked_fs = GorillaFileSystem.__new__(GorillaFileSystem)
+        forked_fs.__dict__.update(self.__dict__)
+        memo = {}
+        forked_fs.root = self.root._fork(memo)
+        forked_fs._current_dir = self._current_dir._fork(memo)
+        return forked_fs
+
+    def _private_state_key(self) -> tuple:
+        """
+        Return a key of the current directory, the only private state of the file system, see `bfcl_env.step_cache`.
+
+        Returns:
+            key (tuple): The names of the directories from the top of the tree to the current directory, and whether
+                that top is the root.
+        """
+        path = []
+        dir = self._current_dir
+        while dir.parent is not None:
+            path.append(dir.name)
+            dir = dir.parent
+        return (tuple(reversed(path)), dir is self.root)
+
     def _load_scenario(self, scenario: dict, long_context: bool = False) -> None:
         """
         Load a scenario into the file system.
@@ -219,14 +445,14 @@ class GorillaFileSystem:
                 is_bottommost = False
                 new_dir = Directory(dir_name, parent)
                 new_dir = self._load_directory(dir_data["contents"], new_dir)
-                parent.contents[dir_name] = new_dir
+                parent.contents[new_dir.name] = new_dir
 
             elif dir_data["type"] == "file":
                 content = dir_data["content"]
-                if self.long_context and dir_name not in FILES_TAIL_USED:
-                    content += FILE_CONTENT_EXTENSION
+                if self.long_context and dir_name not in long_context_data.FILES_TAIL_USED:
+                    content += long_context_data.FILE_CONTENT_EXTENSION
                 new_file = File(dir_name, content)
-                parent.contents[dir_name] = new_file
+                parent.contents[new_file.name] = new_file
 
         if is_bottommost and self.long_context:
             self._populate_directory(parent)
@@ -242,10 +468,12 @@ class GorillaFileSystem:
         Args:
             directory (Directory): The innermost directory to populate.
         """
-        for i in range(len(POPULATE_FILE_EXTENSION)):
-            name = POPULATE_FILE_EXTENSION[i]
-            file_name = f"{name}"
-            directory._add_file(file_name)
+        for file_name, populated_file in _get_populated_files().items():
+            if file_name in directory.contents:
+                raise ValueError(
+                    f"File '{file_name}' already exists in directory '{directory.name}'."
+                )
+            directory.contents[file_name] = populated_file
 
     def pwd(self):
         """
@@ -339,6 +567,7 @@ class GorillaFileSystem:
             return {"error": f"mkdir: cannot create directory '{dir_name}': File or directory already exists"}
 
         self._current_dir._add_directory(dir_name)
+        self._current_dir._invalidate()
         return None
 
     def touch(self, file_name: str) -> Union[None, Dict[str, str]]:
@@ -361,6 +590,7 @@ class GorillaFileSystem:
             return {"error": f"touch: '{file_name}': File or directory already exists"}
 
         self._current_dir._add_file(file_name)
+        self._current_dir._invalidate()
         return None
 
     def echo(
@@ -392,11 +622,13 @@ class GorillaFileSystem:
             if file_name in self._current_dir.contents:
                 item = self._current_dir._get_item(file_name)
                 if isinstance(item, File):
-                    item._write(content)
+                    self._current_dir._get_writable_file(file_name)._write(content)
+                    self._current_dir._invalidate(sizes_only=True)
                 else:
                     return {"error": f"echo: '{file_name}': Is a directory. Cannot write to directory."}
             else:
                 self._current_dir._add_file(file_name, content)
+                self._current_dir._invalidate()
         else:
             return {"terminal_output": content}
 
@@ -439,18 +671,21 @@ class GorillaFileSystem:
             matches (List[str]): A list of matching file and directory paths relative to the given path.
 
         """
-        matches = []
         target_dir = self._current_dir
 
-        def recursive_search(directory: Directory, base_path: str) -> None:
-            for item_name, item in directory.contents.items():
-                item_path = f"{base_path}/{item_name}"
-                if name is None or name in item_name:
-                    matches.append(item_path)
-                if isinstance(item, Directory):
-                    recursive_search(item, item_path)
-
-        recursive_search(target_dir, path.rstrip("/"))
+        base_path = path.rstrip("/")
+        paths, name_positions = target_dir._get_paths_index()
+        if name is None:
+            matches = [base_path + item_path for item_path in paths]
+        else:
+            matched_positions = [
+                positions for item_name, positions in name_positions.items() if name in item_name
+            ]
+            if len(matched_positions) > 1:
+                positions = sorted(itertools.chain.from_iterable(matched_positions))
+            else:
+                positions = matched_positions[0] if matched_positions else []
+            matches = [base_path + paths[position] for position in positions]
         return {"matches": matches}
 
     def wc(self, file_name: str, mode: str = "l") -> Dict[str, Union[int, str]]:
@@ -559,18 +794,11 @@ class GorillaFileSystem:
             disk_usage (str): The estimated disk usage.
         """
 
-        def get_size(item: Union[File, Directory]) -> int:
-            if isinstance(item, File):
-                return len(item._read().encode("utf-8"))
-            elif isinstance(item, Directory):
-                return sum(get_size(child) for child in item.contents.values())
-            return 0
-
         target_dir = self._navigate_to_directory(None)
         if isinstance(target_dir, dict):  # Error condition check
             return target_dir
 
-        total_size = get_size(target_dir)
+        total_size = target_dir._get_size()
 
         if human_readable:
             for unit in ["B", "KB", "MB", "GB", "TB"]:
@@ -712,6 +940,9 @@ class GorillaFileSystem:
                     else:
                         dest_item._add_directory(source)
                         dest_item.contents[source].contents = item.contents
+                        item._add_alias(dest_item.contents[source])
+                    self._current_dir._invalidate()
+                    dest_item._invalidate()
                     return {"result": f"'{source}' moved to '{destination}/{source}'"}
             else:
                 return {
@@ -725,6 +956,8 @@ class GorillaFileSystem:
             else:
                 self._current_dir._add_directory(destination)
                 self._current_dir.contents[destination].contents = item.contents
+                item._add_alias(self._current_dir.contents[destination])
+            self._current_dir._invalidate()
             return {"result": f"'{source}' moved to '{destination}'"}
 
     def rm(self, file_name: str) -> Dict[str, str]:
@@ -745,6 +978,7 @@ class GorillaFileSystem:
             item = self._current_dir._get_item(file_name)
             if isinstance(item, File) or isinstance(item, Directory):
                 self._current_dir.contents.pop(file_name)
+                self._current_dir._invalidate()
                 return {"result": f"'{file_name}' removed"}
             else:
                 return {
@@ -776,6 +1010,7 @@ class GorillaFileSystem:
                     }
                 else:
                     self._current_dir.contents.pop(dir_name)
+                    self._current_dir._invalidate()
                     return {"result": f"'{dir_name}' removed"}
             else:
                 return {"error": f"rmdir: cannot remove '{dir_name}': Not a directory"}
@@ -834,6 +1069,9 @@ class GorillaFileSystem:
                     else:
                         dest_item._add_directory(source)
                         dest_item.contents[source].contents = item.contents.copy()
+                        item._add_alias(dest_item.contents[source])
+                    self._current_dir._invalidate()
+                    dest_item._invalidate()
                     return {"result": f"'{source}' copied to '{destination}/{source}'"}
             else:
                 return {
@@ -846,6 +1084,8 @@ class GorillaFileSystem:
             else:
                 self._current_dir._add_directory(destination)
                 self._current_dir.contents[destination].contents = item.contents.copy()
+                item._add_alias(self._current_dir.contents[destination])
+            self._current_dir._invalidate()
             return {"result": f"'{source}' copied to '{destination}'"}
 
     def _navigate_to_directory(
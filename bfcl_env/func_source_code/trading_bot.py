@@ -1,17 +1,10 @@
 import random
 from copy import deepcopy
 from datetime import datetime, time, timedelta
-from typing import Dict, List, Optional, Union
-
-from bfcl_env.func_source_code.long_context import (
-    AUTOMOBILE_EXTENSION,
-    MA_5_EXTENSION,
-    MA_20_EXTENSION,
-    ORDER_DETAIL_EXTENSION,
-    TECHNOLOGY_EXTENSION,
-    TRANSACTION_HISTORY_EXTENSION,
-    WATCH_LIST_EXTENSION,
-)
+from typing import Dict, List, Optional, Tuple, Union
+
+from bfcl_env.frozen import FrozenDict
+from bfcl_env.func_source_code import long_context as long_context_data
 
 CURRENT_TIME = datetime(2024, 9, 1, 10, 30)
 
@@ -126,6 +119,32 @@ DEFAULT_STATE = {
     "random_seed": 1053520,
 }
 
+# The stock symbol of every supported company
+COMPANY_SYMBOLS: Dict[str, str] = FrozenDict(
+    {
+        "Apple": "AAPL",
+        "Google": "GOOG",
+        "Tesla": "TSLA",
+        "Microsoft": "MSFT",
+        "Nvidia": "NVDA",
+        "Zeta Corp": "ZETA",
+        "Alpha Tech": "ALPH",
+        "Omega Industries": "OMEG",
+        "Quasar Ltd.": "QUAS",
+        "Neptune Systems": "NEPT",
+        "Synex Solutions": "SYNX",
+        "Amazon": "AMZN",
+    }
+)
+
+# The stock symbols of every supported sector
+SECTOR_STOCKS: Dict[str, Tuple[str, ...]] = FrozenDict(
+    {
+        "Technology": ("AAPL", "GOOG", "MSFT", "NVDA"),
+        "Automobile": ("TSLA", "F", "GM"),
+    }
+)
+
 
 class TradingBot:
     """
@@ -253,22 +272,7 @@ class TradingBot:
         Returns:
             symbol (str): Symbol of the stock or "Stock not found" if not available.
         """
-        symbol_map = {
-            "Apple": "AAPL",
-            "Google": "GOOG",
-            "Tesla": "TSLA",
-            "Microsoft": "MSFT",
-            "Nvidia": "NVDA",
-            "Zeta Corp": "ZETA",
-            "Alpha Tech": "ALPH",
-            "Omega Industries": "OMEG",
-            "Quasar Ltd.": "QUAS",
-            "Neptune Systems": "NEPT",
-            "Synex Solutions": "SYNX",
-            "Amazon": "AMZN",
-        }
-
-        return {"symbol": symbol_map.get(name, "Stock not found")}
+        return {"symbol": COMPANY_SYMBOLS.get(name, "Stock not found")}
 
     def get_stock_info(self, symbol: str) -> Dict[str, Union[float, int, str]]:
         """
@@ -288,8 +292,8 @@ class TradingBot:
             return {"error": f"Stock with symbol '{symbol}' not found."}
         if self.long_context:
             stock = self.stocks[symbol].copy()
-            stock["MA(5)"] = MA_5_EXTENSION
-            stock["MA(20)"] = MA_20_EXTENSION
+            stock["MA(5)"] = long_context_data.MA_5_EXTENSION
+            stock["MA(20)"] = long_context_data.MA_20_EXTENSION
             return stock
         return self.stocks[symbol]
 
@@ -320,7 +324,7 @@ class TradingBot:
             symbol = order["symbol"]
 
             formatted_extension = {}
-            for key, value in ORDER_DETAIL_EXTENSION.items():
+            for key, value in long_context_data.ORDER_DETAIL_EXTENSION.items():
                 try:
                     formatted_extension[key] = value.format(symbol=symbol)
                 except KeyError as e:
@@ -560,7 +564,7 @@ class TradingBot:
 
         if self.long_context:
             watch_list = self.watch_list.copy()
-            watch_list.extend(WATCH_LIST_EXTENSION)
+            watch_list.extend(long_context_data.WATCH_LIST_EXTENSION)
             return watch_list
         return {"watchlist": self.watch_list}
 
@@ -622,7 +626,7 @@ class TradingBot:
         ]
 
         if self.long_context:
-            filtered_history.extend(TRANSACTION_HISTORY_EXTENSION)
+            filtered_history.extend(long_context_data.TRANSACTION_HISTORY_EXTENSION)
 
         return {"transaction_history": filtered_history}
 
@@ -663,15 +667,13 @@ class TradingBot:
         Returns:
             stock_list (List[str]): List of stock symbols in the specified sector.
         """
-        sector_map = {
-            "Technology": ["AAPL", "GOOG", "MSFT", "NVDA"],
-            "Automobile": ["TSLA", "F", "GM"],
-        }
-
+        stock_list = list(SECTOR_STOCKS.get(sector, ()))
         if self.long_context:
-            sector_map["Technology"].extend(TECHNOLOGY_EXTENSION)
-            sector_map["Automobile"].extend(AUTOMOBILE_EXTENSION)
-        return {"stock_list": sector_map.get(sector, [])}
+            if sector == "Technology":
+                stock_list.extend(long_context_data.TECHNOLOGY_EXTENSION)
+            elif sector == "Automobile":
+                stock_list.extend(long_context_data.AUTOMOBILE_EXTENSION)
+        return {"stock_list": stock_list}
 
     def filter_stocks_by_price(
         self, stocks: List[str], min_price: float, max_price: float
@@ -1,10 +1,11 @@
+import functools
 import random
 from copy import deepcopy
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Union
 
-from bfcl_env.func_source_code.long_context import (
-    BOOKING_RECORD_EXTENSION, CREDIT_CARD_EXTENSION)
+from bfcl_env.frozen import FrozenDict
+from bfcl_env.func_source_code import long_context as long_context_data
 
 DEFAULT_STATE = {
     "random_seed": 141053,
@@ -19,6 +20,247 @@ DEFAULT_STATE = {
     "budget_limit": None,
 }
 
+# Base cost in USD of every available flight, by (departure airport, arrival airport)
+FLIGHT_BASE_COSTS: Dict[Tuple[str, str], int] = FrozenDict(
+    {
+        ("SFO", "LAX"): 200,
+        ("SFO", "JFK"): 500,
+        ("SFO", "ORD"): 400,
+        ("SFO", "BOS"): 450,
+        ("SFO", "RMS"): 300,
+        ("SFO", "SBK"): 350,
+        ("SFO", "MPC"): 370,
+        ("SFO", "SVP"): 320,
+        ("SFO", "SHD"): 330,
+        ("SFO", "SSV"): 340,
+        ("SFO", "OKD"): 360,
+        ("SFO", "WLB"): 310,
+        ("SFO", "CRH"): 380,
+        ("SFO", "ATV"): 390,
+        ("SFO", "PHV"): 420,
+        ("SFO", "GFD"): 430,
+        ("SFO", "CIA"): 700,
+        ("LAX", "SFO"): 100,
+        ("LAX", "JFK"): 600,
+        ("LAX", "ORD"): 500,
+        ("LAX", "BOS"): 550,
+        ("LAX", "RMS"): 310,
+        ("LAX", "SBK"): 320,
+        ("LAX", "MPC"): 330,
+        ("LAX", "SVP"): 340,
+        ("LAX", "SHD"): 350,
+        ("LAX", "SSV"): 360,
+        ("LAX", "OKD"): 370,
+        ("LAX", "WLB"): 380,
+        ("LAX", "CRH"): 390,
+        ("LAX", "ATV"): 400,
+        ("LAX", "PHV"): 410,
+        ("LAX", "GFD"): 420,
+        ("JFK", "ORD"): 300,
+        ("JFK", "BOS"): 250,
+        ("JFK", "RMS"): 450,
+        ("JFK", "SBK"): 460,
+        ("JFK", "MPC"): 470,
+        ("JFK", "SVP"): 480,
+        ("JFK", "SHD"): 490,
+        ("JFK", "SSV"): 500,
+        ("JFK", "OKD"): 510,
+        ("JFK", "WLB"): 520,
+        ("JFK", "CRH"): 530,
+        ("JFK", "ATV"): 540,
+        ("JFK", "PHV"): 550,
+        ("JFK", "GFD"): 560,
+        ("JFK", "LAX"): 570,
+        ("JFK", "HND"): 800,
+        ("JFK", "PVG"): 950,
+        ("JFK", "PEK"): 1000,
+        ("ORD", "LAX"): 180,
+        ("ORD", "BOS"): 200,
+        ("ORD", "RMS"): 350,
+        ("ORD", "SBK"): 360,
+        ("ORD", "MPC"): 370,
+        ("ORD", "SVP"): 380,
+        ("ORD", "SHD"): 390,
+        ("ORD", "SSV"): 400,
+        ("ORD", "OKD"): 410,
+        ("ORD", "WLB"): 420,
+        ("ORD", "CRH"): 430,
+        ("ORD", "ATV"): 440,
+        ("ORD", "PHV"): 450,
+        ("ORD", "GFD"): 460,
+        ("BOS", "RMS"): 400,
+        ("BOS", "SBK"): 410,
+        ("BOS", "MPC"): 420,
+        ("BOS", "SVP"): 430,
+        ("BOS", "SHD"): 440,
+        ("BOS", "SSV"): 450,
+        ("BOS", "OKD"): 460,
+        ("BOS", "WLB"): 470,
+        ("BOS", "CRH"): 480,
+        ("BOS", "ATV"): 490,
+        ("BOS", "PHV"): 500,
+        ("BOS", "GFD"): 510,
+        ("RMS", "BOS"): 200,
+        ("RMS", "JFK"): 210,
+        ("RMS", "SBK"): 220,
+        ("RMS", "MPC"): 230,
+        ("RMS", "SVP"): 240,
+        ("RMS", "SHD"): 250,
+        ("RMS", "SSV"): 260,
+        ("RMS", "OKD"): 270,
+        ("RMS", "WLB"): 280,
+        ("RMS", "CRH"): 290,
+        ("RMS", "ATV"): 300,
+        ("RMS", "PHV"): 310,
+        ("RMS", "GFD"): 320,
+        ("RMS", "LAX"): 330,
+        ("SBK", "MPC"): 200,
+        ("SBK", "SVP"): 210,
+        ("SBK", "SHD"): 220,
+        ("SBK", "SSV"): 230,
+        ("SBK", "OKD"): 240,
+        ("SBK", "WLB"): 250,
+        ("SBK", "CRH"): 260,
+        ("SBK", "ATV"): 270,
+        ("SBK", "PHV"): 280,
+        ("SBK", "GFD"): 290,
+        ("MPC", "SVP"): 210,
+        ("MPC", "SHD"): 220,
+        ("MPC", "SSV"): 230,
+        ("MPC", "OKD"): 240,
+        ("MPC", "WLB"): 250,
+        ("MPC", "CRH"): 260,
+        ("MPC", "ATV"): 270,
+        ("MPC", "PHV"): 280,
+        ("MPC", "GFD"): 290,
+        ("SVP", "SHD"): 230,
+        ("SVP", "SSV"): 240,
+        ("SVP", "OKD"): 250,
+        ("SVP", "WLB"): 260,
+        ("SVP", "CRH"): 270,
+        ("SVP", "ATV"): 280,
+        ("SVP", "PHV"): 290,
+        ("SVP", "GFD"): 300,
+        ("SHD", "SSV"): 220,
+        ("SHD", "OKD"): 230,
+        ("SHD", "WLB"): 240,
+        ("SHD", "CRH"): 250,
+        ("SHD", "ATV"): 260,
+        ("SHD", "PHV"): 270,
+        ("SHD", "GFD"): 280,
+        ("SSV", "OKD"): 240,
+        ("SSV", "WLB"): 250,
+        ("SSV", "CRH"): 260,
+        ("SSV", "ATV"): 270,
+        ("SSV", "PHV"): 280,
+        ("SSV", "GFD"): 290,
+        ("OKD", "WLB"): 230,
+        ("OKD", "CRH"): 240,
+        ("OKD", "ATV"): 250,
+        ("OKD", "PHV"): 260,
+        ("OKD", "GFD"): 270,
+        ("WLB", "CRH"): 250,
+        ("WLB", "ATV"): 260,
+        ("WLB", "PHV"): 270,
+        ("WLB", "GFD"): 280,
+        ("CRH", "ATV"): 240,
+        ("CRH", "PHV"): 250,
+        ("CRH", "GFD"): 260,
+        ("CRH", "SFO"): 270,
+        ("CRH", "RMS"): 280,
+        ("ATV", "PHV"): 230,
+        ("ATV", "GFD"): 240,
+        ("PHV", "GFD"): 220,
+        ("LHR", "CDG"): 100,
+        ("OKD", "LAX"): 220,
+    }
+)
+
+# Every supported airport, in the order `list_all_airports` lists them
+AIRPORTS = (
+    "RMS",
+    "SBK",
+    "MPC",
+    "SVP",
+    "SHD",
+    "CDG",
+    "LHR",
+    "SSV",
+    "OKD",
+    "WLB",
+    "PEK",
+    "HND",
+    "HKG",
+    "CIA",
+    "CRH",
+    "ATV",
+    "PHV",
+    "GFD",
+    "SFO",
+    "LAX",
+    "JFK",
+    "ORD",
+    "BOS",
+)
+
+# The nearest airport of every supported location
+CITY_AIRPORTS: Dict[str, str] = FrozenDict(
+    {
+        "Rivermist": "RMS",
+        "Stonebrook": "SBK",
+        "Maplecrest": "MPC",
+        "Silverpine": "SVP",
+        "Shadowridge": "SHD",
+        "London": "LHR",
+        "Paris": "CDG",
+        "Sunset Valley": "SSV",
+        "Oakendale": "OKD",
+        "Willowbend": "WLB",
+        "Crescent Hollow": "CRH",
+        "Autumnville": "ATV",
+        "Pinehaven": "PHV",
+        "Greenfield": "GFD",
+        "San Francisco": "SFO",
+        "Los Angeles": "LAX",
+        "New York": "JFK",
+        "Chicago": "ORD",
+        "Boston": "BOS",
+        "Beijing": "PEK",
+        "Hong Kong": "HKG",
+        "Rome": "CIA",
+        "Tokyo": "HND",
+    }
+)
+
+# Exchange rates, by (base currency, target currency). The inverse rates are derived from them
+EXCHANGE_RATES: Dict[Tuple[str, str], float] = FrozenDict(
+    {
+        ("USD", "RMB"): 7,
+        ("USD", "EUR"): 0.8,
+        ("USD", "JPY"): 110,
+        ("USD", "GBP"): 0.7,
+        ("USD", "CAD"): 1.3,
+        ("USD", "AUD"): 1.4,
+        ("USD", "INR"): 70,
+        ("USD", "RUB"): 60,
+        ("USD", "BRL"): 3.8,
+        ("USD", "MXN"): 20,
+    }
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_flight_descriptions(multiplier: int) -> Tuple[str, ...]:
+    """
+    Return the start of the long context description of every flight, for a multiplier of the base costs (there are
+    only a few, given by the travel class and date).
+    """
+    return tuple(
+        f"From: {travel_from} To: {travel_to} Cost: {float(base_cost * multiplier)} USD. "
+        "This is a domestica flight with a travel class of "
+        for (travel_from, travel_to), base_cost in FLIGHT_BASE_COSTS.items()
+    )
+
 
 class TravelAPI:
     def __init__(self):
@@ -93,7 +335,7 @@ class TravelAPI:
         Merge the credit card list with predefined credit cards from long_context.py.
         Existing cards in the scenario won't be overwritten.
         """
-        for card_id, card_info in CREDIT_CARD_EXTENSION.items():
+        for card_id, card_info in long_context_data.CREDIT_CARD_EXTENSION.items():
             if card_id not in self.credit_card_list:
                 self.credit_card_list[card_id] = card_info
 
@@ -102,10 +344,23 @@ class TravelAPI:
         Merge the booking record list with predefined booking records from long_context.py.
         Existing bookings in the scenario won't be overwritten.
         """
-        for booking_id, booking_info in BOOKING_RECORD_EXTENSION.items():
+        for booking_id, booking_info in long_context_data.BOOKING_RECORD_EXTENSION.items():
             if booking_id not in self.booking_record:
                 self.booking_record[booking_id] = booking_info
 
+    def _get_writable_credit_card(self, card_id: str) -> Dict[str, Union[str, int, float]]:
+        """
+        Return the record of a credit card, which can be modified. The records added for long context are shared
+        with every other instance, so the instance takes its own copy of one the first time it is modified.
+
+        Args:
+            card_id (str): The ID of the credit card
+        """
+        card_info = self.credit_card_list[card_id]
+        if isinstance(card_info, FrozenDict):
+            card_info = self.credit_card_list[card_id] = dict(card_info)
+        return card_info
+
     def authenticate_travel(
         self,
         client_id: str,
@@ -218,7 +473,7 @@ class TravelAPI:
             card_id (str): The ID of the credit card
             balance (float): The balance of the credit card
         """
-        self.credit_card_list[card_id]["balance"] = balance
+        self._get_writable_credit_card(card_id)["balance"] = balance
 
     def get_flight_cost(
         self, travel_from: str, travel_to: str, travel_date: str, travel_class: str
@@ -234,171 +489,11 @@ class TravelAPI:
         Returns:
             travel_cost_list (List[float]): The list of cost of the travel
         """
-        base_costs: Dict[Tuple[str, str], int] = {
-            ("SFO", "LAX"): 200,
-            ("SFO", "JFK"): 500,
-            ("SFO", "ORD"): 400,
-            ("SFO", "BOS"): 450,
-            ("SFO", "RMS"): 300,
-            ("SFO", "SBK"): 350,
-            ("SFO", "MPC"): 370,
-            ("SFO", "SVP"): 320,
-            ("SFO", "SHD"): 330,
-            ("SFO", "SSV"): 340,
-            ("SFO", "OKD"): 360,
-            ("SFO", "WLB"): 310,
-            ("SFO", "CRH"): 380,
-            ("SFO", "ATV"): 390,
-            ("SFO", "PHV"): 420,
-            ("SFO", "GFD"): 430,
-            ("SFO", "CIA"): 700,
-            ("LAX", "SFO"): 100,
-            ("LAX", "JFK"): 600,
-            ("LAX", "ORD"): 500,
-            ("LAX", "BOS"): 550,
-            ("LAX", "RMS"): 310,
-            ("LAX", "SBK"): 320,
-            ("LAX", "MPC"): 330,
-            ("LAX", "SVP"): 340,
-            ("LAX", "SHD"): 350,
-            ("LAX", "SSV"): 360,
-            ("LAX", "OKD"): 370,
-            ("LAX", "WLB"): 380,
-            ("LAX", "CRH"): 390,
-            ("LAX", "ATV"): 400,
-            ("LAX", "PHV"): 410,
-            ("LAX", "GFD"): 420,
-            ("JFK", "ORD"): 300,
-            ("JFK", "BOS"): 250,
-            ("JFK", "RMS"): 450,
-            ("JFK", "SBK"): 460,
-            ("JFK", "MPC"): 470,
-            ("JFK", "SVP"): 480,
-            ("JFK", "SHD"): 490,
-            ("JFK", "SSV"): 500,
-            ("JFK", "OKD"): 510,
-            ("JFK", "WLB"): 520,
-            ("JFK", "CRH"): 530,
-            ("JFK", "ATV"): 540,
-            ("JFK", "PHV"): 550,
-            ("JFK", "GFD"): 560,
-            ("JFK", "LAX"): 570,
-            ("JFK", "HND"): 800,
-            ("JFK", "PVG"): 950,
-            ("JFK", "PEK"): 1000,
-            ("ORD", "LAX"): 180,
-            ("ORD", "BOS"): 200,
-            ("ORD", "RMS"): 350,
-            ("ORD", "SBK"): 360,
-            ("ORD", "MPC"): 370,
-            ("ORD", "SVP"): 380,
-            ("ORD", "SHD"): 390,
-            ("ORD", "SSV"): 400,
-            ("ORD", "OKD"): 410,
-            ("ORD", "WLB"): 420,
-            ("ORD", "CRH"): 430,
-            ("ORD", "ATV"): 440,
-            ("ORD", "PHV"): 450,
-            ("ORD", "GFD"): 460,
-            ("BOS", "RMS"): 400,
-            ("BOS", "SBK"): 410,
-            ("BOS", "MPC"): 420,
-            ("BOS", "SVP"): 430,
-            ("BOS", "SHD"): 440,
-            ("BOS", "SSV"): 450,
-            ("BOS", "OKD"): 460,
-            ("BOS", "WLB"): 470,
-            ("BOS", "CRH"): 480,
-            ("BOS", "ATV"): 490,
-            ("BOS", "PHV"): 500,
-            ("BOS", "GFD"): 510,
-            ("RMS", "BOS"): 200,
-            ("RMS", "JFK"): 210,
-            ("RMS", "SBK"): 220,
-            ("RMS", "MPC"): 230,
-            ("RMS", "SVP"): 240,
-            ("RMS", "SHD"): 250,
-            ("RMS", "SSV"): 260,
-            ("RMS", "OKD"): 270,
-            ("RMS", "WLB"): 280,
-            ("RMS", "CRH"): 290,
-            ("RMS", "ATV"): 300,
-            ("RMS", "PHV"): 310,
-            ("RMS", "GFD"): 320,
-            ("RMS", "LAX"): 330,
-            ("SBK", "MPC"): 200,
-            ("SBK", "SVP"): 210,
-            ("SBK", "SHD"): 220,
-            ("SBK", "SSV"): 230,
-            ("SBK", "OKD"): 240,
-            ("SBK", "WLB"): 250,
-            ("SBK", "CRH"): 260,
-            ("SBK", "ATV"): 270,
-            ("SBK", "PHV"): 280,
-            ("SBK", "GFD"): 290,
-            ("MPC", "SVP"): 210,
-            ("MPC", "SHD"): 220,
-            ("MPC", "SSV"): 230,
-            ("MPC", "OKD"): 240,
-            ("MPC", "WLB"): 250,
-            ("MPC", "CRH"): 260,
-            ("MPC", "ATV"): 270,
-            ("MPC", "PHV"): 280,
-            ("MPC", "GFD"): 290,
-            ("SVP", "SHD"): 230,
-            ("SVP", "SSV"): 240,
-            ("SVP", "OKD"): 250,
-            ("SVP", "WLB"): 260,
-            ("SVP", "CRH"): 270,
-            ("SVP", "ATV"): 280,
-            ("SVP", "PHV"): 290,
-            ("SVP", "GFD"): 300,
-            ("SHD", "SSV"): 220,
-            ("SHD", "OKD"): 230,
-            ("SHD", "WLB"): 240,
-            ("SHD", "CRH"): 250,
-            ("SHD", "ATV"): 260,
-            ("SHD", "PHV"): 270,
-            ("SHD", "GFD"): 280,
-            ("SSV", "OKD"): 240,
-            ("SSV", "WLB"): 250,
-            ("SSV", "CRH"): 260,
-            ("SSV", "ATV"): 270,
-            ("SSV", "PHV"): 280,
-            ("SSV", "GFD"): 290,
-            ("OKD", "WLB"): 230,
-            ("OKD", "CRH"): 240,
-            ("OKD", "ATV"): 250,
-            ("OKD", "PHV"): 260,
-            ("OKD", "GFD"): 270,
-            ("WLB", "CRH"): 250,
-            ("WLB", "ATV"): 260,
-            ("WLB", "PHV"): 270,
-            ("WLB", "GFD"): 280,
-            ("CRH", "ATV"): 240,
-            ("CRH", "PHV"): 250,
-            ("CRH", "GFD"): 260,
-            ("CRH", "SFO"): 270,
-            ("CRH", "RMS"): 280,
-            ("ATV", "PHV"): 230,
-            ("ATV", "GFD"): 240,
-            ("PHV", "GFD"): 220,
-            ("LHR", "CDG"): 100,
-            ("OKD", "LAX"): 220
-        }
-
-        # Get all supported airports
-        supported_airports = [
-            "RMS", "SBK", "MPC", "SVP", "SHD", "CDG", "LHR", "SSV", "OKD", "WLB",
-            "PEK", "HND", "HKG", "CIA", "CRH", "ATV", "PHV", "GFD", "SFO", "LAX",
-            "JFK", "ORD", "BOS"
-        ]
-        
         # Check if airport codes are valid
         invalid_airports = []
-        if travel_from not in supported_airports:
+        if travel_from not in AIRPORTS:
             invalid_airports.append(f"departure airport '{travel_from}'")
-        if travel_to not in supported_airports:
+        if travel_to not in AIRPORTS:
             invalid_airports.append(f"destination airport '{travel_to}'")
         
         if invalid_airports:
@@ -410,10 +505,10 @@ class TravelAPI:
         travel_pair = (travel_from, travel_to)
 
         # Get the base cost, raise an error if the route is not available
-        if travel_pair not in base_costs:
+        if travel_pair not in FLIGHT_BASE_COSTS:
             raise ValueError(f"No available route from '{travel_from}' to '{travel_to}'.")
 
-        base_cost = base_costs[travel_pair]
+        base_cost = FLIGHT_BASE_COSTS[travel_pair]
 
         # Determine the multiplier based on the travel class
         if travel_class == "economy":
@@ -432,23 +527,11 @@ class TravelAPI:
         # Calculate the total cost
         travel_cost = float(base_cost * factor * travel_date_multiplier)
 
-        travel_cost_list = []
         if self.long_context:
-            for k, v in base_costs.items():
-                travel_cost = float(v * factor * travel_date_multiplier)
-                travel_cost_list.append(
-                    "From: "
-                    + k[0]
-                    + " To: "
-                    + k[1]
-                    + " Cost: "
-                    + str(travel_cost)
-                    + " USD. This is a domestica flight with a travel class of "
-                    + travel_class
-                    + " and a travel date of "
-                    + travel_date
-                    + "."
-                )
+            travel_cost_list = [
+                flight_description + travel_class + " and a travel date of " + travel_date + "."
+                for flight_description in _get_flight_descriptions(factor * travel_date_multiplier)
+            ]
             return {"travel_cost_list": travel_cost_list}
         return {"travel_cost_list": [travel_cost]}
 
@@ -529,7 +612,7 @@ class TravelAPI:
                 "error": "Balance is less than budget limit",
             }
         travel_cost = float(travel_cost)
-        self.credit_card_list[card_id]["balance"] -= travel_cost
+        self._get_writable_credit_card(card_id)["balance"] -= travel_cost
         booking_id = str(self._random.randint(1000000, 9999999))  # 7 digits
         transaction_id = str(self._random.randint(10000000, 99999999))  # 8 digits
         self.booking_record[booking_id] = {
@@ -603,31 +686,7 @@ class TravelAPI:
         Returns:
             airports (List[str]): A list of all available airports
         """
-        return [
-            "RMS",
-            "SBK",
-            "MPC",
-            "SVP",
-            "SHD",
-            "CDG",
-            "LHR",
-            "SSV",
-            "OKD",
-            "WLB",
-            "PEK",
-            "HND",
-            "HKG",
-            "CIA",
-            "CRH",
-            "ATV",
-            "PHV",
-            "GFD",
-            "SFO",
-            "LAX",
-            "JFK",
-            "ORD",
-            "BOS",
-        ]
+        return list(AIRPORTS)
 
     def cancel_booking(
         self, access_token: str, booking_id: str
@@ -650,7 +709,7 @@ class TravelAPI:
             return {"cancel_status": False, "error": "Booking not found"}
         card_id = self.booking_record[booking_id]["card_id"]
         travel_cost = self.booking_record[booking_id]["travel_cost"]
-        self.credit_card_list[card_id]["balance"] += travel_cost
+        self._get_writable_credit_card(card_id)["balance"] += travel_cost
         del self.booking_record[booking_id]
         return {"cancel_status": True}
 
@@ -668,23 +727,16 @@ class TravelAPI:
             exchanged_value (float): The value after the exchange
 
         """
-        exchange_rates = {
-            ("USD", "RMB"): 7,
-            ("USD", "EUR"): 0.8,
-            ("USD", "JPY"): 110,
-            ("USD", "GBP"): 0.7,
-            ("USD", "CAD"): 1.3,
-            ("USD", "AUD"): 1.4,
-            ("USD", "INR"): 70,
-            ("USD", "RUB"): 60,
-            ("USD", "BRL"): 3.8,
-            ("USD", "MXN"): 20
-        }
-        for key, val in exchange_rates.items():
-            if base_currency == key[0] and target_currency == key[1]:
-                return {"exchanged_value": value * val}
-            elif base_currency == key[1] and target_currency == key[0]:
-                return {"exchanged_value": round(value / val, 2)}
+        try:
+            rate = EXCHANGE_RATES.get((base_currency, target_currency))
+            inverse_rate = EXCHANGE_RATES.get((target_currency, base_currency))
+        except TypeError:
+            # Unhashable currencies are not supported either
+            rate = inverse_rate = None
+        if rate is not None:
+            return {"exchanged_value": value * rate}
+        if inverse_rate is not None:
+            return {"exchanged_value": round(value / inverse_rate, 2)}
         raise ValueError(f"No available exchange rate for '{base_currency}' to '{target_currency}'. Supported currencies are: USD, RMB, EUR, JPY, GBP, CAD, AUD, INR, RUB, BRL, MXN. Please check if the currency codes are correct.")
 
     def verify_traveler_information(
@@ -771,33 +823,7 @@ class TravelAPI:
         Returns:
             nearest_airport (str): The nearest airport to the given location
         """
-        airport_map = {
-            "Rivermist": "RMS",
-            "Stonebrook": "SBK",
-            "Maplecrest": "MPC",
-            "Silverpine": "SVP",
-            "Shadowridge": "SHD",
-            "London": "LHR",
-            "Paris": "CDG",
-            "Sunset Valley": "SSV",
-            "Oakendale": "OKD",
-            "Willowbend": "WLB",
-            "Crescent Hollow": "CRH",
-            "Autumnville": "ATV",
-            "Pinehaven": "PHV",
-            "Greenfield": "GFD",
-            "San Francisco": "SFO",
-            "Los Angeles": "LAX",
-            "New York": "JFK",
-            "Chicago": "ORD",
-            "Boston": "BOS",
-            "Beijing": "PEK",
-            "Hong Kong": "HKG",
-            "Rome": "CIA",
-            "Tokyo": "HND",
-        }
-
-        return {"nearest_airport": airport_map.get(location, "Unknown")}
+        return {"nearest_airport": CITY_AIRPORTS.get(location, "Unknown")}
 
     def purchase_insurance(
         self,
@@ -831,7 +857,7 @@ class TravelAPI:
             return {"insurance_status": False, "error": "Booking not found"}
         if card_id not in self.credit_card_list:
             return {"insurance_status": False, "error": "Credit card not registered"}
-        self.credit_card_list[card_id]["balance"] -= insurance_cost
+        self._get_writable_credit_card(card_id)["balance"] -= insurance_cost
         return {
             "insurance_id": str(self._random.randint(100000000, 999999999)),  # 9 digits
             "insurance_status": True,
@@ -1,13 +1,9 @@
 import random
 from copy import deepcopy
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
 
-from bfcl_eval.eval_checker.multi_turn_eval.func_source_code.long_context import (
-    CAR_STATUS_METADATA_EXTENSION,
-    INTERMEDIARY_CITIES,
-    LONG_WEATHER_EXTENSION,
-    PARKING_BRAKE_INSTRUCTION,
-)
+from bfcl_env.frozen import FrozenDict
+from bfcl_env.func_source_code import long_context as long_context_data
 
 MAX_FUEL_LEVEL = 50
 MIN_FUEL_LEVEL = 0.0
@@ -46,9 +42,51 @@ DEFAULT_STATE = {
     "rearRightTirePressure": 30.0,
 }
 
+# Distance in km between the supported cities, by pair of zipcodes in either order
+ZIPCODE_DISTANCES: Dict[Tuple[str, str], float] = FrozenDict(
+    {
+        pair: distance
+        for zipcode_a, zipcode_b, distance in (
+            ("83214", "74532", 750.0),
+            ("56108", "62947", 320.0),
+            ("71354", "83462", 450.0),
+            ("47329", "52013", 290.0),
+            ("69238", "51479", 630.0),
+            ("94016", "83214", 980.0),
+            ("94016", "94704", 600.0),
+            ("94704", "08540", 2550.0),
+            ("94016", "08540", 1950.0),
+            ("62947", "47329", 1053.0),
+            ("94016", "62947", 780.0),
+            ("74532", "94016", 880.0),
+        )
+        for pair in ((zipcode_a, zipcode_b), (zipcode_b, zipcode_a))
+    }
+)
+
+# The zipcode of every supported city
+CITY_ZIPCODES: Dict[str, str] = FrozenDict(
+    {
+        "Rivermist": "83214",
+        "Stonebrook": "74532",
+        "Maplecrest": "56108",
+        "Silverpine": "62947",
+        "Shadowridge": "71354",
+        "Sunset Valley": "83462",
+        "Oakendale": "47329",
+        "Willowbend": "52013",
+        "Crescent Hollow": "69238",
+        "Autumnville": "51479",
+        "San Francisco": "94016",
+    }
+)
+
 
 class VehicleControlAPI:
 
+    # The brake pedal force does not refer into any other attribute, see `bfcl_env.state_tracking`
+    _state_aliases = {"_brakePedalForce": ()}
+
     def __init__(self):
         """
         Initializes the vehicle control API with default values.
@@ -299,8 +337,10 @@ class VehicleControlAPI:
             outsideTemperature (float): The outside temperature in degree Celsius.
         """
         if self.long_context:
-            LONG_WEATHER_EXTENSION["outsideTemperature"] = self._random.uniform(-10.0, 40.0)
-            return LONG_WEATHER_EXTENSION
+            # The extension is shared with every other instance, it is not modified
+            weather = dict(long_context_data.LONG_WEATHER_EXTENSION)
+            weather["outsideTemperature"] = self._random.uniform(-10.0, 40.0)
+            return weather
         return {"outsideTemperature": self._random.uniform(-10.0, 40.0)}
 
     def get_outside_temperature_from_weather_com(self) -> Dict[str, float]:
@@ -357,7 +397,7 @@ class VehicleControlAPI:
         """
         status = {}
         if self.long_context:
-            status["metadata"] = CAR_STATUS_METADATA_EXTENSION
+            status["metadata"] = long_context_data.CAR_STATUS_METADATA_EXTENSION
         if option == "fuel":
             status["fuelLevel"] = self.fuelLevel
         elif option == "battery":
@@ -402,7 +442,7 @@ class VehicleControlAPI:
             self._slopeAngle = 10.0
             if self.long_context:
                 return {
-                    "parkingBrakeInstruction": PARKING_BRAKE_INSTRUCTION,
+                    "parkingBrakeInstruction": long_context_data.PARKING_BRAKE_INSTRUCTION,
                     "parkingBrakeStatus": "engaged",
                     "_parkingBrakeForce": 500.0,
                     "_slopeAngle": 10.0,
@@ -414,7 +454,7 @@ class VehicleControlAPI:
             self._slopeAngle = 10.0
             if self.long_context:
                 return {
-                    "parkingBrakeInstruction": PARKING_BRAKE_INSTRUCTION,
+                    "parkingBrakeInstruction": long_context_data.PARKING_BRAKE_INSTRUCTION,
                     "parkingBrakeStatus": "released",
                     "_parkingBrakeForce": 0.0,
                     "_slopeAngle": 10.0,
@@ -560,59 +600,18 @@ class VehicleControlAPI:
             distance (float): The distance between the two cities in km.
             intermediaryCities (List[str]): [Optional] The list of intermediary cities between the two cities.
         """
-        if (cityA == "83214" and cityB == "74532") or (
-            cityA == "74532" and cityB == "83214"
-        ):
-            distance = {"distance": 750.0}
-        elif (cityA == "56108" and cityB == "62947") or (
-            cityA == "62947" and cityB == "56108"
-        ):
-            distance = {"distance": 320.0}
-        elif (cityA == "71354" and cityB == "83462") or (
-            cityA == "83462" and cityB == "71354"
-        ):
-            distance = {"distance": 450.0}
-        elif (cityA == "47329" and cityB == "52013") or (
-            cityA == "52013" and cityB == "47329"
-        ):
-            distance = {"distance": 290.0}
-        elif (cityA == "69238" and cityB == "51479") or (
-            cityA == "51479" and cityB == "69238"
-        ):
-            distance = {"distance": 630.0}
-        elif (cityA == "94016" and cityB == "83214") or (
-            cityA == "83214" and cityB == "94016"
-        ):
-            distance = {"distance": 980.0}
-        elif (cityA == "94016" and cityB == "94704") or (
-            cityA == "94704" and cityB == "94016"
-        ):
-            distance = {"distance": 600.0}
-        elif (cityA == "94704" and cityB == "08540") or (
-            cityA == "08540" and cityB == "94704"
-        ):
-            distance = {"distance": 2550.0}
-        elif (cityA == "94016" and cityB == "08540") or (
-            cityA == "08540" and cityB == "94016"
-        ):
-            distance = {"distance": 1950.0}
-        elif (cityA == "62947" and cityB == "47329") or (
-            cityA == "47329" and cityB == "62947"
-        ):
-            distance = {"distance": 1053.0}
-        elif (cityA == "94016" and cityB == "62947") or (
-            cityA == "62947" and cityB == "94016"
-        ):
-            distance = {"distance": 780.0}
-        elif (cityA == "74532" and cityB == "94016") or (
-            cityA == "94016" and cityB == "74532"
-        ):
-            distance = {"distance": 880.0}
+        try:
+            distance_km = ZIPCODE_DISTANCES.get((cityA, cityB))
+        except TypeError:
+            # Unhashable zipcodes are not supported either
+            distance_km = None
+        if distance_km is not None:
+            distance = {"distance": distance_km}
         else:
             distance = {"error": "distance not found in database."}
 
         if self.long_context:
-            distance["intermediaryCities"] = INTERMEDIARY_CITIES
+            distance["intermediaryCities"] = long_context_data.INTERMEDIARY_CITIES
         return distance
 
     def get_zipcode_based_on_city(self, city: str) -> Dict[str, str]:
@@ -623,30 +622,12 @@ class VehicleControlAPI:
         Returns:
             zipcode (str): The zipcode of the city.
         """
-        if city == "Rivermist":
-            return {"zipcode": "83214"}
-        elif city == "Stonebrook":
-            return {"zipcode": "74532"}
-        elif city == "Maplecrest":
-            return {"zipcode": "56108"}
-        elif city == "Silverpine":
-            return {"zipcode": "62947"}
-        elif city == "Shadowridge":
-            return {"zipcode": "71354"}
-        elif city == "Sunset Valley":
-            return {"zipcode": "83462"}
-        elif city == "Oakendale":
-            return {"zipcode": "47329"}
-        elif city == "Willowbend":
-            return {"zipcode": "52013"}
-        elif city == "Crescent Hollow":
-            return {"zipcode": "69238"}
-        elif city == "Autumnville":
-            return {"zipcode": "51479"}
-        elif city == "San Francisco":
-            return {"zipcode": "94016"}
-        else:
-            return {"zipcode": "00000"}
+        try:
+            zipcode = CITY_ZIPCODES.get(city, "00000")
+        except TypeError:
+            # Unhashable city names are not supported either
+            zipcode = "00000"
+        return {"zipcode": zipcode}
 
     def set_navigation(self, destination: str) -> Dict[str, str]:
         """
@@ -691,7 +672,7 @@ class VehicleControlAPI:
         }
 
         if self.long_context:
-            tire_status["car_info"] = CAR_STATUS_METADATA_EXTENSION
+            tire_status["car_info"] = long_context_data.CAR_STATUS_METADATA_EXTENSION
         return tire_status
 
     def find_nearest_tire_shop(self) -> Dict[str, str]:
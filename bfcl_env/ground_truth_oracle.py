@@ -0,0 +1,358 @@
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+from bfcl_env.multi_turn_utils import execute_multi_turn_func_call
+from bfcl_env.state_fork import fork_instance
+from bfcl_env.state_tracking import state_fingerprint
+
+
+class GroundTruthTurn(NamedTuple):
+    """
+    The outcome of replaying the ground truth of one turn.
+
+    Attributes:
+        execution_results (List[str]): The execution results of the ground truth calls of the turn.
+        state_fingerprints (Dict[str, Optional[int]]): The fingerprint of each instance after the turn, by class name,
+            see `bfcl_env.state_tracking.state_fingerprint`. None for instances without a stable fingerprint. Only
+            computed for the outcomes stored in a file.
+        instances (Dict[str, Any], optional): A snapshot of the instances after the turn, by class name. They are
+            shared by every caller and must never be mutated. None for the outcomes loaded from a file.
+    """
+
+    execution_results: List[str]
+    state_fingerprints: Dict[str, Optional[int]]
+    instances: Optional[Dict[str, Any]] = None
+
+
+class GroundTruthOracle:
+    """
+    Process-wide store of ground truth replay outcomes.
+
+    Ground truth calls are deterministic given the initial configuration of an entry, since every API class seeds its
+    own random generator. The outcome of a turn is therefore the same for every rollout of the entry and every epoch,
+    and is only computed once. It is keyed by `(test_entry_id, replayed_turns, is_augmented, long_context)`, where
+    `replayed_turns` are the indices of the turns whose ground truth was replayed so far, the current turn last. Turns
+    are part of the key because a caller may skip the replay of a turn (e.g. when the model did not answer it), which
+    changes the state of the following ones.
+
+    Outcomes are kept in memory, in least-recently-used order, with a snapshot of the ground truth instances to compare
+    against. They can also be appended to a JSON Lines file, which is loaded back when the oracle is configured with
+    the same path (e.g. in the next run). Instances cannot be stored in the file, so the outcomes loaded from it carry
+    state fingerprints instead. Like the scenario cache, a test entry id must always come with the same initial
+    configuration and ground truth.
+
+    Counters:
+        num_hits (int): Number of outcomes found in the oracle.
+        num_misses (int): Number of outcomes that had to be computed.
+        num_loaded (int): Number of outcomes loaded from the file.
+    """
+
+    def __init__(
+        self, max_records: Optional[int] = 8192, path: Optional[str] = None, enabled: bool = True
+    ) -> None:
+        """
+        Args:
+            max_records (int, optional): Maximum number of outcomes kept in memory. Defaults to 8192, None for no limit.
+            path (str, optional): JSON Lines file the outcomes are loaded from and appended to. Defaults to memory only.
+            enabled (bool): Whether the oracle is used. When disabled, the ground truth is replayed at every turn.
+        """
+        self.max_records: Optional[int] = max_records
+        self.path: Optional[str] = None
+        self.enabled: bool = enabled
+        self._records: "OrderedDict[Hashable, GroundTruthTurn]" = OrderedDict()
+        self.num_hits: int = 0
+        self.num_misses: int = 0
+        self.num_loaded: int = 0
+        self._lock = threading.Lock()
+        self._set_path(path)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def get(self, key: Tuple[str, Tuple[int, ...], bool, bool]) -> Optional[GroundTruthTurn]:
+        """
+        Args:
+            key (tuple): The key of the outcome, see the class docstring.
+
+        Returns:
+            turn (GroundTruthTurn, optional): The outcome of the turn, or None if it was not computed yet.
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            turn = self._records.get(key)
+            if turn is None:
+                self.num_misses += 1
+            else:
+                self.num_hits += 1
+                self._records.move_to_end(key)
+            return turn
+
+    def put(
+        self,
+        key: Tuple[str, Tuple[int, ...], bool, bool],
+        execution_results: List[str],
+        instances: Dict[str, Any],
+    ) -> GroundTruthTurn:
+        """
+        Store the outcome of a turn that was just replayed.
+
+        Args:
+            key (tuple): The key of the outcome, see the class docstring.
+            execution_results (List[str]): The execution results of the ground truth calls of the turn.
+            instances (Dict[str, Any]): The ground truth instances after the turn, by class name.
+
+        Returns:
+            turn (GroundTruthTurn): The stored outcome.
+        """
+        if not self.enabled:
+            return GroundTruthTurn(execution_results=list(execution_results), state_fingerprints={})
+        turn = GroundTruthTurn(
+            execution_results=list(execution_results),
+            state_fingerprints=(
+                {class_name: state_fingerprint(instance) for class_name, instance in instances.items()}
+                if self.path is not None
+                else {}
+            ),
+            # The caller keeps replaying on its own instances, so the oracle keeps a snapshot
+            instances={class_name: fork_instance(instance) for class_name, instance in instances.items()},
+        )
+        with self._lock:
+            self._records[key] = turn
+            self._records.move_to_end(key)
+            self._evict_if_needed()
+            if self.path is not None:
+                self._append_to_file(key, turn)
+        return turn
+
+    def clear(self) -> None:
+        """Drop every outcome kept in memory. The file and the counters are kept."""
+        with self._lock:
+            self._records.clear()
+
+    def configure(
+        self, max_records: Optional[int] = 8192, path: Optional[str] = None, enabled: bool = True
+    ) -> None:
+        """
+        Update the settings of the oracle. Outcomes stored in a new path are loaded.
+
+        Args:
+            max_records (int, optional): Maximum number of outcomes kept in memory. Defaults to 8192, None for no limit.
+            path (str, optional): JSON Lines file the outcomes are loaded from and appended to. Defaults to memory only.
+            enabled (bool): Whether the oracle is used.
+        """
+        self.max_records = max_records
+        self.enabled = enabled
+        if not enabled:
+            self.clear()
+        with self._lock:
+            self._evict_if_needed()
+        if path != self.path:
+            self._set_path(path)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns:
+            stats (Dict[str, Any]): The counters of the oracle, the number of outcomes in memory and the hit rate.
+        """
+        with self._lock:
+            num_lookups = self.num_hits + self.num_misses
+            return {
+                "records": len(self._records),
+                "num_hits": self.num_hits,
+                "num_misses": self.num_misses,
+                "num_loaded": self.num_loaded,
+                "hit_rate": self.num_hits / num_lookups if num_lookups else 0.0,
+            }
+
+    def _set_path(self, path: Optional[str]) -> None:
+        self.path = path
+        if path is None or not self.enabled:
+            return
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+        with self._lock:
+            for line in lines:
+                try:
+                    record = json.loads(line)
+                    key = (
+                        record["test_entry_id"],
+                        tuple(record["replayed_turns"]),
+                        record["is_augmented"],
+                        record["long_context"],
+                    )
+                    turn = GroundTruthTurn(
+                        execution_results=record["execution_results"],
+                        state_fingerprints=record["state_fingerprints"],
+                    )
+                except (ValueError, KeyError, TypeError):
+                    # A line may be truncated if a previous run was interrupted while writing it
+                    continue
+                self._records[key] = turn
+                self.num_loaded += 1
+            self._evict_if_needed()
+
+    def _append_to_file(self, key: Tuple[str, Tuple[int, ...], bool, bool], turn: GroundTruthTurn) -> None:
+        test_entry_id, replayed_turns, is_augmented, long_context = key
+        line = json.dumps(
+            {
+                "test_entry_id": test_entry_id,
+                "replayed_turns": list(replayed_turns),
+                "is_augmented": is_augmented,
+                "long_context": long_context,
+                "execution_results": turn.execution_results,
+                "state_fingerprints": turn.state_fingerprints,
+            }
+        )
+        # A single write per line, so that processes sharing the file do not interleave their lines
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+    def _evict_if_needed(self) -> None:
+        if self.max_records is None:
+            return
+        while len(self._records) > self.max_records:
+            self._records.popitem(last=False)
+
+
+_GROUND_TRUTH_ORACLE = GroundTruthOracle()
+
+
+def get_ground_truth_oracle() -> GroundTruthOracle:
+    """Return the process-wide ground truth oracle."""
+    return _GROUND_TRUTH_ORACLE
+
+
+def configure_ground_truth_oracle(
+    max_records: Optional[int] = 8192, path: Optional[str] = None, enabled: bool = True
+) -> GroundTruthOracle:
+    """Update the settings of the process-wide ground truth oracle and return it."""
+    _GROUND_TRUTH_ORACLE.configure(max_records=max_records, path=path, enabled=enabled)
+    return _GROUND_TRUTH_ORACLE
+
+
+class GroundTruthReplay:
+    """
+    Replays the ground truth of one test entry turn by turn, through the ground truth oracle.
+
+    The ground truth instances are only brought up to date when an outcome has to be computed, or when the caller
+    needs them (see `get_instances`), by replaying every turn that was skipped thanks to the oracle.
+    """
+
+    def __init__(
+        self,
+        ground_truth: List[list],
+        initial_config: dict,
+        involved_classes: list,
+        model_name: str,
+        test_entry_id: str,
+        long_context: bool = False,
+        is_evaL_run: bool = True,
+        is_augmented: bool = False,
+        oracle: Optional[GroundTruthOracle] = None,
+    ) -> None:
+        """
+        Args:
+            ground_truth (List[list]): The ground truth calls of each turn, as strings or decoded ToolCalls.
+            initial_config (dict): The initial configuration of the entry.
+            involved_classes (list): The API classes involved in the entry.
+            model_name (str): The model name the ground truth instances are registered under.
+            test_entry_id (str): The test entry id.
+            long_context (bool): Whether the entry uses the long context scenario.
+            is_evaL_run (bool): The `is_evaL_run` flag the ground truth instances are registered under.
+            is_augmented (bool): Whether the augmented API classes are used.
+            oracle (GroundTruthOracle, optional): Defaults to the process-wide oracle.
+        """
+        self.ground_truth = ground_truth
+        self.initial_config = initial_config
+        self.involved_classes = involved_classes
+        self.model_name = model_name
+        self.test_entry_id = test_entry_id
+        self.long_context = long_context
+        self.is_evaL_run = is_evaL_run
+        self.is_augmented = is_augmented
+        self.oracle = oracle if oracle is not None else get_ground_truth_oracle()
+        self.replayed_turns: Tuple[int, ...] = ()
+        # Number of replayed turns that were actually executed on the ground truth instances
+        self._num_executed_turns = 0
+
+    def replay_turn(self, turn_index: int) -> Tuple[GroundTruthTurn, Optional[Dict[str, Any]]]:
+        """
+        Replay the ground truth of a turn.
+
+        Args:
+            turn_index (int): The index of the turn. Turns must be replayed in increasing order, and may be skipped.
+
+        Returns:
+            turn (GroundTruthTurn): The outcome of the turn.
+            instances (Dict[str, Any], optional): The ground truth instances after the turn, to compare against and
+                never mutate: either the instances of this replay, when the outcome had to be computed, or the snapshot
+                of the oracle. None when the outcome was loaded from a file, in which case `turn.state_fingerprints`
+                can be used (see `match_state_fingerprints`) or the instances brought up to date (see `get_instances`).
+        """
+        self.replayed_turns += (turn_index,)
+        key = (self.test_entry_id, self.replayed_turns, self.is_augmented, self.long_context)
+        turn = self.oracle.get(key)
+        if turn is not None:
+            return turn, turn.instances
+        execution_results, instances = self._execute_pending_turns()
+        return self.oracle.put(key, execution_results, instances), instances
+
+    def get_instances(self) -> Dict[str, Any]:
+        """
+        Returns:
+            instances (Dict[str, Any]): The ground truth instances after the last replayed turn, by class name.
+        """
+        _, instances = self._execute_pending_turns()
+        return instances
+
+    def _execute_pending_turns(self) -> Tuple[List[str], Dict[str, Any]]:
+        execution_results = []
+        for turn_index in self.replayed_turns[self._num_executed_turns :]:
+            execution_results, _ = self._execute(self.ground_truth[turn_index])
+        self._num_executed_turns = len(self.replayed_turns)
+        # Executing no call returns the registered instances as they are
+        _, instances = self._execute([])
+        return execution_results, instances
+
+    def _execute(self, func_call_list: list) -> Tuple[List[str], Dict[str, Any]]:
+        return execute_multi_turn_func_call(
+            func_call_list=func_call_list,
+            initial_config=self.initial_config,
+            involved_classes=self.involved_classes,
+            model_name=self.model_name,
+            test_entry_id=self.test_entry_id,
+            long_context=self.long_context,
+            is_evaL_run=self.is_evaL_run,
+            is_augmented=self.is_augmented,
+        )
+
+
+def match_state_fingerprints(
+    instances: Dict[str, Any], state_fingerprints: Dict[str, Optional[int]]
+) -> Optional[bool]:
+    """
+    Compare instances to the fingerprints of the ground truth instances, instead of the instances themselves.
+
+    Args:
+        instances (Dict[str, Any]): The instances to check, by class name.
+        state_fingerprints (Dict[str, Optional[int]]): The fingerprints of the ground truth instances, by class name.
+
+    Returns:
+        match (bool, optional): Whether every instance has the state of its ground truth counterpart, or None if this
+            cannot be decided from the fingerprints.
+    """
+    if set(instances) != set(state_fingerprints):
+        return None
+    for class_name, expected_fingerprint in state_fingerprints.items():
+        fingerprint = state_fingerprint(instances[class_name])
+        if fingerprint is None or expected_fingerprint is None:
+            return None
+        if fingerprint != expected_fingerprint:
+            return False
+    return True
@@ -0,0 +1,239 @@
+import sys
+import threading
+import types
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class EnvInstanceRegistry:
+    """
+    Registry of the simulated API instances used by `execute_multi_turn_func_call`.
+
+    Instances are grouped under an instance key (one key per model/rollout and test entry). Each group holds one
+    instance per involved class and lives until it is explicitly released, or until it is evicted because the
+    registry exceeds its caps. Groups are evicted in least-recently-used order. The registry can be used from several
+    threads, as long as a given instance key is only used by one thread at a time.
+
+    Gauges:
+        live_instances (int): Number of API instances currently held by the registry.
+        live_bytes (int): Estimated size in bytes of the held instances. An instance is measured once, when it is
+            created if `max_bytes` is set, otherwise the first time the gauge is read.
+    """
+
+    def __init__(
+        self, max_instances: Optional[int] = None, max_bytes: Optional[int] = None
+    ) -> None:
+        """
+        Args:
+            max_instances (int, optional): Maximum number of live API instances. Defaults to no limit.
+            max_bytes (int, optional): Maximum estimated size of all live API instances. Defaults to no limit.
+        """
+        self.max_instances: Optional[int] = max_instances
+        self.max_bytes: Optional[int] = max_bytes
+        self._groups: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._nbytes: Dict[str, Dict[str, Optional[int]]] = {}
+        self._measured_bytes: int = 0
+        self.live_instances: int = 0
+        self.num_created: int = 0
+        self.num_released: int = 0
+        self.num_evicted: int = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def __contains__(self, instance_key: str) -> bool:
+        return instance_key in self._groups
+
+    @property
+    def live_bytes(self) -> int:
+        with self._lock:
+            for instance_key, group_nbytes in self._nbytes.items():
+                for class_name, nbytes in group_nbytes.items():
+                    if nbytes is None:
+                        self._measure(instance_key, class_name)
+            return self._measured_bytes
+
+    def create(self, instance_key: str, class_name: str, instance: Any) -> Any:
+        """
+        Register a freshly loaded API instance under the given instance key.
+
+        Args:
+            instance_key (str): The key of the group the instance belongs to.
+            class_name (str): The name of the API class, e.g. "GorillaFileSystem".
+            instance (Any): The loaded API instance.
+
+        Returns:
+            instance (Any): The registered instance.
+        """
+        with self._lock:
+            group = self._groups.setdefault(instance_key, {})
+            self._groups.move_to_end(instance_key)
+            if class_name in group:
+                self._drop_instance(instance_key, class_name)
+
+            group[class_name] = instance
+            self._nbytes.setdefault(instance_key, {})[class_name] = None
+            self.live_instances += 1
+            self.num_created += 1
+            # Measuring walks the whole instance, so only do it eagerly when the byte cap needs it
+            if self.max_bytes is not None:
+                self._measure(instance_key, class_name)
+
+            self._evict_if_needed(keep=instance_key)
+            return instance
+
+    def get(self, instance_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the instances registered under the given instance key.
+
+        Args:
+            instance_key (str): The key of the group.
+
+        Returns:
+            instances (Dict[str, Any]): A mapping of class name to instance, or None if the key is not registered.
+        """
+        with self._lock:
+            group = self._groups.get(instance_key)
+            if group is not None:
+                self._groups.move_to_end(instance_key)
+            return group
+
+    def release(self, instance_key: str) -> int:
+        """
+        Release every instance registered under the given instance key.
+
+        Args:
+            instance_key (str): The key of the group.
+
+        Returns:
+            num_released (int): The number of instances released.
+        """
+        with self._lock:
+            num_released = self._drop_group(instance_key)
+            self.num_released += num_released
+            return num_released
+
+    def clear(self) -> None:
+        """Release every registered instance."""
+        with self._lock:
+            for instance_key in list(self._groups):
+                self.release(instance_key)
+
+    def configure(
+        self, max_instances: Optional[int] = None, max_bytes: Optional[int] = None
+    ) -> None:
+        """
+        Update the caps of the registry and evict instances that no longer fit.
+
+        Args:
+            max_instances (int, optional): Maximum number of live API instances. Defaults to no limit.
+            max_bytes (int, optional): Maximum estimated size of all live API instances. Defaults to no limit.
+        """
+        with self._lock:
+            self.max_instances = max_instances
+            self.max_bytes = max_bytes
+            if self.max_bytes is not None:
+                # Make sure every live instance is accounted for before enforcing the byte cap
+                self.live_bytes
+            self._evict_if_needed()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns:
+            stats (Dict[str, int]): The gauges and counters of the registry.
+        """
+        with self._lock:
+            return {
+                "live_groups": len(self._groups),
+                "live_instances": self.live_instances,
+                "live_bytes": self.live_bytes,
+                "num_created": self.num_created,
+                "num_released": self.num_released,
+                "num_evicted": self.num_evicted,
+            }
+
+    def _over_capacity(self) -> bool:
+        if self.max_instances is not None and self.live_instances > self.max_instances:
+            return True
+        if self.max_bytes is not None and self.live_bytes > self.max_bytes:
+            return True
+        return False
+
+    def _evict_if_needed(self, keep: Optional[str] = None) -> None:
+        # The group that is currently in use is never evicted, even if it alone exceeds the caps.
+        while self._over_capacity():
+            victim = next((key for key in self._groups if key != keep), None)
+            if victim is None:
+                return
+            self.num_evicted += self._drop_group(victim)
+
+    def _measure(self, instance_key: str, class_name: str) -> None:
+        nbytes = estimate_nbytes(self._groups[instance_key][class_name])
+        self._nbytes[instance_key][class_name] = nbytes
+        self._measured_bytes += nbytes
+
+    def _drop_instance(self, instance_key: str, class_name: str) -> None:
+        del self._groups[instance_key][class_name]
+        self.live_instances -= 1
+        self._measured_bytes -= self._nbytes[instance_key].pop(class_name) or 0
+
+    def _drop_group(self, instance_key: str) -> int:
+        group = self._groups.pop(instance_key, None)
+        if group is None:
+            return 0
+        self.live_instances -= len(group)
+        self._measured_bytes -= sum(
+            nbytes or 0 for nbytes in self._nbytes.pop(instance_key, {}).values()
+        )
+        return len(group)
+
+
+def estimate_nbytes(obj: Any) -> int:
+    """
+    Estimate the memory footprint of an object, following containers and instance attributes.
+
+    Args:
+        obj (Any): The object to measure.
+
+    Returns:
+        nbytes (int): The estimated size in bytes. Objects reachable more than once are counted once.
+    """
+    seen = set()
+    stack = [obj]
+    nbytes = 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        nbytes += sys.getsizeof(item)
+
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif not isinstance(item, (str, bytes, int, float, type(None), type, types.ModuleType)):
+            if hasattr(item, "__dict__"):
+                stack.append(vars(item))
+            for slot in getattr(type(item), "__slots__", ()):
+                if hasattr(item, slot):
+                    stack.append(getattr(item, slot))
+    return nbytes
+
+
+_INSTANCE_REGISTRY = EnvInstanceRegistry()
+
+
+def get_instance_registry() -> EnvInstanceRegistry:
+    """Return the process-wide registry used by `execute_multi_turn_func_call`."""
+    return _INSTANCE_REGISTRY
+
+
+def configure_instance_registry(
+    max_instances: Optional[int] = None, max_bytes: Optional[int] = None
+) -> EnvInstanceRegistry:
+    """Set the caps of the process-wide registry and return it."""
+    _INSTANCE_REGISTRY.configure(max_instances=max_instances, max_bytes=max_bytes)
+    return _INSTANCE_REGISTRY
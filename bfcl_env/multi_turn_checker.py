@@ -1,7 +1,14 @@
+from collections import Counter
+from typing import Optional
+
+from bfcl_env.ground_truth_oracle import GroundTruthReplay, match_state_fingerprints
 from bfcl_env.multi_turn_utils import (
     execute_multi_turn_func_call,
+    fork_multi_turn_instances,
     is_empty_execute_response,
+    release_multi_turn_instances,
 )
+from bfcl_env.state_tracking import instances_known_equal, mark_instances_equal
 
 #### Main functions ####
 
@@ -24,118 +31,166 @@ def multi_turn_checker(
     test_category: str = test_entry_id.rsplit("_", 1)[0]
     execution_results: list[dict] = []
     all_turn_model_execution_results: list[str] = []
+    # Occurrences of each item of all_turn_model_execution_results, so the response check does not scan all the turns
+    all_turn_model_execution_result_counts: Counter = Counter()
+
+    # The ground truth is replayed through the ground truth oracle, so each turn is only executed once per entry
+    ground_truth_replay = GroundTruthReplay(
+        multi_turn_ground_truth_list,
+        initial_config,
+        involved_classes,
+        model_name=model_name + "_ground_truth",
+        test_entry_id=test_entry_id,
+        long_context=("long_context" in test_category or "composite" in test_category),
+        is_evaL_run=True,
+        is_augmented=is_augmented,
+    )
 
-    # First execute all the function calls
-    for turn_index, single_turn_ground_truth_list in enumerate(
-        multi_turn_ground_truth_list
-    ):
-        single_turn_model_response_list = multi_turn_model_result_list_decoded[
-            turn_index
-        ]
-
-        # Note that we combine all the sub-step results into a single list, for easier comparison
-        single_turn_model_execution_results = []
-        single_turn_model_execution_results_uncombined = []
-        single_turn_ground_truth_execution_results = []
-        model_instances = {}  # Will be overwritten in the for loop
-        single_step_model_execution_results = []  # Will be overwritten in the for loop
-
-        for single_step_model_response in single_turn_model_response_list:
-            single_step_model_execution_results, model_instances = (
-                execute_multi_turn_func_call(
-                    func_call_list=single_step_model_response,
-                    initial_config=initial_config,
-                    involved_classes=involved_classes,
-                    model_name=model_name,
-                    test_entry_id=test_entry_id,
-                    long_context=(
-                        "long_context" in test_category or "composite" in test_category
-                    ),
-                    is_evaL_run=True,
-                    is_augmented=is_augmented,
-                )
-            )
-            single_turn_model_execution_results.extend(
-                single_step_model_execution_results
-            )
-            single_turn_model_execution_results_uncombined.append(
-                single_step_model_execution_results
-            )
-
-        # Execute the ground truth function calls
-        single_turn_ground_truth_execution_results, ground_truth_instances = (
-            execute_multi_turn_func_call(
-                func_call_list=single_turn_ground_truth_list,
-                initial_config=initial_config,
-                involved_classes=involved_classes,
+    try:
+        # Load the scenario once
+        _, model_instances = execute_multi_turn_func_call(
+            func_call_list=[],
+            initial_config=initial_config,
+            involved_classes=involved_classes,
+            model_name=model_name,
+            test_entry_id=test_entry_id,
+            long_context=("long_context" in test_category or "composite" in test_category),
+            is_evaL_run=True,
+            is_augmented=is_augmented,
+        )
+        if not ground_truth_replay.oracle.enabled:
+            # Without the oracle, every turn is replayed: branch the ground truth instances off the freshly loaded model instances
+            fork_multi_turn_instances(
+                model_instances,
                 model_name=model_name + "_ground_truth",
                 test_entry_id=test_entry_id,
-                long_context=(
-                    "long_context" in test_category or "composite" in test_category
-                ),
                 is_evaL_run=True,
-                is_augmented=is_augmented,
             )
-        )
 
-        all_turn_model_execution_results.extend(single_turn_model_execution_results)
-        execution_results.append(
-            {
-                "model": single_turn_model_execution_results_uncombined,
-                "ground_truth": single_turn_ground_truth_execution_results,
-            }
-        )
+        # First execute all the function calls
+        for turn_index, single_turn_ground_truth_list in enumerate(
+            multi_turn_ground_truth_list
+        ):
+            single_turn_model_response_list = multi_turn_model_result_list_decoded[
+                turn_index
+            ]
+
+            # Note that we combine all the sub-step results into a single list, for easier comparison
+            single_turn_model_execution_results = []
+            single_turn_model_execution_results_uncombined = []
+            single_turn_ground_truth_execution_results = []
+            model_instances = {}  # Will be overwritten in the for loop
+            single_step_model_execution_results = []  # Will be overwritten in the for loop
+
+            for single_step_model_response in single_turn_model_response_list:
+                single_step_model_execution_results, model_instances = (
+                    execute_multi_turn_func_call(
+                        func_call_list=single_step_model_response,
+                        initial_config=initial_config,
+                        involved_classes=involved_classes,
+                        model_name=model_name,
+                        test_entry_id=test_entry_id,
+                        long_context=(
+                            "long_context" in test_category or "composite" in test_category
+                        ),
+                        is_evaL_run=True,
+                        is_augmented=is_augmented,
+                    )
+                )
+                single_turn_model_execution_results.extend(
+                    single_step_model_execution_results
+                )
+                single_turn_model_execution_results_uncombined.append(
+                    single_step_model_execution_results
+                )
 
-        # If the ground truth list is not empty, then the model response list should not be empty
-        if len(single_turn_ground_truth_list) > 0:
-            if not single_turn_model_response_list or is_empty_execute_response(
-                single_turn_model_response_list
-            ):
-                return {
-                    "valid": False,
-                    "error_message": f"Model response list is empty for turn {turn_index}",
-                    "error_type": "multi_turn:empty_turn_model_response",
-                    "details": {
-                        "execution_result": execution_results,
-                    },
+            # Execute the ground truth function calls. Turns without ground truth do not change the state.
+            single_turn_ground_truth_execution_results = []
+            ground_truth_instances = None
+            if single_turn_ground_truth_list:
+                ground_truth_turn, ground_truth_instances = ground_truth_replay.replay_turn(
+                    turn_index
+                )
+                single_turn_ground_truth_execution_results = list(
+                    ground_truth_turn.execution_results
+                )
+
+            all_turn_model_execution_results.extend(single_turn_model_execution_results)
+            all_turn_model_execution_result_counts.update(single_turn_model_execution_results)
+            execution_results.append(
+                {
+                    "model": single_turn_model_execution_results_uncombined,
+                    "ground_truth": single_turn_ground_truth_execution_results,
                 }
+            )
 
-        # If the ground truth list is empty, this is the turn where the model should eventually fail to achieve the user request.
-        # The actual check for irrelevance is done in the multi_turn_irrelevance_checker function
-        # Note: If the model outputs any function call in this turn, we will still execute it so that the state check at the next turn is accurate.
-        if not single_turn_ground_truth_list:
-            continue
+            # If the ground truth list is not empty, then the model response list should not be empty
+            if len(single_turn_ground_truth_list) > 0:
+                if not single_turn_model_response_list or is_empty_execute_response(
+                    single_turn_model_response_list
+                ):
+                    return {
+                        "valid": False,
+                        "error_message": f"Model response list is empty for turn {turn_index}",
+                        "error_type": "multi_turn:empty_turn_model_response",
+                        "details": {
+                            "execution_result": execution_results,
+                        },
+                    }
+
+            # If the ground truth list is empty, this is the turn where the model should eventually fail to achieve the user request.
+            # The actual check for irrelevance is done in the multi_turn_irrelevance_checker function
+            # Note: If the model outputs any function call in this turn, we will still execute it so that the state check at the next turn is accurate.
+            if not single_turn_ground_truth_list:
+                continue
 
-        ## Check after each turn ##
-        assert len(model_instances) == len(ground_truth_instances), (
-            f"Model instances and ground truth instances do not match in length for turn {turn_index}. Model instances: {len(model_instances)}, Ground truth instances: {len(ground_truth_instances)}"
-        )
-        assert set(model_instances.keys()) == set(ground_truth_instances.keys())
-
-        # Check the state of the instances
-        state_check_result = state_checker(model_instances, ground_truth_instances)
-        if not state_check_result["valid"]:
-            state_check_result["execution_result"] = execution_results
-            return state_check_result
-
-        # Check the response of the function calls
-        # We use the all_turn_model_execution_results to accomodate the situation where the model invokes a function in a previous turn, and thus don't need to invoke it again in the current turn.
-        response_check_result = response_checker(
-            all_turn_model_execution_results,
-            single_turn_ground_truth_execution_results,
-            turn_index,
+            ## Check after each turn ##
+            if ground_truth_instances is None:
+                # The outcome of the turn was loaded from a file, so the model instances are compared to the
+                # fingerprints of the ground truth instances. These are only brought up to date when this does not
+                # settle it, to report the differences.
+                if not match_state_fingerprints(
+                    model_instances, ground_truth_turn.state_fingerprints
+                ):
+                    ground_truth_instances = ground_truth_replay.get_instances()
+
+            if ground_truth_instances is not None:
+                assert len(model_instances) == len(ground_truth_instances), (
+                    f"Model instances and ground truth instances do not match in length for turn {turn_index}. Model instances: {len(model_instances)}, Ground truth instances: {len(ground_truth_instances)}"
+                )
+                assert set(model_instances.keys()) == set(ground_truth_instances.keys())
+
+                # Check the state of the instances
+                state_check_result = state_checker(model_instances, ground_truth_instances)
+                if not state_check_result["valid"]:
+                    state_check_result["execution_result"] = execution_results
+                    return state_check_result
+
+            # Check the response of the function calls
+            # We use the all_turn_model_execution_results to accomodate the situation where the model invokes a function in a previous turn, and thus don't need to invoke it again in the current turn.
+            response_check_result = response_checker(
+                all_turn_model_execution_results,
+                single_turn_ground_truth_execution_results,
+                turn_index,
+                model_response_counts=all_turn_model_execution_result_counts,
+            )
+            if not response_check_result["valid"]:
+                return response_check_result
+
+            # # Check the method invoke order
+            # method_invoke_order_check_result = method_invoke_order_checker(
+            #     model_instances, ground_truth_instances
+            # )
+            # if not method_invoke_order_check_result["valid"]:
+            #     return method_invoke_order_check_result
+
+        return {"valid": True}
+    finally:
+        # The instances are only needed while checking this entry
+        release_multi_turn_instances(model_name, test_entry_id, is_evaL_run=True)
+        release_multi_turn_instances(
+            model_name + "_ground_truth", test_entry_id, is_evaL_run=True
         )
-        if not response_check_result["valid"]:
-            return response_check_result
-
-        # # Check the method invoke order
-        # method_invoke_order_check_result = method_invoke_order_checker(
-        #     model_instances, ground_truth_instances
-        # )
-        # if not method_invoke_order_check_result["valid"]:
-        #     return method_invoke_order_check_result
-
-    return {"valid": True}
 
 
 def multi_turn_irrelevance_checker(
@@ -206,15 +261,22 @@ def state_checker(model_instances: dict, ground_truth_instances: dict):
 
 
 def response_checker(
-    model_response_list: list, ground_truth_response_list: list, turn_index: int
+    model_response_list: list,
+    ground_truth_response_list: list,
+    turn_index: int,
+    model_response_counts: Optional[Counter] = None,
 ):
     """
     Checks if the model_response is a subsequence of the ground_truth_response.
     Each list contains the response of the function calls executed in that single turn.
+
+    The model response list grows with every turn. Callers checking every turn can maintain `model_response_counts`,
+    the number of occurrences of each item of `model_response_list`, as they extend it, so that the check only costs
+    the length of the ground truth response list.
     """
     # We don't need to enforce the order of the responses, because many entries have parallel operations, and so the model can execute them in any order.
     is_subsequence, missing_items = _is_subsequence_unordered(
-        ground_truth_response_list, model_response_list
+        ground_truth_response_list, model_response_list, model_response_counts
     )
     if not is_subsequence:
         return {
@@ -276,6 +338,10 @@ def _compare_instances(model_obect, ground_truth_object):
     assert type(model_obect) == type(ground_truth_object), (
         "Objects are not of the same type."
     )
+    # Instances that were not touched since they were last found equal are still equal, see `bfcl_env.state_tracking`
+    if instances_known_equal(model_obect, ground_truth_object):
+        return True, {}
+
     differences = {}
     valid = True
     for attr_name in vars(ground_truth_object):
@@ -292,6 +358,8 @@ def _compare_instances(model_obect, ground_truth_object):
                 "ground_truth": ground_truth_attr,
             }
 
+    if valid:
+        mark_instances_equal(model_obect, ground_truth_object)
     return valid, differences
 
 
@@ -307,11 +375,31 @@ def _is_subsequence(list1, list2) -> tuple[bool, list]:
     ]
 
 
-def _is_subsequence_unordered(list1, list2) -> tuple[bool, list]:
+def _is_subsequence_unordered(
+    list1, list2, list2_counts: Optional[Counter] = None
+) -> tuple[bool, list]:
     """
     Checks if all elements of list1 are present in list2, regardless of order.
     Also returns the elements of list1 that are not present in list2.
+
+    `list2_counts` are the number of occurrences of each element of list2, computed here when not given.
     """
+    try:
+        if list2_counts is None:
+            list2_counts = Counter(list2)
+        # Occurrences of list2 used so far, instead of removing them from a copy of list2
+        used_counts = Counter()
+        missing_elements = []
+        for item in list1:
+            if used_counts[item] < list2_counts[item]:
+                used_counts[item] += 1
+            else:
+                missing_elements.append(item)
+        return len(missing_elements) == 0, missing_elements
+    except TypeError:
+        # Unhashable elements are matched one by one
+        pass
+
     # Copy list2 to avoid modifying the original list during checks
     list2_copy = list2[:]
 
@@ -1,8 +1,17 @@
 import copy
+import functools
 import importlib
 import inspect
 import json
 import re
+from typing import Union
+
+from bfcl_env.instance_registry import get_instance_registry
+from bfcl_env.scenario_cache import get_scenario_cache
+from bfcl_env.state_fork import fork_instance
+from bfcl_env.state_tracking import get_touched_attributes, mark_attributes_dirty, state_hash
+from bfcl_env.step_cache import get_step_cache
+from bfcl_env.tool_call import ToolCall, parse_call_string
 
 CLASS_FILE_PATH_MAPPING = {
     "GorillaFileSystem": "bfcl_env.func_source_code.gorilla_file_system",
@@ -31,9 +40,21 @@ STATELESS_CLASSES = [
     "MathAPI",
 ]
 
+# These functions are never executed, even if the model asks for them
+BLOCKED_FUNCTION_NAMES = [
+    "kill",
+    "exit",
+    "quit",
+    "remove",
+    "unlink",
+    "popen",
+    "Popen",
+    "run",
+]
+
 
 def execute_multi_turn_func_call(
-    func_call_list: list[str],  # a list of strings of func calls
+    func_call_list: list[Union[str, ToolCall]],  # a list of func calls, as strings or decoded ToolCalls
     initial_config: dict,
     involved_classes: list,
     model_name: str,
@@ -45,102 +66,251 @@ def execute_multi_turn_func_call(
     """
     TODO: Add docstring
     """
-    if is_evaL_run:
-        model_name += "_eval"
-
-    path_mapping: dict = (
-        CLASS_FILE_PATH_MAPPING if is_augmented else CLASS_FILE_PATH_MAPPING_WO_AUG
-    )
+    registry = get_instance_registry()
+    scenario_cache = get_scenario_cache()
+    step_cache = get_step_cache()
+    instance_key = _get_instance_key(model_name, test_entry_id, is_evaL_run)
+    registered_instances = registry.get(instance_key) or {}
 
-    class_method_name_mapping = {}
     involved_instances = {}
     for class_name in involved_classes:
-        module_name = path_mapping[class_name]
-        # TODO: Handler the model name issue from handler more elegantly
-        # instance_name = (
-        #     f"{model_name.replace('-', '_').replace('.', '_').replace('/', '_')}_{test_entry_id}_{class_name.lower()}_instance"
-        # )
-        safe_model_name = "uuid" + model_name.replace("-", "_").replace(
-            ".", "_"
-        ).replace("/", "_")
-        instance_name = (
-            f"_{safe_model_name}_{test_entry_id}_{class_name.lower()}_instance"
-        )
-        if instance_name not in globals():
-            module = importlib.import_module(module_name)
-            class_ = getattr(module, class_name)
-            class_instance = class_()
-            if class_name not in STATELESS_CLASSES:
-                class_initial_config = initial_config.get(class_name, {})
-                # Deep copy the initial configuration to avoid mutation issues
-                class_instance._load_scenario(
-                    copy.deepcopy(class_initial_config), long_context=long_context
-                )
-            globals()[instance_name] = class_instance
-        # This happens in subsequent turns
-        else:
-            class_instance = globals()[instance_name]
+        class_instance = registered_instances.get(class_name)
+        if class_instance is None:
+            # Forked from the cached template of the scenario, which is only loaded the first time it is needed
+            class_instance = scenario_cache.get_instance(
+                (test_entry_id, class_name, long_context, is_augmented),
+                functools.partial(
+                    _load_api_instance,
+                    class_name,
+                    initial_config,
+                    long_context,
+                    is_augmented,
+                    hash_state=step_cache.enabled,
+                ),
+            )
+            registry.create(instance_key, class_name, class_instance)
+        # Otherwise, this happens in subsequent turns and the registered instance is reused
 
         involved_instances[class_name] = class_instance
 
-        # Retrieve all method names and map them to the instance
-        for method_name, method in inspect.getmembers(
-            class_instance, predicate=inspect.ismethod
-        ):
-            # Skip private methods
-            if method_name.startswith("_"):
-                continue
-            class_method_name_mapping[method_name] = instance_name
+    # Map each public method name to the class that owns it
+    method_dispatch = _get_method_dispatch(tuple(involved_classes), is_augmented)
 
     execution_results = []
     for func_call in func_call_list:
-        # Add the instance name to the method calls
-        func_call = _process_method_calls(func_call, class_method_name_mapping)
-
-        # Evaluate the function call
         try:
-            # We need to make a copy here because otherwise the `eval(func_call)` would error.
-            func_call_copy = func_call
-            # Before calling `eval`, we need to make sure that the function call is safe
-            # We do so by checking if the function is `kill` or `exit`, etc.
-            # Extract the function name first
-            if "(" in func_call_copy:
-                func_call_copy = func_call_copy.split("(")[0]
-            # Situation where the function call is a method call
-            if "." in func_call_copy:
-                func_call_copy = func_call_copy.split(".")[1]
-            if func_call_copy in [
-                "kill",
-                "exit",
-                "quit",
-                "remove",
-                "unlink",
-                "popen",
-                "Popen",
-                "run",
-            ]:
-                raise Exception(f"Function call {func_call_copy} is not allowed.")
-
-            func_call_result = eval(func_call)
-
-            if type(func_call_result) == str:
-                pass
-            elif type(func_call_result) == dict:
-                # Some function returns a object instance, which is not serializable
-                try:
-                    func_call_result = json.dumps(func_call_result)
-                except:
-                    func_call_result = str(func_call_result)
+            tool_call = (
+                func_call if isinstance(func_call, ToolCall) else parse_call_string(func_call)
+            )
+            dispatch = method_dispatch.get(tool_call.name) if tool_call else None
+            if dispatch is not None:
+                class_name, method, touched_attributes = dispatch
+                # Before calling the method, we need to make sure that the function call is safe
+                if tool_call.name in BLOCKED_FUNCTION_NAMES:
+                    raise Exception(f"Function call {tool_call.name} is not allowed.")
+                args, kwargs = tool_call.positional_arguments, tool_call.arguments
+                if tool_call is func_call:
+                    # Decoded calls can be reused (e.g. ground truth), so the method must not mutate or keep their arguments
+                    args, kwargs = copy.deepcopy(args), copy.deepcopy(kwargs)
+                class_instance = involved_instances[class_name]
+                if step_cache.enabled:
+                    # Calls already executed from an equal state are answered from the cache
+                    func_call_result = step_cache.execute(
+                        class_name,
+                        class_instance,
+                        method,
+                        args,
+                        kwargs,
+                        touched_attributes,
+                        _format_execution_result,
+                        is_augmented=is_augmented,
+                    )
+                else:
+                    try:
+                        func_call_result = method(class_instance, *args, **kwargs)
+                    finally:
+                        mark_attributes_dirty(class_instance, touched_attributes)
             else:
-                func_call_result = str(func_call_result)
+                # Anything that is not a call to a known method with literal arguments (e.g. nested calls) is evaluated
+                try:
+                    func_call_result = _eval_func_call(
+                        str(func_call), method_dispatch, involved_instances, instance_key
+                    )
+                finally:
+                    for class_instance in involved_instances.values():
+                        mark_attributes_dirty(class_instance)
 
-            execution_results.append(func_call_result)
+            execution_results.append(_format_execution_result(func_call_result))
         except Exception as e:
             execution_results.append(f"Error during execution: {str(e)}")
 
     return execution_results, involved_instances
 
 
+def _format_execution_result(func_call_result) -> str:
+    if type(func_call_result) == str:
+        return func_call_result
+    elif type(func_call_result) == dict:
+        # Some function returns a object instance, which is not serializable
+        try:
+            return json.dumps(func_call_result)
+        except:
+            return str(func_call_result)
+    else:
+        return str(func_call_result)
+
+
+def _load_api_instance(
+    class_name: str,
+    initial_config: dict,
+    long_context: bool,
+    is_augmented: bool,
+    hash_state: bool = False,
+):
+    class_ = _get_api_class(class_name, is_augmented)
+    class_instance = class_()
+    if class_name not in STATELESS_CLASSES:
+        class_initial_config = initial_config.get(class_name, {})
+        # Deep copy the initial configuration to avoid mutation issues
+        class_instance._load_scenario(
+            copy.deepcopy(class_initial_config), long_context=long_context
+        )
+    if hash_state:
+        # The step cache keys calls by state hash, forks of the template inherit the hashes computed here
+        state_hash(class_instance)
+    return class_instance
+
+
+@functools.lru_cache(maxsize=None)
+def _get_api_class(class_name: str, is_augmented: bool) -> type:
+    path_mapping: dict = (
+        CLASS_FILE_PATH_MAPPING if is_augmented else CLASS_FILE_PATH_MAPPING_WO_AUG
+    )
+    module = importlib.import_module(path_mapping[class_name])
+    return getattr(module, class_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_class_method_table(class_name: str, is_augmented: bool) -> dict:
+    """
+    Build the table of public methods of an API class. It is built once per class and per augmented/non-augmented variant.
+    """
+    class_ = _get_api_class(class_name, is_augmented)
+    return {
+        method_name: method
+        for method_name, method in inspect.getmembers(class_, predicate=inspect.isfunction)
+        # Skip private methods
+        if not method_name.startswith("_")
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _get_method_dispatch(involved_classes: tuple, is_augmented: bool) -> dict:
+    """
+    Map each public method name to `(class_name, method, touched_attributes)`. When several classes define the same
+    method name, the class listed last wins. `touched_attributes` are the instance attributes the method may change,
+    see `get_touched_attributes`.
+    """
+    method_dispatch = {}
+    for class_name in involved_classes:
+        class_ = _get_api_class(class_name, is_augmented)
+        for method_name, method in _get_class_method_table(class_name, is_augmented).items():
+            method_dispatch[method_name] = (
+                class_name,
+                method,
+                get_touched_attributes(class_, method_name),
+            )
+    return method_dispatch
+
+
+def _eval_func_call(
+    func_call: str, method_dispatch: dict, involved_instances: dict, instance_key: str
+):
+    instance_namespace = {}
+    class_method_name_mapping = {}
+    for class_name, class_instance in involved_instances.items():
+        instance_namespace[f"{instance_key}_{class_name.lower()}_instance"] = class_instance
+    for method_name, (class_name, _, _) in method_dispatch.items():
+        class_method_name_mapping[method_name] = (
+            f"{instance_key}_{class_name.lower()}_instance"
+        )
+
+    # Add the instance name to the method calls
+    func_call = _process_method_calls(func_call, class_method_name_mapping)
+
+    # We need to make a copy here because otherwise the `eval(func_call)` would error.
+    func_call_copy = func_call
+    # Before calling `eval`, we need to make sure that the function call is safe
+    # We do so by checking if the function is `kill` or `exit`, etc.
+    # Extract the function name first
+    if "(" in func_call_copy:
+        func_call_copy = func_call_copy.split("(")[0]
+    # Situation where the function call is a method call
+    if "." in func_call_copy:
+        func_call_copy = func_call_copy.split(".")[1]
+    if func_call_copy in BLOCKED_FUNCTION_NAMES:
+        raise Exception(f"Function call {func_call_copy} is not allowed.")
+
+    return eval(func_call, globals(), instance_namespace)
+
+
+def release_multi_turn_instances(
+    model_name: str, test_entry_id: str, is_evaL_run: bool = False
+) -> int:
+    """
+    Release the instances created by `execute_multi_turn_func_call` for the given model name and test entry.
+
+    Args:
+        model_name (str): The model name passed to `execute_multi_turn_func_call`.
+        test_entry_id (str): The test entry id passed to `execute_multi_turn_func_call`.
+        is_evaL_run (bool): The `is_evaL_run` flag passed to `execute_multi_turn_func_call`.
+
+    Returns:
+        num_released (int): The number of instances released.
+    """
+    return get_instance_registry().release(
+        _get_instance_key(model_name, test_entry_id, is_evaL_run)
+    )
+
+
+def fork_multi_turn_instances(
+    involved_instances: dict,
+    model_name: str,
+    test_entry_id: str,
+    is_evaL_run: bool = False,
+) -> dict:
+    """
+    Register forks of already loaded instances under another model name, so that `execute_multi_turn_func_call`
+    continues from their current state instead of loading the scenario again. This is used to branch the ground truth
+    replay off the instances loaded for the model.
+
+    Args:
+        involved_instances (dict): The instances to fork, as returned by `execute_multi_turn_func_call`.
+        model_name (str): The model name the forks are registered under.
+        test_entry_id (str): The test entry id the forks are registered under.
+        is_evaL_run (bool): The `is_evaL_run` flag the forks are registered under.
+
+    Returns:
+        forked_instances (dict): A mapping of class name to forked instance.
+    """
+    registry = get_instance_registry()
+    instance_key = _get_instance_key(model_name, test_entry_id, is_evaL_run)
+    return {
+        class_name: registry.create(instance_key, class_name, fork_instance(class_instance))
+        for class_name, class_instance in involved_instances.items()
+    }
+
+
+def _get_instance_key(model_name: str, test_entry_id: str, is_evaL_run: bool) -> str:
+    if is_evaL_run:
+        model_name += "_eval"
+    # TODO: Handler the model name issue from handler more elegantly
+    safe_model_name = "uuid" + model_name.replace("-", "_").replace(".", "_").replace(
+        "/", "_"
+    )
+    return f"_{safe_model_name}_{test_entry_id}"
+
+
 def is_empty_execute_response(input_list: list):
     if len(input_list) == 0:
         return True
@@ -0,0 +1,132 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from bfcl_env.state_fork import fork_instance
+
+
+class ScenarioTemplateCache:
+    """
+    Process-wide cache of loaded scenarios used by `execute_multi_turn_func_call`.
+
+    The first time a scenario is needed, the API instance is loaded once and kept as a template. Every instance handed
+    out afterwards is a fork of the template (see `fork_instance`), so rollouts of the same entry do not decode,
+    deep-copy and populate the initial configuration again. Templates are never handed out themselves, so they keep
+    the initial state of the scenario. Templates are evicted in least-recently-used order. The cache can be used from
+    several threads.
+
+    The cache key is `(test_entry_id, class_name, long_context, is_augmented)`, so a test entry id must always come
+    with the same initial configuration.
+
+    Counters:
+        num_hits (int): Number of instances forked from an existing template.
+        num_misses (int): Number of templates loaded.
+        num_evicted (int): Number of templates evicted because the cache was full.
+    """
+
+    def __init__(self, max_templates: Optional[int] = 4096, enabled: bool = True) -> None:
+        """
+        Args:
+            max_templates (int, optional): Maximum number of templates kept. Defaults to 4096, None for no limit.
+            enabled (bool): Whether templates are cached. When disabled, every instance is loaded from scratch.
+        """
+        self.max_templates: Optional[int] = max_templates
+        self.enabled: bool = enabled
+        self._templates: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.num_hits: int = 0
+        self.num_misses: int = 0
+        self.num_evicted: int = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._templates
+
+    def get_instance(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        """
+        Return a new instance of the scenario identified by the given key.
+
+        Args:
+            key (Hashable): The key of the scenario, see the class docstring.
+            load (Callable[[], Any]): Loads the scenario from scratch. Only called when the template is missing.
+
+        Returns:
+            instance (Any): A new API instance in the initial state of the scenario, owned by the caller.
+        """
+        if not self.enabled:
+            return load()
+
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self.num_hits += 1
+                self._templates.move_to_end(key)
+        if template is None:
+            # Loaded outside the lock, two threads may load the same template, the last one wins
+            template = load()
+            with self._lock:
+                self.num_misses += 1
+                self._templates[key] = template
+                self._evict_if_needed()
+        # Templates are never mutated, so they can be forked without holding the lock
+        return fork_instance(template)
+
+    def clear(self) -> None:
+        """Drop every template. The counters are kept."""
+        with self._lock:
+            self._templates.clear()
+
+    def configure(self, max_templates: Optional[int] = 4096, enabled: bool = True) -> None:
+        """
+        Update the settings of the cache and drop templates that no longer fit.
+
+        Args:
+            max_templates (int, optional): Maximum number of templates kept. Defaults to 4096, None for no limit.
+            enabled (bool): Whether templates are cached.
+        """
+        self.max_templates = max_templates
+        self.enabled = enabled
+        if not enabled:
+            self.clear()
+        with self._lock:
+            self._evict_if_needed()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns:
+            stats (Dict[str, Any]): The counters of the cache, the number of templates and the hit rate.
+        """
+        with self._lock:
+            num_lookups = self.num_hits + self.num_misses
+            return {
+                "templates": len(self._templates),
+                "num_hits": self.num_hits,
+                "num_misses": self.num_misses,
+                "num_evicted": self.num_evicted,
+                "hit_rate": self.num_hits / num_lookups if num_lookups else 0.0,
+            }
+
+    def _evict_if_needed(self) -> None:
+        if self.max_templates is None:
+            return
+        while len(self._templates) > self.max_templates:
+            self._templates.popitem(last=False)
+            self.num_evicted += 1
+
+
+_SCENARIO_CACHE = ScenarioTemplateCache()
+
+
+def get_scenario_cache() -> ScenarioTemplateCache:
+    """Return the process-wide scenario cache used by `execute_multi_turn_func_call`."""
+    return _SCENARIO_CACHE
+
+
+def configure_scenario_cache(
+    max_templates: Optional[int] = 4096, enabled: bool = True
+) -> ScenarioTemplateCache:
+    """Update the settings of the process-wide scenario cache and return it."""
+    _SCENARIO_CACHE.configure(max_templates=max_templates, enabled=enabled)
+    return _SCENARIO_CACHE
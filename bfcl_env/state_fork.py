@@ -0,0 +1,105 @@
+import copy
+import datetime
+import decimal
+import random
+from typing import Any, Dict, Optional
+
+from bfcl_env.frozen import FrozenDict, FrozenList
+from bfcl_env.state_tracking import copy_state_tracking
+
+# Values of these types are never mutated in place, so a fork can share them with its source
+IMMUTABLE_TYPES = (
+    str,
+    bytes,
+    int,
+    float,
+    complex,
+    bool,
+    type(None),
+    datetime.datetime,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    decimal.Decimal,
+    FrozenDict,
+    FrozenList,
+)
+
+
+def fork_instance(instance: Any) -> Any:
+    """
+    Return an independent copy of a loaded API instance.
+
+    The fork shares every immutable value (in particular the large strings added for long context) with the source
+    instance and only copies the containers around them, which is much cheaper than loading the scenario again or
+    deep-copying the instance. A fork taken right after `_load_scenario` is a snapshot of the initial state.
+
+    Classes can provide their own `_fork()` method when their state is not made of plain containers
+    (e.g. the directory tree of `GorillaFileSystem`).
+
+    Args:
+        instance (Any): The API instance to fork.
+
+    Returns:
+        forked_instance (Any): A new instance of the same class, equal to the source instance.
+    """
+    fork_method = getattr(instance, "_fork", None)
+    if fork_method is not None:
+        forked_instance = fork_method()
+        # The version stamps must not be shared with the source instance
+        copy_state_tracking(instance, forked_instance)
+        return forked_instance
+
+    forked_instance = object.__new__(type(instance))
+    memo: Dict[int, Any] = {}
+    forked_instance.__dict__.update(
+        {name: copy_state(value, memo) for name, value in vars(instance).items()}
+    )
+    return forked_instance
+
+
+def copy_state(value: Any, memo: Optional[Dict[int, Any]] = None) -> Any:
+    """
+    Copy a piece of API state made of dicts, lists, sets, tuples and scalars.
+
+    Immutable values are shared instead of copied. Containers referenced several times are copied once, like
+    `copy.deepcopy` does. Anything else falls back to `copy.deepcopy`.
+
+    Args:
+        value (Any): The value to copy.
+        memo (Dict[int, Any], optional): The objects already copied, keyed by the id of their source.
+
+    Returns:
+        copied_value (Any): The copied value.
+    """
+    value_type = type(value)
+    if value_type in IMMUTABLE_TYPES:
+        return value
+    if memo is None:
+        memo = {}
+    copied_value = memo.get(id(value))
+    if copied_value is not None:
+        return copied_value
+
+    if value_type is dict:
+        copied_value = {}
+        memo[id(value)] = copied_value
+        for key, item in value.items():
+            copied_value[key] = copy_state(item, memo)
+    elif value_type is list:
+        copied_value = []
+        memo[id(value)] = copied_value
+        copied_value.extend(copy_state(item, memo) for item in value)
+    elif value_type is set:
+        # Set items are hashable, so they are immutable in practice
+        copied_value = set(value)
+    elif value_type is tuple:
+        copied_value = tuple(copy_state(item, memo) for item in value)
+    elif isinstance(value, random.Random):
+        # Skip seeding from the OS, the state is overwritten anyway
+        copied_value = value_type.__new__(value_type)
+        copied_value.setstate(value.getstate())
+    else:
+        copied_value = copy.deepcopy(value, memo)
+    memo[id(value)] = copied_value
+    return copied_value
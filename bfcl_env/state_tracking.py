@@ -0,0 +1,364 @@
+"""
+Dirty-attribute tracking for the simulated API instances.
+
+Every attribute of an instance can carry a version stamp, stored in the private `_state_versions` dict of the
+instance. Stamps are globally unique and are only ever copied by `fork_instance`, or by `mark_instances_equal` once
+two instances were found equal. Public attributes with the same stamp are therefore equal, which gives:
+
+- `instances_known_equal`, used by `state_checker` to skip the instances that were not touched since they were last
+  found equal to their ground truth counterpart;
+- `state_hash`, a structural hash of the state that only hashes again the attributes touched since the last call;
+- `state_fingerprint`, the same hash computed in a way that does not change across processes, so it can be stored.
+
+`execute_multi_turn_func_call` calls `mark_attributes_dirty` after every call with the attributes the called method
+may have touched, which are found once per class by reading the source of the method (see `get_touched_attributes`).
+Any code that mutates an instance outside of `execute_multi_turn_func_call` must call `mark_attributes_dirty` too.
+"""
+
+import ast
+import functools
+import hashlib
+import inspect
+import itertools
+import random
+import textwrap
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional
+
+# Private attributes holding state that is not reachable from any other attribute
+INDEPENDENT_PRIVATE_ATTRIBUTES = {"_api_description", "_random"}
+
+# Instance attributes used for the tracking itself, they are never part of the state
+STATE_VERSIONS_ATTRIBUTE = "_state_versions"
+STATE_HASHES_ATTRIBUTE = "_state_hashes"
+STATE_FINGERPRINTS_ATTRIBUTE = "_state_fingerprints"
+
+_VERSION_COUNTER = itertools.count(1)
+
+
+def mark_attributes_dirty(instance: Any, attribute_names: Optional[Iterable[str]] = None) -> None:
+    """
+    Give new version stamps to the attributes of an instance that may have changed.
+
+    Args:
+        instance (Any): The API instance.
+        attribute_names (Iterable[str], optional): The attributes that may have changed. Defaults to every attribute.
+    """
+    versions = vars(instance).get(STATE_VERSIONS_ATTRIBUTE)
+    if not versions:
+        # No attribute carries a stamp yet, so nothing can be wrongly considered equal
+        return
+    if attribute_names is None:
+        versions.clear()
+        return
+    # Stamps are only ever compared for the same attribute, so one new stamp can serve every attribute
+    versions.update(dict.fromkeys(attribute_names, next(_VERSION_COUNTER)))
+
+
+def instances_known_equal(instance: Any, other_instance: Any) -> bool:
+    """
+    Checks if two instances were found equal by `mark_instances_equal` and none of their attributes was touched since.
+
+    Args:
+        instance (Any): The first API instance.
+        other_instance (Any): The second API instance, of the same class.
+
+    Returns:
+        known_equal (bool): True if the public state of both instances is known to be equal. False means unknown.
+    """
+    versions = vars(instance).get(STATE_VERSIONS_ATTRIBUTE)
+    return bool(versions) and versions == vars(other_instance).get(STATE_VERSIONS_ATTRIBUTE)
+
+
+def mark_instances_equal(instance: Any, other_instance: Any) -> None:
+    """
+    Give the same version stamps to the public attributes of two instances that were just found equal.
+
+    Args:
+        instance (Any): The first API instance.
+        other_instance (Any): The second API instance, of the same class.
+    """
+    # Private attributes get a stamp too, which keeps this cheap. It does not matter since they are never compared.
+    version = next(_VERSION_COUNTER)
+    shared_versions = dict.fromkeys(vars(other_instance), version)
+    # The cached hashes that are still valid are moved to the new stamp, the ones of public attributes are valid for
+    # both instances
+    for cache_attribute_name in (STATE_HASHES_ATTRIBUTE, STATE_FINGERPRINTS_ATTRIBUTE):
+        caches = [_get_valid_hashes(source, cache_attribute_name, version) for source in (instance, other_instance)]
+        shared_hashes = {
+            attribute_name: cached
+            for cache in caches
+            for attribute_name, cached in cache.items()
+            if not attribute_name.startswith("_")
+        }
+        for target, cache in zip((instance, other_instance), caches):
+            cache.update(shared_hashes)
+            vars(target)[cache_attribute_name] = cache
+    vars(instance)[STATE_VERSIONS_ATTRIBUTE] = shared_versions
+    vars(other_instance)[STATE_VERSIONS_ATTRIBUTE] = dict(shared_versions)
+
+
+def get_attribute_versions(instance: Any) -> Dict[str, int]:
+    """
+    Args:
+        instance (Any): The API instance.
+
+    Returns:
+        versions (Dict[str, int]): The version stamps of the attributes that have one, by attribute name.
+    """
+    return vars(instance).setdefault(STATE_VERSIONS_ATTRIBUTE, {})
+
+
+def get_attribute_version(instance: Any, attribute_name: str) -> int:
+    """
+    Args:
+        instance (Any): The API instance.
+        attribute_name (str): The name of the attribute.
+
+    Returns:
+        version (int): The version stamp of the attribute. A new stamp is given to attributes that do not have one.
+    """
+    versions = get_attribute_versions(instance)
+    version = versions.get(attribute_name)
+    if version is None:
+        version = versions[attribute_name] = next(_VERSION_COUNTER)
+    return version
+
+
+def get_attribute_hash(instance: Any, attribute_name: str) -> int:
+    """
+    Return the structural hash of an attribute. It is computed once per version of the attribute.
+
+    Args:
+        instance (Any): The API instance.
+        attribute_name (str): The name of the attribute.
+
+    Returns:
+        attribute_hash (int): The structural hash of the attribute (see `structural_hash`).
+    """
+    return _get_cached_attribute_hash(instance, attribute_name, STATE_HASHES_ATTRIBUTE, structural_hash)
+
+
+def state_hash(instance: Any) -> int:
+    """
+    Return the structural hash of the public state of an instance, i.e. of the attributes compared by `state_checker`.
+    Equal states have equal hashes. Only the attributes changed since the last call are hashed again.
+
+    Args:
+        instance (Any): The API instance.
+
+    Returns:
+        state_hash (int): The structural hash of the state.
+    """
+    return hash(
+        tuple(
+            (attribute_name, get_attribute_hash(instance, attribute_name))
+            for attribute_name in sorted(vars(instance))
+            if not attribute_name.startswith("_")
+        )
+    )
+
+
+def state_fingerprint(instance: Any) -> Optional[int]:
+    """
+    Return a fingerprint of the public state of an instance. Like `state_hash`, equal states have equal fingerprints,
+    but the fingerprint is also the same in every process, so it can be stored and compared later. Only the attributes
+    changed since the last call are hashed again.
+
+    Args:
+        instance (Any): The API instance.
+
+    Returns:
+        fingerprint (int): The fingerprint of the state, or None if the state holds values without a stable hash.
+    """
+    try:
+        return stable_structural_hash(
+            tuple(
+                (
+                    attribute_name,
+                    _get_cached_attribute_hash(
+                        instance, attribute_name, STATE_FINGERPRINTS_ATTRIBUTE, stable_structural_hash
+                    ),
+                )
+                for attribute_name in sorted(vars(instance))
+                if not attribute_name.startswith("_")
+            )
+        )
+    except _UnstableHashError:
+        return None
+
+
+def structural_hash(value: Any, hash_value: Callable[[Any], int] = hash) -> int:
+    """
+    Hash a piece of state. Values that are equal (`==`) have the same hash, including unhashable containers.
+    Objects can define a `_state_hash(hash_value)` method consistent with their `__eq__`, which hashes its state with
+    the given function. Random generators are hashed by their internal state.
+
+    Args:
+        value (Any): The value to hash.
+        hash_value (Callable[[Any], int]): The hash used for the values that are not containers. Defaults to `hash`.
+
+    Returns:
+        value_hash (int): The structural hash of the value.
+    """
+    if type(value) is str:
+        return hash_value(value)
+    if isinstance(value, dict):
+        return hash(
+            frozenset(
+                (structural_hash(key, hash_value), structural_hash(item, hash_value))
+                for key, item in value.items()
+            )
+        )
+    if isinstance(value, (list, tuple)):
+        return hash(tuple(structural_hash(item, hash_value) for item in value))
+    if isinstance(value, (set, frozenset)):
+        return hash(frozenset(structural_hash(item, hash_value) for item in value))
+    state_hash_method = getattr(value, "_state_hash", None)
+    if state_hash_method is not None:
+        return state_hash_method(functools.partial(structural_hash, hash_value=hash_value))
+    if isinstance(value, random.Random):
+        version, internal_state, gauss_next = value.getstate()
+        # The internal state is a long tuple of ints, whose hash does not depend on the process
+        return hash((structural_hash((version, gauss_next), hash_value), hash(internal_state)))
+    try:
+        return hash_value(value)
+    except TypeError:
+        # Unknown unhashable object: a constant hash is always consistent with `==`
+        return 0
+
+
+def stable_structural_hash(value: Any) -> int:
+    """
+    Same as `structural_hash`, but the hash does not depend on the process (strings are not hashed with the salted
+    `hash`). Raises `_UnstableHashError` for values that have no such hash.
+    """
+    return structural_hash(value, _stable_hash)
+
+
+@functools.lru_cache(maxsize=None)
+def get_touched_attributes(class_: type, method_name: str) -> Optional[FrozenSet[str]]:
+    """
+    Find the instance attributes a method of an API class may read or mutate, including through the other methods it
+    calls on `self`. Private attributes that are not independent (see `INDEPENDENT_PRIVATE_ATTRIBUTES`) may alias
+    other attributes, so touching one of them touches the whole state. Classes can declare such aliases explicitly with
+    a `_state_aliases` mapping of private attribute to the attributes it refers into.
+
+    Args:
+        class_ (type): The API class.
+        method_name (str): The name of the method.
+
+    Returns:
+        attribute_names (FrozenSet[str]): The touched attributes, or None if they cannot be determined, in which case
+            every attribute must be considered touched.
+    """
+    method_tables = _get_class_method_asts(class_)
+    if method_tables is None or method_name not in method_tables:
+        return None
+
+    state_aliases: Dict[str, Iterable[str]] = getattr(class_, "_state_aliases", {})
+    touched = set()
+    visited = set()
+    pending = [method_name]
+    while pending:
+        current = pending.pop()
+        if current in visited:
+            continue
+        visited.add(current)
+        accessed = _get_self_accesses(method_tables[current])
+        if accessed is None:
+            return None
+        for attribute_name in accessed:
+            if attribute_name in method_tables:
+                pending.append(attribute_name)
+            elif attribute_name.startswith("_") and attribute_name not in INDEPENDENT_PRIVATE_ATTRIBUTES:
+                if attribute_name not in state_aliases:
+                    return None
+                touched.add(attribute_name)
+                touched.update(state_aliases[attribute_name])
+            else:
+                touched.add(attribute_name)
+    return frozenset(touched)
+
+
+def copy_state_tracking(instance: Any, forked_instance: Any) -> None:
+    """Give a fork its own copy of the version stamps of the source instance."""
+    instance_vars = vars(instance)
+    forked_vars = vars(forked_instance)
+    for attribute_name in (STATE_VERSIONS_ATTRIBUTE, STATE_HASHES_ATTRIBUTE, STATE_FINGERPRINTS_ATTRIBUTE):
+        if attribute_name in instance_vars:
+            forked_vars[attribute_name] = dict(instance_vars[attribute_name])
+
+
+class _UnstableHashError(Exception):
+    """Raised when a value has no hash that is the same in every process."""
+
+
+def _stable_hash(value: Any) -> int:
+    if isinstance(value, str):
+        value = value.encode("utf-8", "surrogatepass")
+    if isinstance(value, bytes):
+        return int.from_bytes(hashlib.blake2b(value, digest_size=8).digest(), "little", signed=True)
+    if value is None:
+        return 0
+    if isinstance(value, (bool, int, float)) and value == value:
+        # Numbers hash the same in every process, except NaN whose hash depends on the object
+        return hash(value)
+    raise _UnstableHashError(f"{type(value).__name__} values have no stable hash.")
+
+
+def _get_valid_hashes(instance: Any, cache_attribute_name: str, version: int) -> Dict[str, tuple]:
+    """Return the cached hashes of an instance that match the current stamps, moved to the given stamp."""
+    versions = vars(instance).get(STATE_VERSIONS_ATTRIBUTE) or {}
+    return {
+        attribute_name: (version, attribute_hash)
+        for attribute_name, (cached_version, attribute_hash) in vars(instance).get(cache_attribute_name, {}).items()
+        if versions.get(attribute_name) == cached_version
+    }
+
+
+def _get_cached_attribute_hash(
+    instance: Any, attribute_name: str, cache_attribute_name: str, hash_function: Callable[[Any], int]
+) -> int:
+    version = get_attribute_version(instance, attribute_name)
+    hashes = vars(instance).setdefault(cache_attribute_name, {})
+    cached = hashes.get(attribute_name)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    attribute_hash = hash_function(getattr(instance, attribute_name))
+    hashes[attribute_name] = (version, attribute_hash)
+    return attribute_hash
+
+
+@functools.lru_cache(maxsize=None)
+def _get_class_method_asts(class_: type) -> Optional[Dict[str, ast.FunctionDef]]:
+    try:
+        source = textwrap.dedent(inspect.getsource(class_))
+    except (OSError, TypeError):
+        return None
+    class_node = ast.parse(source).body[0]
+    return {
+        node.name: node
+        for node in class_node.body
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    }
+
+
+def _get_self_accesses(method_node: ast.FunctionDef) -> Optional[FrozenSet[str]]:
+    """
+    Return the names accessed as `self.<name>` in a method, or None if `self` is used in any other way (e.g. passed to
+    a function or to `vars`), since then any attribute may be touched.
+    """
+    if not method_node.args.args:
+        return None
+    self_name = method_node.args.args[0].arg
+    accessed = set()
+    attribute_values = set()
+    for node in ast.walk(method_node):
+        if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+            if node.value.id == self_name:
+                accessed.add(node.attr)
+                attribute_values.add(id(node.value))
+    for node in ast.walk(method_node):
+        if isinstance(node, ast.Name) and node.id == self_name and id(node) not in attribute_values:
+            return None
+    return frozenset(accessed)
@@ -0,0 +1,351 @@
+import logging
+import random
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional
+
+from bfcl_env.state_fork import copy_state, fork_instance
+from bfcl_env.state_tracking import (
+    STATE_FINGERPRINTS_ATTRIBUTE,
+    STATE_HASHES_ATTRIBUTE,
+    STATE_VERSIONS_ATTRIBUTE,
+    get_attribute_hash,
+    mark_attributes_dirty,
+    state_hash,
+)
+
+logger = logging.getLogger(__name__)
+
+# Instance attributes used by `bfcl_env.state_tracking`
+_TRACKING_ATTRIBUTES = (STATE_VERSIONS_ATTRIBUTE, STATE_HASHES_ATTRIBUTE, STATE_FINGERPRINTS_ATTRIBUTE)
+
+# Private attributes that never change the outcome of a call
+_IGNORED_PRIVATE_ATTRIBUTES = {"_api_description", *_TRACKING_ATTRIBUTES}
+
+
+class StepOutcome(NamedTuple):
+    """
+    The outcome of one call on an API instance.
+
+    Attributes:
+        execution_result (str): The formatted result of the call.
+        instance (Any): A snapshot of the instance after the call. It is shared by every caller and must never be
+            mutated.
+    """
+
+    execution_result: str
+    instance: Any
+
+
+class StepCache:
+    """
+    Process-wide transposition table of the calls executed on API instances.
+
+    Rollouts of the same entry often issue the same calls from the same state (e.g. `authenticate_travel` then
+    `get_flight_cost`). The first time, the call is executed and its result is stored with a snapshot of the instance
+    after the call. Afterwards, a call from an equal state gets the stored result and the instance is moved to the
+    stored state without executing anything.
+
+    The key is `(class_name, is_augmented, method_name, call, state)`, where `call` is the normalized arguments of the
+    call and `state` the structural hash of the public state (see `bfcl_env.state_tracking.state_hash`) together with
+    a key of the private state (the random generator, or what an API class returns from `_private_state_key()`). Since
+    the state is compared by hash, a verification mode executes again a sample of the hits on a fork of the instance
+    and checks that the result and the state after the call match the stored ones. Entries are evicted in
+    least-recently-used order. The cache can be used from several threads.
+
+    Calls are assumed to depend only on the instance and their arguments. A few methods also read the clock (e.g. the
+    age check of `TravelAPI.book_flight`) or module-level data, their cached outcome is the one of the first call.
+
+    Counters:
+        num_hits (int): Number of calls answered from the cache.
+        num_misses (int): Number of calls executed and stored.
+        num_uncacheable (int): Number of calls executed without the cache (arguments that cannot be normalized, or
+            calls that raised).
+        num_verified (int): Number of hits executed again to verify them.
+        num_mismatches (int): Number of verified hits whose stored outcome was wrong.
+        num_evicted (int): Number of entries evicted because the cache was full.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = 16384,
+        verify_rate: float = 0.0,
+        seed: int = 0,
+        enabled: bool = False,
+    ) -> None:
+        """
+        Args:
+            max_entries (int, optional): Maximum number of entries kept. Defaults to 16384, None for no limit.
+            verify_rate (float): Fraction of the hits executed again to verify them. Defaults to 0.0.
+            seed (int): Seed of the generator sampling the verified hits.
+            enabled (bool): Whether calls are cached. Disabled by default.
+        """
+        self.max_entries: Optional[int] = max_entries
+        self.verify_rate: float = verify_rate
+        self.enabled: bool = enabled
+        self._entries: "OrderedDict[Hashable, StepOutcome]" = OrderedDict()
+        self._random = random.Random(seed)
+        self.num_hits: int = 0
+        self.num_misses: int = 0
+        self.num_uncacheable: int = 0
+        self.num_verified: int = 0
+        self.num_mismatches: int = 0
+        self.num_evicted: int = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def execute(
+        self,
+        class_name: str,
+        instance: Any,
+        method: Callable,
+        args: tuple,
+        kwargs: dict,
+        touched_attributes: Optional[frozenset],
+        format_result: Callable[[Any], str],
+        is_augmented: bool = False,
+    ) -> str:
+        """
+        Execute a call on an instance, or move the instance to the stored state after the call.
+
+        Args:
+            class_name (str): The class name of the instance.
+            instance (Any): The API instance, updated in place.
+            method (Callable): The method called, unbound.
+            args (tuple): The positional arguments of the call. They must not be reused by the caller.
+            kwargs (dict): The keyword arguments of the call. They must not be reused by the caller.
+            touched_attributes (frozenset, optional): The attributes the method may change, see
+                `bfcl_env.state_tracking.get_touched_attributes`. None for every attribute.
+            format_result (Callable[[Any], str]): Formats the value returned by the method.
+            is_augmented (bool): Whether the instance comes from the augmented API classes.
+
+        Returns:
+            execution_result (str): The formatted result of the call. Exceptions raised by the method are propagated.
+        """
+        try:
+            call = (_normalize(args), _normalize(kwargs))
+        except TypeError:
+            call = None
+        if call is None:
+            with self._lock:
+                self.num_uncacheable += 1
+            return self._execute(instance, method, args, kwargs, touched_attributes, format_result)
+
+        key = (class_name, is_augmented, method.__name__, call, state_hash(instance), _private_state_key(instance))
+        with self._lock:
+            outcome = self._entries.get(key)
+            if outcome is not None:
+                self.num_hits += 1
+                self._entries.move_to_end(key)
+                verify = self.verify_rate > 0 and self._random.random() < self.verify_rate
+
+        if outcome is None:
+            try:
+                execution_result = self._execute(instance, method, args, kwargs, touched_attributes, format_result)
+            except Exception:
+                with self._lock:
+                    self.num_uncacheable += 1
+                raise
+            # The instance keeps changing, so the cache keeps a snapshot. It is hashed first, so that the instances
+            # restored from the snapshot do not hash the touched attributes again.
+            state_hash(instance)
+            outcome = StepOutcome(execution_result, fork_instance(instance))
+            with self._lock:
+                self.num_misses += 1
+                self._entries[key] = outcome
+                self._evict_if_needed()
+            return execution_result
+
+        if verify:
+            outcome = self._verify(key, outcome, instance, method, args, kwargs, touched_attributes, format_result)
+        _restore_instance(instance, outcome.instance, touched_attributes)
+        return outcome.execution_result
+
+    def clear(self) -> None:
+        """Drop every entry. The counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def configure(
+        self,
+        max_entries: Optional[int] = 16384,
+        verify_rate: float = 0.0,
+        seed: int = 0,
+        enabled: bool = False,
+    ) -> None:
+        """
+        Update the settings of the cache and drop entries that no longer fit.
+
+        Args:
+            max_entries (int, optional): Maximum number of entries kept. Defaults to 16384, None for no limit.
+            verify_rate (float): Fraction of the hits executed again to verify them.
+            seed (int): Seed of the generator sampling the verified hits.
+            enabled (bool): Whether calls are cached.
+        """
+        self.max_entries = max_entries
+        self.verify_rate = verify_rate
+        self.enabled = enabled
+        with self._lock:
+            self._random.seed(seed)
+        if not enabled:
+            self.clear()
+        with self._lock:
+            self._evict_if_needed()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns:
+            stats (Dict[str, Any]): The counters of the cache, the number of entries and the hit rate.
+        """
+        with self._lock:
+            num_lookups = self.num_hits + self.num_misses
+            return {
+                "entries": len(self._entries),
+                "num_hits": self.num_hits,
+                "num_misses": self.num_misses,
+                "num_uncacheable": self.num_uncacheable,
+                "num_verified": self.num_verified,
+                "num_mismatches": self.num_mismatches,
+                "num_evicted": self.num_evicted,
+                "hit_rate": self.num_hits / num_lookups if num_lookups else 0.0,
+            }
+
+    def _verify(
+        self,
+        key: Hashable,
+        outcome: StepOutcome,
+        instance: Any,
+        method: Callable,
+        args: tuple,
+        kwargs: dict,
+        touched_attributes: Optional[frozenset],
+        format_result: Callable[[Any], str],
+    ) -> StepOutcome:
+        """Execute a hit again on a fork of the instance, and replace the stored outcome if it does not match."""
+        forked_instance = fork_instance(instance)
+        try:
+            execution_result = self._execute(forked_instance, method, args, kwargs, touched_attributes, format_result)
+        except Exception as e:
+            execution_result = e
+        matches = execution_result == outcome.execution_result and _public_state(forked_instance) == _public_state(
+            outcome.instance
+        )
+        with self._lock:
+            self.num_verified += 1
+            if matches:
+                return outcome
+            self.num_mismatches += 1
+            if isinstance(execution_result, Exception):
+                # Not something that can be stored, the entry is dropped and the exception propagated
+                self._entries.pop(key, None)
+            else:
+                outcome = self._entries[key] = StepOutcome(execution_result, fork_instance(forked_instance))
+        logger.warning(f"Step cache mismatch for {key[0]}.{key[2]}, the stored outcome was replaced.")
+        if isinstance(execution_result, Exception):
+            raise execution_result
+        return outcome
+
+    @staticmethod
+    def _execute(
+        instance: Any,
+        method: Callable,
+        args: tuple,
+        kwargs: dict,
+        touched_attributes: Optional[frozenset],
+        format_result: Callable[[Any], str],
+    ) -> str:
+        try:
+            return format_result(method(instance, *args, **kwargs))
+        finally:
+            mark_attributes_dirty(instance, touched_attributes)
+
+    def _evict_if_needed(self) -> None:
+        if self.max_entries is None:
+            return
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.num_evicted += 1
+
+
+_STEP_CACHE = StepCache()
+
+
+def get_step_cache() -> StepCache:
+    """Return the process-wide step cache used by `execute_multi_turn_func_call`."""
+    return _STEP_CACHE
+
+
+def configure_step_cache(
+    max_entries: Optional[int] = 16384, verify_rate: float = 0.0, seed: int = 0, enabled: bool = False
+) -> StepCache:
+    """Update the settings of the process-wide step cache and return it."""
+    _STEP_CACHE.configure(max_entries=max_entries, verify_rate=verify_rate, seed=seed, enabled=enabled)
+    return _STEP_CACHE
+
+
+def _normalize(value: Any) -> Hashable:
+    """
+    Turn the arguments of a call into a hashable key. Values of different types never share a key (e.g. `1`, `1.0`
+    and `True`). Raises `TypeError` for values that cannot be normalized.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return (dict, frozenset((_normalize(key), _normalize(item)) for key, item in value.items()))
+    if value_type in (list, tuple):
+        return (value_type, tuple(_normalize(item) for item in value))
+    if value_type in (set, frozenset):
+        return (value_type, frozenset(_normalize(item) for item in value))
+    if value_type in (str, int, float, bool, type(None)):
+        return (value_type, value)
+    raise TypeError(f"{value_type.__name__} arguments cannot be normalized.")
+
+
+def _private_state_key(instance: Any) -> Hashable:
+    """
+    Return a key of the private state of an instance, which is not covered by `state_hash`. API classes whose private
+    attributes refer into their public state (see `_state_aliases`) provide it with a `_private_state_key()` method.
+    """
+    private_state_key_method = getattr(instance, "_private_state_key", None)
+    if private_state_key_method is not None:
+        return private_state_key_method()
+    return tuple(
+        (attribute_name, get_attribute_hash(instance, attribute_name))
+        for attribute_name in sorted(vars(instance))
+        if attribute_name.startswith("_") and attribute_name not in _IGNORED_PRIVATE_ATTRIBUTES
+    )
+
+
+def _public_state(instance: Any) -> Dict[str, Any]:
+    return {name: value for name, value in vars(instance).items() if not name.startswith("_")}
+
+
+def _restore_instance(instance: Any, snapshot: Any, touched_attributes: Optional[frozenset]) -> None:
+    """
+    Move an instance to the state of a snapshot, keeping its identity (it is referenced by the registry). The version
+    stamps and cached hashes of the snapshot are copied too, which is sound since the snapshot is never mutated.
+    """
+    instance_vars = vars(instance)
+    snapshot_vars = vars(snapshot)
+    if touched_attributes is None or hasattr(instance, "_fork"):
+        # The whole state is replaced, through the fork method of the class when it has one
+        instance_vars.clear()
+        instance_vars.update(vars(fork_instance(snapshot)))
+        return
+
+    # The other attributes were equal before the call, so only the touched ones are copied
+    memo = {}
+    for attribute_name in touched_attributes:
+        if attribute_name in snapshot_vars:
+            instance_vars[attribute_name] = copy_state(snapshot_vars[attribute_name], memo)
+        else:
+            instance_vars.pop(attribute_name, None)
+    for tracking_attribute_name in _TRACKING_ATTRIBUTES:
+        snapshot_tracking = snapshot_vars.get(tracking_attribute_name, {})
+        instance_tracking = instance_vars.setdefault(tracking_attribute_name, {})
+        for attribute_name in touched_attributes:
+            if attribute_name in snapshot_tracking:
+                instance_tracking[attribute_name] = snapshot_tracking[attribute_name]
+            else:
+                instance_tracking.pop(attribute_name, None)
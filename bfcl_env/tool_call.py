@@ -0,0 +1,74 @@
+import ast
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+
+@dataclass
+class ToolCall:
+    """
+    A decoded function call, e.g. `cd(folder='document')`.
+
+    Attributes:
+        name (str): The name of the called function.
+        arguments (Dict[str, Any]): The keyword arguments of the call.
+        positional_arguments (Tuple[Any, ...]): The positional arguments of the call. Only ground truth calls use them.
+    """
+
+    name: str
+    arguments: Dict[str, Any] = field(default_factory=dict)
+    positional_arguments: Tuple[Any, ...] = ()
+
+    def to_call_string(self) -> str:
+        """
+        Render the call as a Python call string, e.g. `cd(folder='document')`. Only used for logging and as a fallback
+        for code that still expects strings.
+        """
+        args = [repr(value) for value in self.positional_arguments]
+        args.extend(f"{key}={repr(value)}" for key, value in self.arguments.items())
+        return f"{self.name}({', '.join(args)})"
+
+    def __str__(self) -> str:
+        return self.to_call_string()
+
+
+def parse_call_string(call_string: str) -> Optional[ToolCall]:
+    """
+    Parse a call string such as `cd(folder='document')` or `sort('final_report.pdf')` into a ToolCall.
+
+    Args:
+        call_string (str): The call string to parse.
+
+    Returns:
+        tool_call (ToolCall): The parsed call, or None if the string is not a call to a plain function name with only
+            literal arguments (e.g. nested calls, attribute calls or `**kwargs`).
+    """
+    try:
+        node = ast.parse(call_string.lstrip(" \t"), mode="eval").body
+    except (SyntaxError, ValueError):
+        return None
+    if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Name):
+        return None
+
+    try:
+        positional_arguments = tuple(_literal_value(arg) for arg in node.args)
+        arguments = {}
+        for keyword in node.keywords:
+            # `**kwargs` or a repeated keyword argument
+            if keyword.arg is None or keyword.arg in arguments:
+                return None
+            arguments[keyword.arg] = _literal_value(keyword.value)
+    except (ValueError, TypeError):
+        return None
+
+    return ToolCall(
+        name=node.func.id,
+        arguments=arguments,
+        positional_arguments=positional_arguments,
+    )
+
+
+def _literal_value(node: ast.AST) -> Any:
+    if isinstance(node, ast.Constant):
+        return node.value
+    # Raises ValueError for anything that is not a literal, including `*args`
+    return ast.literal_eval(node)
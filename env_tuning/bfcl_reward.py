@@ -1,4 +1,7 @@
-from typing import Any, Dict, List
+from itertools import chain
+from typing import Any, Dict, List, Optional
+
+import numpy as np
 
 
 def _extract_seet_counterfactual_count(reward_scores: Dict[str, Any]) -> int:
@@ -17,6 +20,22 @@ def _extract_seet_counterfactual_count(reward_scores: Dict[str, Any]) -> int:
     return total
 
 
+def _extract_seet_peer_counts(reward_scores: Dict[str, Any]) -> Dict[str, int]:
+    """从 rollout 奖励字典中统计 SEET Peer 锚点的提示次数，以及由此省下的重试与答对的轮次。"""
+    counts = {"seet_peer_hint_count": 0, "seet_peer_saved_retry_count": 0, "seet_peer_saved_turn_count": 0}
+    metrics_per_turn = reward_scores.get("interaction_turn_metrics", [])
+    if not isinstance(metrics_per_turn, list):
+        return counts
+
+    for turn_metrics in metrics_per_turn:
+        if not isinstance(turn_metrics, dict):
+            continue
+        counts["seet_peer_hint_count"] += bool(turn_metrics.get("seet_peer_hint"))
+        counts["seet_peer_saved_retry_count"] += bool(turn_metrics.get("seet_peer_saved_retry"))
+        counts["seet_peer_saved_turn_count"] += bool(turn_metrics.get("seet_peer_saved_turn"))
+    return counts
+
+
 def compute_score(
     reward_scores: Dict[str, List[float]],
     ground_truth: List[List],
@@ -67,6 +86,7 @@ def compute_score(
         "progress": progress,
         "seet_slow_loop_bonus": seet_slow_loop_bonus,
         "seet_counterfactual_count": seet_counterfactual_count,
+        **_extract_seet_peer_counts(reward_scores),
         "total_interaction_rounds": total_interaction_rounds,
         "format_reward": format_reward,
         "tool_call_reward": tool_call_reward,
@@ -74,3 +94,72 @@ def compute_score(
         "tool_round_diff": tool_round_diff,
         "tool_rel_diff": tool_rel_diff,
     }
+
+
+def compute_score_batch(
+    reward_scores: List[Dict[str, List[float]]],
+    ground_truths: List[List],
+    extra_infos: Optional[List[Any]] = None,
+    seet_slow_loop_coef: float = 0.05,
+    seet_slow_loop_cap: float = 0.3,
+    **kwargs,
+) -> List[Dict[str, Any]]:
+    """
+    BFCL 奖励函数的批量版本，对每个样本的结果与 compute_score 相同。
+
+    中文注释：整批样本的 user_turn_rewards 拼接成一个数组，按样本下标用 np.bincount 一次统计各类轮次，
+    score 与各项指标在整批上向量化计算；只有 SEET 指标需要逐条读取每轮的 metrics 字典。
+    配合 reward_model.reward_kwargs.batched=True 使用。
+    """
+    num_samples = len(reward_scores)
+    turn_rewards = [sample_reward_scores.get("user_turn_rewards", []) for sample_reward_scores in reward_scores]
+    num_rounds = np.fromiter((len(rewards) for rewards in turn_rewards), dtype=np.int64, count=num_samples)
+    flat_rewards = np.fromiter(chain.from_iterable(turn_rewards), dtype=np.float64, count=int(num_rounds.sum()))
+    sample_ids = np.repeat(np.arange(num_samples), num_rounds)
+
+    def count(mask: np.ndarray) -> np.ndarray:
+        return np.bincount(sample_ids[mask], minlength=num_samples)
+
+    def safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+        return np.divide(numerator, denominator, out=np.zeros(num_samples), where=denominator > 0)
+
+    # ---------------- 基础信息 ----------------
+    relevant_mask = (flat_rewards == 0) | (flat_rewards == 1)
+    relevant_sum = np.bincount(sample_ids, weights=np.where(relevant_mask, flat_rewards, 0.0), minlength=num_samples)
+    progress = safe_divide(relevant_sum, count(relevant_mask))
+
+    # ----------------- 工具轮指标 -----------------
+    correct_tool_call = count(flat_rewards == -1)
+    error_tool_call = count(flat_rewards == -2)
+    error_format = count(flat_rewards == -3)
+    golden_tool_rounds = np.fromiter((len(ground_truth or []) for ground_truth in ground_truths), dtype=np.int64, count=num_samples)
+    tool_round_diff = correct_tool_call - golden_tool_rounds
+    tool_rel_diff = np.abs(tool_round_diff) / np.maximum(1, golden_tool_rounds)
+
+    num_tool_calls = correct_tool_call + error_tool_call
+    is_tool_call = (num_tool_calls > 0).astype(np.float64)
+    format_reward = safe_divide(num_rounds - error_format, num_rounds)
+    tool_call_reward = safe_divide(correct_tool_call, num_tool_calls)
+
+    # ----------------- SEET 慢通道加成 -----------------
+    seet_counterfactual_count = np.fromiter(
+        (_extract_seet_counterfactual_count(sample_reward_scores) for sample_reward_scores in reward_scores), dtype=np.int64, count=num_samples
+    )
+    seet_slow_loop_bonus = np.minimum(seet_slow_loop_cap, seet_counterfactual_count * seet_slow_loop_coef)
+    final_score = np.minimum(1.0, progress + seet_slow_loop_bonus)
+    seet_peer_counts = [_extract_seet_peer_counts(sample_reward_scores) for sample_reward_scores in reward_scores]
+
+    columns = {
+        "score": final_score.tolist(),
+        "progress": progress.tolist(),
+        "seet_slow_loop_bonus": seet_slow_loop_bonus.tolist(),
+        "seet_counterfactual_count": seet_counterfactual_count.tolist(),
+        **{key: [counts[key] for counts in seet_peer_counts] for key in _extract_seet_peer_counts({})},
+        "total_interaction_rounds": num_rounds.tolist(),
+        "format_reward": format_reward.tolist(),
+        "tool_call_reward": tool_call_reward.tolist(),
+        "is_tool_call": is_tool_call.tolist(),
+        "tool_round_diff": tool_round_diff.tolist(),
+        "tool_rel_diff": tool_rel_diff.tolist(),
+    }
+    return [{key: values[i] for key, values in columns.items()} for i in range(num_samples)]
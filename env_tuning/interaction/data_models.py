@@ -14,6 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import Counter
 from dataclasses import dataclass, asdict, field
 from typing import Dict, List, Optional, Any
 from enum import Enum
@@ -34,6 +35,7 @@ class ResponseData:
     is_valid: bool
     error_message: Optional[str] = None
     has_error: bool = False
+    tool_calls: Optional[List[Any]] = None
 
 
 @dataclass
@@ -58,19 +60,29 @@ class InstanceState:
     involved_instances: Dict[str, Any]
     total_turns: int
 
+    entry_id: str = ""
     current_turn_index: int = 0
     current_turn_attempt_counts: int = 0
 
     all_turn_model_execution_results: List[Any] = field(default_factory=list)
+    # all_turn_model_execution_results 中每个结果的出现次数，随其增量维护，使每轮的响应检查只与本轮 ground truth 结果数相关
+    all_turn_model_execution_result_counts: Counter = field(default_factory=Counter)
     single_turn_model_execution_results: List[Any] = field(default_factory=list)
     single_turn_model_response_decode_list: List[Any] = field(default_factory=list)
     seet_counterfactual_records: List[Dict[str, Any]] = field(default_factory=list)
+    # SEET Peer 锚点统计：上一次快通道提示是否基于同组 rollout 的 Peer 锚点，以及本轮是否用过 Peer 锚点
+    seet_peer_hint_pending: bool = False
+    seet_peer_hinted_turn: bool = False
+    # ground truth 回放器（bfcl_env.ground_truth_oracle.GroundTruthReplay），由 ScoreCalculator 创建
+    ground_truth_replay: Optional[Any] = None
 
     def reset_single_turn_buffers(self) -> None:
         """在进入下一轮对话时调用，清空本轮缓存。"""
         self.single_turn_model_execution_results.clear()
         self.single_turn_model_response_decode_list.clear()
         self.current_turn_attempt_counts = 0
+        self.seet_peer_hint_pending = False
+        self.seet_peer_hinted_turn = False
 
     def add_exec_results(self, results: List[Any]) -> None:
         """本轮执行完，把结果加入缓存。"""
@@ -82,6 +94,7 @@ class InstanceState:
         在进入下一轮、或对当前轮做评测时调用。
         """
         self.all_turn_model_execution_results.extend(self.single_turn_model_execution_results)
+        self.all_turn_model_execution_result_counts.update(self.single_turn_model_execution_results)
         self.single_turn_model_execution_results.clear()
 
     def pop_seet_counterfactual_records(self) -> List[Dict[str, Any]]:
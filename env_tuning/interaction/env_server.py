@@ -0,0 +1,301 @@
+# Copyright 2025 ModelBest Inc. and/or its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import functools
+import multiprocessing
+import pickle
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+# 服务端允许远程调用的交互步骤（均为 MultiTurnFunctionCallInteraction 的同步步骤方法）
+SERVED_STEPS = frozenset({"_start_interaction_step", "_generate_response_step", "_release_instance"})
+
+# 一条 RPC 消息：(方法名, 位置参数, 关键字参数)；方法名为 None 时查询服务端指标
+Message = Tuple[Optional[str], tuple, Dict[str, Any]]
+# 一条 RPC 回复：(是否成功, 返回值或异常)
+Reply = Tuple[bool, Any]
+
+
+@dataclass
+class EnvServerConfig:
+    """环境服务配置（默认关闭，即环境状态保存在 rollout 进程内）。"""
+
+    enabled: bool = False
+    # 本地环境进程数；交互实例按分片键固定到其中一个进程
+    num_workers: int = 4
+    # 单个批次的最大消息数；同一事件循环轮次内发往同一分片的消息合并为一个批次
+    max_batch_size: int = 64
+    # 进程启动方式；rollout 进程中已有 CUDA 上下文与线程，默认使用 spawn
+    start_method: str = "spawn"
+
+
+class EnvServerClient:
+    """
+    多进程环境服务的客户端（本地 RPC）。
+
+    启动 num_workers 个本地进程，每个进程持有一个独立的 MultiTurnFunctionCallInteraction，
+    负责环境加载、工具执行与状态比对；rollout 进程只保留实例到分片的映射。
+    交互实例在第一条消息时按分片键（默认实例ID，交互中使用条目ID，使同一条目的 rollout
+    共享场景模板缓存与 SEET 锚点）固定到一个进程，直到 release 为止。
+
+    同一事件循环轮次内发往同一分片的消息合并为一个批次，经 Pipe 一次往返；每个分片
+    同一时刻只有一个批次在途，批次内按提交顺序执行，因此同一实例的步骤严格有序。
+    """
+
+    def __init__(
+        self,
+        interaction_config: Dict[str, Any],
+        num_workers: int = 4,
+        max_batch_size: int = 64,
+        start_method: str = "spawn",
+    ):
+        _check_replay_buffer_owner(interaction_config)
+        self.num_workers = num_workers
+        self.max_batch_size = max_batch_size
+
+        # 环境进程内的交互只在本进程执行步骤
+        worker_config = dict(interaction_config)
+        worker_config["env_server"] = {"enabled": False}
+        worker_config["step_executor"] = {"enabled": False}
+
+        context = multiprocessing.get_context(start_method)
+        self._connections = []
+        self._processes = []
+        for shard in range(num_workers):
+            connection, worker_connection = context.Pipe()
+            process = context.Process(
+                target=_serve_env_shard,
+                args=(worker_config, worker_connection),
+                name=f"env-server-{shard}",
+                daemon=True,
+            )
+            process.start()
+            worker_connection.close()
+            self._connections.append(connection)
+            self._processes.append(process)
+
+        # 每个分片一个单线程通道：阻塞的 send/recv 不占用事件循环，且批次按提交顺序往返
+        self._channels: List[ThreadPoolExecutor] = [
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"env-server-channel-{shard}")
+            for shard in range(num_workers)
+        ]
+        self._pending: List[List[Tuple[Message, asyncio.Future]]] = [[] for _ in range(num_workers)]
+        self._shards: Dict[str, int] = {}
+
+        # 指标
+        self.num_messages = 0
+        self.num_batches = 0
+        self.peak_batch_size = 0
+
+    @classmethod
+    def from_config(
+        cls, config: EnvServerConfig, interaction_config: Dict[str, Any]
+    ) -> Optional["EnvServerClient"]:
+        """按配置启动环境服务；未启用时返回 None。"""
+        if not config.enabled:
+            return None
+        return cls(
+            interaction_config,
+            num_workers=config.num_workers,
+            max_batch_size=config.max_batch_size,
+            start_method=config.start_method,
+        )
+
+    async def call(
+        self,
+        instance_id: str,
+        step_name: str,
+        args: tuple = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+        shard_key: Optional[str] = None,
+    ) -> Any:
+        """
+        在实例所在的环境进程中执行一个交互步骤并等待结果
+
+        Args:
+            instance_id: 交互实例ID
+            step_name: 步骤方法名，见 SERVED_STEPS
+            args: 位置参数
+            kwargs: 关键字参数
+            shard_key: 分片键，仅在实例的第一条消息时生效；默认使用实例ID
+
+        Returns:
+            Any: 步骤的返回值（环境进程中的异常会在此抛出）
+        """
+        shard = self._shards.get(instance_id)
+        if shard is None:
+            shard = self._shards[instance_id] = _get_shard(shard_key or instance_id, self.num_workers)
+        return await self._submit(shard, (step_name, args, kwargs or {}))
+
+    def release(self, instance_id: str) -> None:
+        """解除实例与分片的绑定（在实例最后一个步骤之后调用）。"""
+        self._shards.pop(instance_id, None)
+
+    async def metrics(self) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict[str, Any]: 批处理指标，以及各环境进程中实例注册表、场景模板缓存、ground truth oracle 与工具调用置换表的统计
+        """
+        shard_metrics = await asyncio.gather(
+            *(self._submit(shard, (None, (), {})) for shard in range(self.num_workers))
+        )
+        return {
+            "num_workers": self.num_workers,
+            "pinned_instances": len(self._shards),
+            "num_messages": self.num_messages,
+            "num_batches": self.num_batches,
+            "mean_batch_size": self.num_messages / self.num_batches if self.num_batches else 0.0,
+            "peak_batch_size": self.peak_batch_size,
+            "shards": list(shard_metrics),
+        }
+
+    def shutdown(self) -> None:
+        """通知所有环境进程退出并等待其结束。"""
+        for connection in self._connections:
+            try:
+                connection.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=10)
+            if process.is_alive():
+                process.terminate()
+        for channel in self._channels:
+            channel.shutdown(wait=False)
+        for connection in self._connections:
+            connection.close()
+
+    async def _submit(self, shard: int, message: Message) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending[shard]
+        pending.append((message, future))
+        if len(pending) >= self.max_batch_size:
+            self._flush(shard)
+        elif len(pending) == 1:
+            # 等到本轮事件循环中其余协程也提交完消息后再发送
+            loop.call_soon(self._flush, shard)
+        return await future
+
+    def _flush(self, shard: int) -> None:
+        batch = self._pending[shard]
+        if not batch:
+            return
+        self._pending[shard] = []
+        self.num_messages += len(batch)
+        self.num_batches += 1
+        self.peak_batch_size = max(self.peak_batch_size, len(batch))
+
+        messages = [message for message, _ in batch]
+        futures = [future for _, future in batch]
+        loop = asyncio.get_running_loop()
+        exchange = loop.run_in_executor(self._channels[shard], self._exchange, shard, messages)
+        exchange.add_done_callback(functools.partial(_resolve_batch, futures))
+
+    def _exchange(self, shard: int, messages: List[Message]) -> List[Reply]:
+        connection = self._connections[shard]
+        connection.send(messages)
+        return connection.recv()
+
+
+def _check_replay_buffer_owner(interaction_config: Dict[str, Any]) -> None:
+    """
+    每个环境进程各有一个 SEET 运行时。回放池持久化到文件时，文件必须只有一个写入方：
+    各进程各自追加写并压缩重写同一文件会互相覆盖锚点，因此要求由 Ray 共享锚点库（集群内唯一的服务端）持有文件。
+    """
+    seet_config = interaction_config.get("seet", {})
+    if not (
+        seet_config.get("enabled", False)
+        and seet_config.get("persist_replay_buffer_on_update", False)
+        and seet_config.get("replay_buffer_path", "")
+    ):
+        return
+    anchor_store_config = seet_config.get("anchor_store", {})
+    if not anchor_store_config.get("enabled", False) or anchor_store_config.get("backend", "ray") != "ray":
+        raise ValueError(
+            "seet.persist_replay_buffer_on_update with env_server requires seet.anchor_store with the ray backend, "
+            "so that a single process owns the replay buffer file."
+        )
+
+
+def _get_shard(shard_key: str, num_workers: int) -> int:
+    # 稳定哈希：不受 PYTHONHASHSEED 影响
+    return zlib.crc32(shard_key.encode("utf-8")) % num_workers
+
+
+def _resolve_batch(futures: List[asyncio.Future], exchange: asyncio.Future) -> None:
+    if exchange.cancelled():
+        replies: List[Reply] = [(False, asyncio.CancelledError())] * len(futures)
+    elif exchange.exception() is not None:
+        # 环境进程异常退出或通道断开：整个批次失败
+        replies = [(False, exchange.exception())] * len(futures)
+    else:
+        replies = exchange.result()
+    for future, (ok, value) in zip(futures, replies):
+        if future.done():
+            continue
+        if ok:
+            future.set_result(value)
+        else:
+            future.set_exception(value)
+
+
+def _serve_env_shard(interaction_config: Dict[str, Any], connection) -> None:
+    """环境进程主循环：逐批接收消息，按顺序执行并回复，直到收到 None。"""
+    from bfcl_env.ground_truth_oracle import get_ground_truth_oracle
+    from bfcl_env.instance_registry import get_instance_registry
+    from bfcl_env.scenario_cache import get_scenario_cache
+    from bfcl_env.step_cache import get_step_cache
+
+    from .new_multi_turn_fc import MultiTurnFunctionCallInteraction
+
+    interaction = MultiTurnFunctionCallInteraction(interaction_config)
+    while True:
+        try:
+            messages = connection.recv()
+        except EOFError:
+            break
+        if messages is None:
+            break
+
+        replies: List[Reply] = []
+        for step_name, args, kwargs in messages:
+            try:
+                if step_name is None:
+                    result = {
+                        "instance_registry": get_instance_registry().stats(),
+                        "scenario_cache": get_scenario_cache().stats(),
+                        "ground_truth_oracle": get_ground_truth_oracle().stats(),
+                        "step_cache": get_step_cache().stats(),
+                    }
+                elif step_name in SERVED_STEPS:
+                    result = getattr(interaction, step_name)(*args, **kwargs)
+                else:
+                    raise ValueError(f"Step {step_name} is not served by the env server.")
+                replies.append((True, result))
+            except Exception as e:
+                replies.append((False, _picklable_exception(e)))
+        connection.send(replies)
+    connection.close()
+
+
+def _picklable_exception(error: Exception) -> Exception:
+    try:
+        pickle.loads(pickle.dumps(error))
+        return error
+    except Exception:
+        return RuntimeError(f"{type(error).__name__}: {error}")
@@ -18,8 +18,7 @@ import json
 from typing import List, Any, Tuple, Optional
 from .data_models import InstanceState, ExecutionResult
 from .utils import (
-    parse_tool_calls,
-    default_decode_execute_prompting,
+    tool_calls_from_json,
     is_empty_execute_response,
     has_execution_error,
 )
@@ -37,12 +36,11 @@ class ExecutionManager:
         entry_id: str,
         predecoded_responses: Optional[List[Any]] = None,
     ) -> ExecutionResult:
-        """执行函数调用。"""
+        """执行函数调用；predecoded_responses 为已解码的 ToolCall 列表时不再重复解析。"""
         try:
             decoded_responses = predecoded_responses
             if decoded_responses is None:
-                model_responses = parse_tool_calls(tool_content)
-                decoded_responses = default_decode_execute_prompting(model_responses)
+                decoded_responses = self.decode_tool_calls(tool_content)
 
             if is_empty_execute_response(decoded_responses):
                 return ExecutionResult(
@@ -108,10 +106,9 @@ class ExecutionManager:
         return user_hint, score
 
     def decode_tool_calls(self, tool_content: str) -> List[Any]:
-        """仅做工具调用解码，不执行。"""
+        """仅做工具调用解码（JSON -> ToolCall），不执行。"""
         try:
-            model_responses = parse_tool_calls(tool_content)
-            return default_decode_execute_prompting(model_responses)
+            return tool_calls_from_json(json.loads(tool_content))
         except Exception:
             return []
 
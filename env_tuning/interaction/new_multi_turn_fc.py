@@ -14,18 +14,27 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import json
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from uuid import uuid4
 
 from verl.interactions.base import BaseInteraction
-from bfcl_env.multi_turn_utils import execute_multi_turn_func_call
+from bfcl_env.ground_truth_oracle import configure_ground_truth_oracle
+from bfcl_env.instance_registry import configure_instance_registry
+from bfcl_env.multi_turn_utils import execute_multi_turn_func_call, release_multi_turn_instances
+from bfcl_env.scenario_cache import configure_scenario_cache
+from bfcl_env.step_cache import configure_step_cache
+from bfcl_env.tool_call import parse_call_string
 
 from .data_models import InstanceState, ResponseData, ResponseType, ExecutionResult
 from .response_handler import ResponseHandler
 from .execution_manager import ExecutionManager
 from .score_calculator import ScoreCalculator
 from .turn_manager import TurnManager
+from .utils import RESPONSE_STOP_SEQUENCES
+from .step_executor import InteractionStepExecutor, StepExecutorConfig
+from .env_server import EnvServerClient, EnvServerConfig
 from env_tuning.seet import SeetConfig, SeetRuntime
 
 
@@ -38,24 +47,61 @@ class MultiTurnFunctionCallInteraction(BaseInteraction):
         self._instance_dict: Dict[str, InstanceState] = {}
         self.max_step_limit = 5
 
-        # SEET 运行时（可选）
+        # 环境实例注册表上限（可选）：max_instances / max_bytes
+        self.instance_registry = configure_instance_registry(**config.get("instance_registry", {}))
+        # 场景模板缓存：同一条目的多个 rollout 从缓存模板 fork，不再重复加载（可选：enabled / max_templates）
+        self.scenario_cache = configure_scenario_cache(**config.get("scenario_cache", {}))
+        # ground truth oracle：同一条目各轮 ground truth 的执行结果与状态指纹只计算一次，跨 rollout 与 epoch 复用（可选：enabled / max_records / path）
+        self.ground_truth_oracle = configure_ground_truth_oracle(**config.get("ground_truth_oracle", {}))
+        # 工具调用置换表（默认关闭）：同组 rollout 在相同状态下发出相同调用时直接取缓存的结果与调用后状态（可选：enabled / max_entries / verify_rate / seed）
+        self.step_cache = configure_step_cache(**config.get("step_cache", {}))
+
+        # 交互步骤执行器（可选）：启用后环境加载、工具执行与状态比对在工作线程中进行，不阻塞事件循环
+        self.step_executor = InteractionStepExecutor.from_config(
+            StepExecutorConfig(**config.get("step_executor", {}))
+        )
+        # 环境服务（可选）：启用后环境状态与交互步骤托管在本地多进程中，按条目ID分片，优先于步骤执行器
+        self.env_server = EnvServerClient.from_config(EnvServerConfig(**config.get("env_server", {})), config)
+
+        # SEET 运行时（可选）；启用环境服务时交互步骤都在环境进程中执行，由各环境进程自己的运行时负责，本进程不再创建
         self.seet_config = SeetConfig(**config.get("seet", {}))
-        self.seet_runtime = SeetRuntime(self.seet_config) if self.seet_config.enabled else None
+        self.seet_runtime = (
+            SeetRuntime(self.seet_config) if self.seet_config.enabled and self.env_server is None else None
+        )
+
+        # 生成终止条件（默认关闭），由 rollout 在每次引擎调用时应用：stop_at_response_tag=true 时在 </tool_call> / </answer>
+        # 处停止生成；也可直接配置 stop / stop_token_ids。
+        # 注意：终止字符串在输出的任意位置都会匹配，包括 <think> 内部。思考中提到闭合标签的响应会在 </think> 之前被截断，
+        # 判为格式错误，而不开启时这类响应是合法的，因此开启会改变奖励，需在对应阶段的数据上评估后再按阶段开启。
+        default_stop = RESPONSE_STOP_SEQUENCES if config.get("stop_at_response_tag", False) else []
+        self.stop = list(config.get("stop", default_stop))
+        self.stop_token_ids = list(config.get("stop_token_ids", []))
 
         self.response_handler = ResponseHandler()
         self.execution_manager = ExecutionManager()
         self.score_calculator = ScoreCalculator()
         self.turn_manager = TurnManager(self.score_calculator)
 
+    def get_stop_sequences(self) -> Dict[str, List[Any]]:
+        """助手回合的生成终止条件。"""
+        return {"stop": self.stop, "stop_token_ids": self.stop_token_ids}
+
     async def start_interaction(self, instance_id: Optional[str] = None, **kwargs) -> str:
         """创建交互实例。"""
         if instance_id is None:
             instance_id = str(uuid4())
+        return await self._run_step(instance_id, self._start_interaction_step, instance_id, **kwargs)
 
+    def _start_interaction_step(self, instance_id: str, **kwargs) -> str:
+        """加载环境并创建交互状态。"""
         entry_id: str = kwargs["id"]
-        initial_config: Dict[str, Any] = json.loads(kwargs["initial_config"])
+        initial_config: Dict[str, Any] = _decode_initial_config(kwargs["initial_config"])
         involved_classes: Dict[str, Any] = kwargs["involved_classes"]
-        ground_truth: List[Any] = kwargs["ground_truth"]
+        # ground truth 在此一次性解析为 ToolCall，后续执行与 SEET 比对不再重复解析
+        ground_truth: List[Any] = [
+            [parse_call_string(call) or call for call in turn_ground_truth]
+            for turn_ground_truth in kwargs["ground_truth"]
+        ]
         processed_question: List[str] = kwargs["processed_question"]
         question: List[str] = kwargs["question"]
 
@@ -69,17 +115,7 @@ class MultiTurnFunctionCallInteraction(BaseInteraction):
             is_evaL_run=False,
         )
 
-        execute_multi_turn_func_call(
-            [],
-            initial_config,
-            involved_classes,
-            instance_id + "_ground_truth",
-            entry_id,
-            long_context=("long_context" in entry_id or "composite" in entry_id),
-            is_evaL_run=True,
-        )
-
-        self._instance_dict[instance_id] = InstanceState(
+        state = InstanceState(
             initial_config=initial_config,
             involved_classes=involved_classes,
             ground_truth=ground_truth,
@@ -87,7 +123,16 @@ class MultiTurnFunctionCallInteraction(BaseInteraction):
             question=question,
             involved_instances=model_instances,
             total_turns=len(question),
+            entry_id=entry_id,
         )
+        # ground truth 回放实例从同一份已加载场景 fork 得到，而非再加载一次
+        self.score_calculator.prepare_ground_truth(state, entry_id)
+        self._instance_dict[instance_id] = state
+        if self.seet_runtime:
+            # 同条目的一组 rollout 通过 Peer 锚点公告板共享各轮的成功调用
+            self.seet_runtime.join_group(entry_id, instance_id)
+            # 共享锚点库：在模型生成第一轮回复期间拉取该条目其他工作进程的历史锚点
+            self.seet_runtime.prefetch_anchors(entry_id)
         return instance_id
 
     async def generate_response(
@@ -97,12 +142,21 @@ class MultiTurnFunctionCallInteraction(BaseInteraction):
         **kwargs,
     ) -> Tuple[bool, str, float, Dict[str, Any]]:
         """生成交互响应。"""
+        return await self._run_step(instance_id, self._generate_response_step, instance_id, messages, **kwargs)
+
+    def _generate_response_step(
+        self,
+        instance_id: str,
+        messages: List[Dict[str, Any]],
+        **kwargs,
+    ) -> Tuple[bool, str, float, Dict[str, Any]]:
+        """解析响应、执行工具调用并判定下一步。"""
         state = self._instance_dict[instance_id]
         entry_id = kwargs["id"]
 
         response_data = self.response_handler.parse_and_validate(messages)
         if response_data.has_error:
-            return await self._handle_response_error(instance_id, response_data, state, entry_id)
+            return self._handle_response_error(instance_id, response_data, state, entry_id)
 
         special_case_result = self._handle_special_cases(response_data, state, entry_id)
         if special_case_result:
@@ -110,7 +164,10 @@ class MultiTurnFunctionCallInteraction(BaseInteraction):
 
         predecoded_calls: Optional[List[Any]] = None
         if response_data.response_type == ResponseType.TOOL_CALL:
-            predecoded_calls = self.execution_manager.decode_tool_calls(response_data.content)
+            # 工具调用在解析响应时已一次性解码为 ToolCall，这里直接复用
+            predecoded_calls = response_data.tool_calls
+            if predecoded_calls is None:
+                predecoded_calls = self.execution_manager.decode_tool_calls(response_data.content)
             stage2_intercept = self._maybe_stage2_intercept(state, predecoded_calls)
             if stage2_intercept is not None:
                 return stage2_intercept
@@ -122,10 +179,10 @@ class MultiTurnFunctionCallInteraction(BaseInteraction):
             entry_id,
             predecoded_calls,
         )
-        return self._determine_next_action(execution_result, state, entry_id)
+        return self._determine_next_action(execution_result, state, instance_id, entry_id)
 
     # 中文注释：解析失败后的快通道入口；若命中重试策略则回注 SEET 英文诊断提示。
-    async def _handle_response_error(
+    def _handle_response_error(
         self,
         instance_id: str,
         response_data: ResponseData,
@@ -134,11 +191,12 @@ class MultiTurnFunctionCallInteraction(BaseInteraction):
     ) -> Tuple[bool, str, float, Dict[str, Any]]:
         """处理解析错误，并在 SEET 下尝试快通道重试。"""
         state.current_turn_attempt_counts += 1
+        state.seet_peer_hint_pending = False
 
         if self.turn_manager.should_force_quit(state, self.max_step_limit):
             should_term, content, score, extra = self.turn_manager.advance_to_next_turn(state, entry_id)
             if should_term:
-                await self.finalize_interaction(instance_id=instance_id)
+                self._release_instance(instance_id)
 
             prev_gt = self.turn_manager._get_ground_truth_calls(state, state.current_turn_index - 1)
             if not prev_gt:
@@ -156,9 +214,15 @@ class MultiTurnFunctionCallInteraction(BaseInteraction):
                 turn_index=state.current_turn_index,
                 fail_calls=[],
                 induced_calls=self._get_current_turn_ground_truth(state),
+                instance_id=instance_id,
             )
             if retry.should_retry:
-                return False, retry.hint_text, -1.0, {"seet_fast_loop": True, "channel": "fast"}
+                return (
+                    False,
+                    retry.hint_text,
+                    -1.0,
+                    {"seet_fast_loop": True, "channel": "fast", **self._track_peer_hint(state, retry)},
+                )
 
         return False, response_data.error_message or "Parse error", -3.0, {}
 
@@ -233,6 +297,7 @@ class MultiTurnFunctionCallInteraction(BaseInteraction):
         self,
         execution_result: ExecutionResult,
         state: InstanceState,
+        instance_id: str,
         entry_id: str,
     ) -> Tuple[bool, str, float, Dict[str, Any]]:
         """根据执行结果决定是否继续。"""
@@ -242,6 +307,9 @@ class MultiTurnFunctionCallInteraction(BaseInteraction):
         state.involved_instances = execution_result.new_instances
         state.add_exec_results(execution_result.execution_results)
         state.current_turn_attempt_counts += 1
+        # 基于 Peer 锚点的重试一次即执行成功：省下了后续重试
+        peer_saved_retry = state.seet_peer_hint_pending and not execution_result.has_error
+        state.seet_peer_hint_pending = False
 
         if self.turn_manager.should_force_quit(state, self.max_step_limit):
             return self.turn_manager.advance_to_next_turn(state, entry_id)
@@ -253,7 +321,7 @@ class MultiTurnFunctionCallInteraction(BaseInteraction):
             augmented_env=self.seet_config.use_augmented_env if self.seet_config.enabled else False,
         )
 
-        self._register_success_anchor_if_needed(state, entry_id, execution_result)
+        self._register_success_anchor_if_needed(state, instance_id, entry_id, execution_result)
 
         if self.seet_runtime and execution_result.has_error and self.seet_runtime.should_retry(
             state.current_turn_attempt_counts,
@@ -266,6 +334,7 @@ class MultiTurnFunctionCallInteraction(BaseInteraction):
                 turn_index=state.current_turn_index,
                 fail_calls=execution_result.decoded_responses or [],
                 induced_calls=self._get_current_turn_ground_truth(state),
+                instance_id=instance_id,
             )
             if retry.should_retry:
                 if retry.anchor_calls is not None:
@@ -279,12 +348,19 @@ class MultiTurnFunctionCallInteraction(BaseInteraction):
                     False,
                     user_hint + "\n\n" + retry.hint_text,
                     min(score, -1.0),
-                    {"seet_fast_loop": True, "channel": "fast", "reason": "execution_error"},
+                    {
+                        "seet_fast_loop": True,
+                        "channel": "fast",
+                        "reason": "execution_error",
+                        **self._track_peer_hint(state, retry),
+                    },
                 )
 
-        return False, user_hint, score, {}
+        return False, user_hint, score, {"seet_peer_saved_retry": True} if peer_saved_retry else {}
 
-    def _register_success_anchor_if_needed(self, state: InstanceState, entry_id: str, execution_result: ExecutionResult) -> None:
+    def _register_success_anchor_if_needed(
+        self, state: InstanceState, instance_id: str, entry_id: str, execution_result: ExecutionResult
+    ) -> None:
         if not self.seet_runtime or execution_result.has_error:
             return
 
@@ -293,8 +369,18 @@ class MultiTurnFunctionCallInteraction(BaseInteraction):
             turn_index=state.current_turn_index,
             decoded_calls=execution_result.decoded_responses or [],
             anchor_type="standard" if self.seet_config.stage >= 3 else "induced",
+            instance_id=instance_id,
         )
 
+    @staticmethod
+    def _track_peer_hint(state: InstanceState, retry: Any) -> Dict[str, Any]:
+        """记录快通道提示是否基于同组 Peer 锚点，用于统计 Peer 锚点省下的重试与轮次。"""
+        if retry.anchor_type != "peer":
+            return {}
+        state.seet_peer_hint_pending = True
+        state.seet_peer_hinted_turn = True
+        return {"seet_peer_hint": True}
+
     def _get_current_turn_ground_truth(self, state: InstanceState) -> List[Any]:
         return self.turn_manager._get_ground_truth_calls(state, state.current_turn_index)
 
@@ -302,5 +388,35 @@ class MultiTurnFunctionCallInteraction(BaseInteraction):
         return 0.0
 
     async def finalize_interaction(self, instance_id: str = None, **kwargs) -> None:
-        if instance_id and instance_id in self._instance_dict:
-            del self._instance_dict[instance_id]
+        """释放交互状态以及模型侧、ground truth 侧的环境实例。"""
+        if not instance_id:
+            return
+        await self._run_step(instance_id, self._release_instance, instance_id)
+        if self.env_server is not None:
+            self.env_server.release(instance_id)
+        elif self.step_executor is not None:
+            self.step_executor.release(instance_id)
+
+    def _release_instance(self, instance_id: str) -> None:
+        if instance_id in self._instance_dict:
+            state = self._instance_dict.pop(instance_id)
+            if self.seet_runtime:
+                self.seet_runtime.leave_group(state.entry_id, instance_id)
+            release_multi_turn_instances(instance_id, state.entry_id, is_evaL_run=False)
+            self.score_calculator.release_ground_truth(state, state.entry_id)
+
+    async def _run_step(self, instance_id: str, step: Callable[..., Any], *args, **kwargs) -> Any:
+        """执行一个交互步骤：未启用执行器时直接在事件循环上执行，否则交给实例绑定的工作线程或环境进程。"""
+        if self.env_server is not None:
+            return await self.env_server.call(
+                instance_id, step.__name__, args, kwargs, shard_key=kwargs.get("id")
+            )
+        if self.step_executor is None:
+            return step(*args, **kwargs)
+        return await self.step_executor.run(instance_id, functools.partial(step, *args, **kwargs))
+
+
+@functools.lru_cache(maxsize=1024)
+def _decode_initial_config(initial_config: str) -> Dict[str, Any]:
+    """解码 initial_config；同一条目的多个 rollout 共享解码结果，调用方只读不写。"""
+    return json.loads(initial_config)
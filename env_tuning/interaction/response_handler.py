@@ -16,7 +16,7 @@
 
 from typing import Dict, List, Any
 from .data_models import ResponseData, ResponseType
-from .utils import parse_model_response
+from .utils import parse_structured_model_response
 
 
 class ResponseHandler:
@@ -54,7 +54,7 @@ class ResponseHandler:
         
         # 解析模型响应
         try:
-            content, msg_flag = parse_model_response(last_message_response)
+            content, msg_flag, tool_calls = parse_structured_model_response(last_message_response)
             
             if msg_flag == "answer":
                 return ResponseData(
@@ -66,7 +66,8 @@ class ResponseHandler:
                 return ResponseData(
                     content=content,
                     response_type=ResponseType.TOOL_CALL,
-                    is_valid=True
+                    is_valid=True,
+                    tool_calls=tool_calls
                 )
             else:
                 return ResponseData(
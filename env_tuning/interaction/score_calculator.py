@@ -14,17 +14,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict, List, Any
+from collections import Counter
+from typing import Dict, List, Any, Optional
 from .data_models import InstanceState
 from .utils import is_empty_execute_response
-from bfcl_env.multi_turn_utils import execute_multi_turn_func_call
+from bfcl_env.ground_truth_oracle import GroundTruthReplay, match_state_fingerprints
+from bfcl_env.multi_turn_utils import (
+    fork_multi_turn_instances,
+    release_multi_turn_instances,
+)
 from bfcl_env.multi_turn_checker import state_checker, response_checker
 
 
 class ScoreCalculator:
     """计算评分相关逻辑"""
     
-    def calculate_turn_score(self, state: InstanceState, ground_truth_calls: List[Any], entry_id: str) -> float:
+    def calculate_turn_score(
+        self,
+        state: InstanceState,
+        ground_truth_calls: List[Any],
+        entry_id: str,
+        turn_index: Optional[int] = None,
+    ) -> float:
         """
         计算当前轮次评分
         
@@ -32,6 +43,7 @@ class ScoreCalculator:
             state: 实例状态
             ground_truth_calls: 标准答案调用列表
             entry_id: 条目ID
+            turn_index: 被评分的轮次索引；默认取 state.current_turn_index - 1（轮次已推进）
             
         Returns:
             float: 评分
@@ -44,44 +56,93 @@ class ScoreCalculator:
         if not state.single_turn_model_response_decode_list or is_empty_execute_response(state.single_turn_model_response_decode_list):
             return 0.0
         
-        # 执行 ground truth
-        gt_exec_res, gt_instances = self._execute_ground_truth(
-            ground_truth_calls, state, entry_id
-        )
-        
+        # 回放 ground truth：同一条目、同一回放轮次序列的结果由 oracle 共享（跨 rollout 与 epoch），只计算一次
+        if turn_index is None:
+            turn_index = state.current_turn_index - 1
+        ground_truth_replay = self._get_ground_truth_replay(state, entry_id)
+        gt_turn, gt_instances = ground_truth_replay.replay_turn(turn_index)
+
+        # 结果从文件加载（无实例快照）时用状态指纹比对；指纹无法判定时再把 ground truth 实例追平后逐属性比对
+        state_consistent = None
+        if gt_instances is None:
+            state_consistent = match_state_fingerprints(state.involved_instances, gt_turn.state_fingerprints)
+            if state_consistent is None:
+                gt_instances = ground_truth_replay.get_instances()
+        if gt_instances is not None:
+            state_consistent = self._check_state_consistency(state.involved_instances, gt_instances)
+
         # 检查状态一致性和响应一致性
-        if not self._check_state_consistency(state.involved_instances, gt_instances):
+        if not state_consistent:
             return 0.0
         elif not self._check_response_validity(
             state.all_turn_model_execution_results, 
-            gt_exec_res, 
-            state.current_turn_index
+            gt_turn.execution_results, 
+            state.current_turn_index,
+            state.all_turn_model_execution_result_counts,
         ):
             return 0.0
         else:
             return 1.0
     
-    def _execute_ground_truth(self, ground_truth_calls: List[Any], state: InstanceState, entry_id: str) -> tuple:
+    def _get_ground_truth_replay(self, state: InstanceState, entry_id: str) -> GroundTruthReplay:
         """
-        执行 ground truth 调用
+        获取（必要时创建）该实例的 ground truth 回放器
+        
+        Args:
+            state: 实例状态
+            entry_id: 条目ID
+            
+        Returns:
+            GroundTruthReplay: ground truth 回放器
+        """
+        if state.ground_truth_replay is None:
+            state.ground_truth_replay = GroundTruthReplay(
+                state.ground_truth,
+                state.initial_config,
+                state.involved_classes,
+                model_name=f"{id(state)}_ground_truth",
+                test_entry_id=entry_id,
+                long_context=("long_context" in entry_id or "composite" in entry_id),
+                is_evaL_run=True,
+            )
+        return state.ground_truth_replay
+
+    def prepare_ground_truth(self, state: InstanceState, entry_id: str) -> Dict[str, Any]:
+        """
+        创建 ground truth 回放器；未启用 oracle 时，从模型侧刚加载的环境实例 fork 出 ground truth 回放使用的实例，
+        避免同一场景加载两次（启用 oracle 时只在需要回放时才从场景模板缓存创建）
+        
+        必须在模型执行任何调用之前调用，此时模型实例即为初始场景。
         
         Args:
-            ground_truth_calls: 标准答案调用列表
             state: 实例状态
             entry_id: 条目ID
             
         Returns:
-            tuple: (执行结果, 实例字典)
+            Dict[str, Any]: ground truth 实例字典（未创建时为空）
         """
-        return execute_multi_turn_func_call(
-            func_call_list=ground_truth_calls,
-            initial_config=state.initial_config,
-            involved_classes=state.involved_classes,
+        ground_truth_replay = self._get_ground_truth_replay(state, entry_id)
+        if ground_truth_replay.oracle.enabled:
+            return {}
+        return fork_multi_turn_instances(
+            state.involved_instances,
             model_name=f"{id(state)}_ground_truth",
             test_entry_id=entry_id,
-            long_context=("long_context" in entry_id or "composite" in entry_id),
             is_evaL_run=True,
         )
+
+    def release_ground_truth(self, state: InstanceState, entry_id: str) -> int:
+        """
+        释放 ground truth 回放使用的环境实例
+        
+        Args:
+            state: 实例状态
+            entry_id: 条目ID
+            
+        Returns:
+            int: 释放的实例数量
+        """
+        return release_multi_turn_instances(f"{id(state)}_ground_truth", entry_id, is_evaL_run=True)
     
     def _check_state_consistency(self, model_instances: Dict[str, Any], gt_instances: Dict[str, Any]) -> bool:
         """
@@ -101,7 +162,13 @@ class ScoreCalculator:
             print(f"State consistency check failed: {e}")
             return False
     
-    def _check_response_validity(self, model_results: List[Any], gt_results: List[Any], turn_index: int) -> bool:
+    def _check_response_validity(
+        self,
+        model_results: List[Any],
+        gt_results: List[Any],
+        turn_index: int,
+        model_result_counts: Optional[Counter] = None,
+    ) -> bool:
         """
         检查响应有效性
         
@@ -109,12 +176,13 @@ class ScoreCalculator:
             model_results: 模型结果列表
             gt_results: 标准答案结果列表
             turn_index: 轮次索引
+            model_result_counts: 模型结果列表中每个结果的出现次数（增量维护时传入，检查开销只与 gt_results 长度相关）
             
         Returns:
             bool: 是否有效
         """
         try:
-            result = response_checker(model_results, gt_results, turn_index)
+            result = response_checker(model_results, gt_results, turn_index, model_response_counts=model_result_counts)
             return result.get("valid", False)
         except Exception as e:
             print(f"Response validity check failed: {e}")
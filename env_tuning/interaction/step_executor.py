@@ -0,0 +1,170 @@
+# Copyright 2025 ModelBest Inc. and/or its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class StepExecutorConfig:
+    """交互步骤执行器配置（默认关闭，即在事件循环上直接执行）。"""
+
+    enabled: bool = False
+    # 工作线程数；每个交互实例固定绑定到一个工作线程
+    max_workers: int = 4
+    # 同时提交到工作线程的步骤上限；None 表示不限制
+    max_concurrency: Optional[int] = None
+
+
+class InteractionStepExecutor:
+    """
+    把交互步骤（环境加载、工具执行、状态比对）从 asyncio 事件循环卸载到工作线程。
+
+    每个交互实例在首次提交时绑定（pin）到一个单线程 worker，直到 release 为止，
+    因此同一实例的步骤严格按提交顺序执行，且其环境实例只会被一个线程访问。
+    新实例绑定到当前绑定实例最少的 worker。
+    """
+
+    def __init__(self, max_workers: int = 4, max_concurrency: Optional[int] = None):
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency
+        self._workers: List[ThreadPoolExecutor] = [
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"interaction-step-{index}")
+            for index in range(max_workers)
+        ]
+        self._pins: Dict[str, int] = {}
+        self._pinned_counts: List[int] = [0] * max_workers
+        # asyncio.Semaphore 需在事件循环内创建，首次提交时再初始化
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._lock = threading.Lock()
+
+        # 指标
+        self.num_waiting = 0
+        self.num_queued = 0
+        self.num_running = 0
+        self.peak_queue_depth = 0
+        self.num_completed = 0
+        self.total_queue_seconds = 0.0
+
+    @classmethod
+    def from_config(cls, config: StepExecutorConfig) -> Optional["InteractionStepExecutor"]:
+        """按配置创建执行器；未启用时返回 None。"""
+        if not config.enabled:
+            return None
+        return cls(max_workers=config.max_workers, max_concurrency=config.max_concurrency)
+
+    async def run(self, instance_id: str, step: Callable[[], Any]) -> Any:
+        """
+        在实例绑定的 worker 上执行一个步骤并等待结果
+
+        Args:
+            instance_id: 交互实例ID
+            step: 无参可调用对象，在工作线程中执行
+
+        Returns:
+            Any: step 的返回值（异常会原样抛出）
+        """
+        worker = self._workers[self._pin(instance_id)]
+        semaphore = self._get_semaphore()
+
+        enqueued_at = time.perf_counter()
+        with self._lock:
+            self.num_waiting += 1
+            self._update_peak_queue_depth()
+        try:
+            if semaphore is not None:
+                await semaphore.acquire()
+        finally:
+            with self._lock:
+                self.num_waiting -= 1
+
+        try:
+            with self._lock:
+                self.num_queued += 1
+                self._update_peak_queue_depth()
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(worker, self._run_step, step, enqueued_at)
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    def release(self, instance_id: str) -> None:
+        """解除实例与 worker 的绑定（在实例最后一个步骤之后调用）。"""
+        with self._lock:
+            worker_index = self._pins.pop(instance_id, None)
+            if worker_index is not None:
+                self._pinned_counts[worker_index] -= 1
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Returns:
+            Dict[str, Any]: 并发上限、队列深度等指标
+                - queue_depth: 等待并发额度的步骤数 + 已提交但尚未开始执行的步骤数
+                - mean_queue_seconds: 步骤从提交到开始执行的平均等待时间
+        """
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_concurrency": self.max_concurrency,
+                "pinned_instances": len(self._pins),
+                "waiting": self.num_waiting,
+                "queued": self.num_queued,
+                "running": self.num_running,
+                "queue_depth": self.num_waiting + self.num_queued,
+                "peak_queue_depth": self.peak_queue_depth,
+                "num_completed": self.num_completed,
+                "mean_queue_seconds": (
+                    self.total_queue_seconds / self.num_completed if self.num_completed else 0.0
+                ),
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """关闭所有 worker。"""
+        for worker in self._workers:
+            worker.shutdown(wait=wait)
+
+    def _pin(self, instance_id: str) -> int:
+        with self._lock:
+            worker_index = self._pins.get(instance_id)
+            if worker_index is None:
+                worker_index = min(range(self.max_workers), key=self._pinned_counts.__getitem__)
+                self._pins[instance_id] = worker_index
+                self._pinned_counts[worker_index] += 1
+            return worker_index
+
+    def _get_semaphore(self) -> Optional[asyncio.Semaphore]:
+        if self.max_concurrency is None:
+            return None
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def _run_step(self, step: Callable[[], Any], enqueued_at: float) -> Any:
+        with self._lock:
+            self.num_queued -= 1
+            self.num_running += 1
+            self.total_queue_seconds += time.perf_counter() - enqueued_at
+        try:
+            return step()
+        finally:
+            with self._lock:
+                self.num_running -= 1
+                self.num_completed += 1
+
+    def _update_peak_queue_depth(self) -> None:
+        self.peak_queue_depth = max(self.peak_queue_depth, self.num_waiting + self.num_queued)
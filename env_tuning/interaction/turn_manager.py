@@ -47,18 +47,22 @@ class TurnManager:
         state.current_turn_index += 1
         
         # 计算评分
-        score = self.score_calculator.calculate_turn_score(state, ground_truth_calls, entry_id)
+        score = self.score_calculator.calculate_turn_score(state, ground_truth_calls, entry_id, turn_index=prev_turn_idx)
         
         # 准备下一个问题
         should_terminate, next_question = self._prepare_next_question(state)
         
         # 输出并清空慢通道反事实记录
         seet_records = state.pop_seet_counterfactual_records()
+        extra = {"seet_counterfactual_records": seet_records}
+        # 本轮用过同组 Peer 锚点时，记录该轮最终是否答对
+        if state.seet_peer_hinted_turn:
+            extra["seet_peer_saved_turn"] = score == 1.0
 
         # 重置单轮缓存
         state.reset_single_turn_buffers()
 
-        return should_terminate, next_question, score, {"seet_counterfactual_records": seet_records}
+        return should_terminate, next_question, score, extra
     
     def _get_ground_truth_calls(self, state: InstanceState, turn_index: int) -> list:
         """
@@ -2,6 +2,13 @@ import json
 import re
 from typing import Dict, List, Optional, Tuple, Any, Union
 import ast
+import keyword
+
+from bfcl_env.tool_call import ToolCall
+
+# 合法响应以 </tool_call> 或 </answer> 结尾，其后的任何非空白输出都会被 parse_model_response 判为格式错误，
+# 因此可作为生成的终止字符串
+RESPONSE_STOP_SEQUENCES = ("</tool_call>", "</answer>")
 
 def parse_query_response_prompting(api_response: str) -> dict:
         #TODO parsing the future thinking tag in the api_response
@@ -26,6 +33,9 @@ def parse_model_response(
     Parse LLM response that must follow one of the two formats
     (thinking+tool_call) or (thinking+answer).
 
+    For the tool_call case the content is the re-encoded JSON; use
+    `parse_structured_model_response` to get decoded ToolCall objects instead.
+
     Returns
     -------
     content : Union[str, list]
@@ -37,6 +47,38 @@ def parse_model_response(
         error description (English) on failure.
     """
 
+    content, msg, tool_call_obj = _parse_model_response(response)
+    if msg == "tool_call":
+        return json.dumps(tool_call_obj), msg
+    return content, msg
+
+
+def parse_structured_model_response(
+    response: str,
+) -> Tuple[str, str, Optional[List[ToolCall]]]:
+    """
+    Same checks as `parse_model_response`, but the <tool_call> body is decoded
+    only once, straight into ToolCall objects.
+
+    Returns
+    -------
+    content : str
+        The stripped <tool_call> body (kept for logging only), the <answer>
+        body, or the original response on format error.
+    msg : str
+        "answer" / "tool_call" on success, error description otherwise.
+    tool_calls : Optional[List[ToolCall]]
+        The decoded calls if msg is "tool_call", else None.
+    """
+    content, msg, tool_call_obj = _parse_model_response(response)
+    if msg == "tool_call":
+        return content, msg, tool_calls_from_json(tool_call_obj)
+    return content, msg, None
+
+
+def _parse_model_response(
+    response: str,
+) -> Tuple[str, str, Any]:
     # Keep original for error path
     raw = response
     response = response.strip()
@@ -46,11 +88,12 @@ def parse_model_response(
         r"<think>([\s\S]*?)</think>", response, flags=re.DOTALL
     )
     if len(thinking_matches) == 0:
-        return raw, "Error: Missing <think></think> tags"
+        return raw, "Error: Missing <think></think> tags", None
     if len(thinking_matches) > 1:
         return (
             raw,
             "Error: Multiple <think></think> tag pairs found. Only one pair is allowed.",
+            None,
         )
 
     # 2. 检查重复的 <tool_call></tool_call> 标签对
@@ -61,6 +104,7 @@ def parse_model_response(
         return (
             raw,
             "Error: Multiple <tool_call></tool_call> tag pairs found. Only one pair is allowed.",
+            None,
         )
 
     # 3. 检查重复的 <answer></answer> 标签对
@@ -71,6 +115,7 @@ def parse_model_response(
         return (
             raw,
             "Error: Multiple <answer></answer> tag pairs found. Only one pair is allowed.",
+            None,
         )
 
     # 4. 检测 <tool_call> 与 <answer> 的互斥性
@@ -81,11 +126,13 @@ def parse_model_response(
         return (
             raw,
             "Error: Response cannot contain both <tool_call> and <answer> tags",
+            None,
         )
     if not has_tool_call and not has_answer:
         return (
             raw,
             "Error: Response must contain either <tool_call> or <answer> tags",
+            None,
         )
 
     # 5. 检查是否有标签外多余文本（允许空白）
@@ -105,6 +152,7 @@ def parse_model_response(
         return (
             raw,
             "Error: Response must not contain text outside the required XML tags",
+            None,
         )
 
     # 6. 提取并返回内容
@@ -113,22 +161,22 @@ def parse_model_response(
         # 尝试解析 JSON；仅判断能否解析，进一步检查另行处理
         try:
             obj = json.loads(tool_body)
-            json_again = json.dumps(obj)
-            return json_again, "tool_call"
+            return tool_body, "tool_call", obj
         except json.JSONDecodeError as e:
-            return raw, f"Error: Invalid JSON inside <tool_call>: {e}"
+            return raw, f"Error: Invalid JSON inside <tool_call>: {e}", None
 
     # answer 情况
     answer_body = answer_matches[0].strip()
 
-    return answer_body, "answer"
+    return answer_body, "answer", None
 
 
 
 def is_empty_execute_response(input_list: list):
     if len(input_list) == 0:
         return True
-    if len(input_list) == 1 and len(input_list[0]) == 0:
+    # ToolCall 元素没有长度，只有字符串/列表才可能为空
+    if len(input_list) == 1 and isinstance(input_list[0], (str, list)) and len(input_list[0]) == 0:
         return True
     return False
 
@@ -310,6 +358,46 @@ def parse_tool_calls(raw: str
     
     return "[" + ", ".join(call_strings) + "]" if call_strings else "[]"
 
+def _is_python_name(name: str, dotted: bool = False) -> bool:
+    """判断 name 能否写成 Python 调用中的函数名（dotted=True 时允许 a.b 形式）或关键字参数名。"""
+    parts = name.split(".") if dotted else [name]
+    return all(part.isidentifier() and not keyword.iskeyword(part) for part in parts)
+
+
+def tool_calls_from_json(calls: Any) -> List[ToolCall]:
+    """
+    把 <tool_call> 中解码后的 JSON 直接转成 ToolCall 列表，规则与 parse_tool_calls 一致。
+
+    与 parse_tool_calls + default_decode_execute_prompting 的结果保持一致：只要有一个调用的函数名或参数名
+    无法写成 Python 调用（如 "my-key"），原路径的 ast 解析整体失败，这里也返回空列表（按格式错误处理）。
+    """
+    if not isinstance(calls, list):
+        calls = [calls]
+
+    tool_calls: List[ToolCall] = []
+    for call in calls:
+        # (1) 必须是 dict
+        if not isinstance(call, dict):
+            continue
+
+        # (2) 取 name；缺失或类型不对则跳过
+        name = call.get("name")
+        if not isinstance(name, str) or not name.strip():
+            continue
+
+        # (3) 取 arguments；缺失 / None / 非 dict → {}
+        args = call.get("arguments")
+        if not isinstance(args, dict):
+            args = {}
+
+        name = name.strip()
+        if not _is_python_name(name, dotted=True) or not all(_is_python_name(key) for key in args):
+            return []
+
+        tool_calls.append(ToolCall(name=name, arguments=args))
+    return tool_calls
+
+
 def has_execution_error(execution_results: list[str]) -> bool:
     """
     Return True if any result in `execution_results` indicates a failure.
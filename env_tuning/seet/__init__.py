@@ -1,7 +1,8 @@
 from .config import SeetConfig
 from .runtime import SeetRuntime
 from .fpld import first_logic_divergence, FPLDResult
-from .anchor import AnchorTrace, AnchorReplayBuffer, DynamicAnchorSelector
+from .anchor import AnchorTrace, AnchorReplayBuffer, AnchorReplayLog, DynamicAnchorSelector, PeerAnchorBoard
+from .anchor_store import AnchorStoreConfig, AnchorStoreServer, SharedAnchorClient
 
 __all__ = [
     "SeetConfig",
@@ -10,5 +11,10 @@ __all__ = [
     "FPLDResult",
     "AnchorTrace",
     "AnchorReplayBuffer",
+    "AnchorReplayLog",
     "DynamicAnchorSelector",
+    "PeerAnchorBoard",
+    "AnchorStoreConfig",
+    "AnchorStoreServer",
+    "SharedAnchorClient",
 ]
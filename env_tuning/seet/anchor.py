@@ -1,7 +1,13 @@
-from dataclasses import dataclass, field
+from collections import OrderedDict, deque
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Set
+import atexit
 import json
+import os
+import threading
+
+from bfcl_env.tool_call import ToolCall
 
 
 @dataclass
@@ -14,40 +20,71 @@ class AnchorTrace:
     anchor_type: str
 
 
-@dataclass
 class AnchorReplayBuffer:
     """
     历史成功轨迹回放池。
 
-    中文注释：默认仅内存保存；可通过 save_to_file/load_from_file 做可选持久化。
+    中文注释：按 (条目, 轮次) 建索引，latest 为常数时间查找；每个 (条目, 轮次) 只保留最近 max_traces_per_turn 条锚点，
+    条目数超过 max_entries（0 表示不限）时淘汰最久未更新的条目。默认仅内存保存；持久化见 save_to_file/load_from_file
+    与 AnchorReplayLog。push 可能来自多个工作线程，内部加锁。
     """
 
-    traces: Dict[str, List[AnchorTrace]] = field(default_factory=dict)
+    def __init__(self, max_traces_per_turn: int = 4, max_entries: int = 0):
+        self.max_traces_per_turn = max(1, max_traces_per_turn)
+        self.max_entries = max_entries
+        # entry_id -> turn_index -> 最近的锚点（旧 -> 新）；条目按最近一次 push 排序，便于淘汰
+        self.traces: "OrderedDict[str, Dict[int, Deque[AnchorTrace]]]" = OrderedDict()
+        self.num_traces = 0
+        self._lock = threading.Lock()
 
     def push(self, trace: AnchorTrace) -> None:
-        self.traces.setdefault(trace.entry_id, []).append(trace)
+        with self._lock:
+            turns = self.traces.get(trace.entry_id)
+            if turns is None:
+                turns = self.traces[trace.entry_id] = {}
+            else:
+                self.traces.move_to_end(trace.entry_id)
+            history = turns.get(trace.turn_index)
+            if history is None:
+                history = turns[trace.turn_index] = deque(maxlen=self.max_traces_per_turn)
+            if len(history) == history.maxlen:
+                self.num_traces -= 1
+            history.append(trace)
+            self.num_traces += 1
+
+            while self.max_entries and len(self.traces) > self.max_entries:
+                _, evicted_turns = self.traces.popitem(last=False)
+                self.num_traces -= sum(len(h) for h in evicted_turns.values())
 
     def latest(self, entry_id: str, turn_index: int) -> Optional[AnchorTrace]:
-        candidates = [x for x in self.traces.get(entry_id, []) if x.turn_index == turn_index]
-        return candidates[-1] if candidates else None
+        history = self.traces.get(entry_id, {}).get(turn_index)
+        return history[-1] if history else None
+
+    def latest_by_turn(self, entry_id: str) -> Dict[int, AnchorTrace]:
+        """返回某条目每个轮次最近的锚点。"""
+        with self._lock:
+            turns = self.traces.get(entry_id, {})
+            return {turn_index: history[-1] for turn_index, history in turns.items() if history}
+
+    def __len__(self) -> int:
+        return self.num_traces
+
+    def iter_traces(self) -> List[AnchorTrace]:
+        """按条目、轮次返回当前保留的全部锚点（同一轮次内旧 -> 新）。"""
+        with self._lock:
+            return [trace for turns in self.traces.values() for history in turns.values() for trace in history]
 
     def to_dict(self) -> Dict[str, List[Dict[str, Any]]]:
-        return {
-            entry_id: [
-                {
-                    "entry_id": t.entry_id,
-                    "turn_index": t.turn_index,
-                    "decoded_calls": t.decoded_calls,
-                    "anchor_type": t.anchor_type,
-                }
-                for t in traces
-            ]
-            for entry_id, traces in self.traces.items()
-        }
+        payload: Dict[str, List[Dict[str, Any]]] = {}
+        for trace in self.iter_traces():
+            payload.setdefault(trace.entry_id, []).append(trace_to_record(trace))
+        return payload
 
     @classmethod
-    def from_dict(cls, payload: Dict[str, List[Dict[str, Any]]]) -> "AnchorReplayBuffer":
-        buffer = cls()
+    def from_dict(
+        cls, payload: Dict[str, List[Dict[str, Any]]], max_traces_per_turn: int = 4, max_entries: int = 0
+    ) -> "AnchorReplayBuffer":
+        buffer = cls(max_traces_per_turn=max_traces_per_turn, max_entries=max_entries)
         if not isinstance(payload, dict):
             return buffer
 
@@ -55,40 +92,232 @@ class AnchorReplayBuffer:
             if not isinstance(traces, list):
                 continue
             for t in traces:
-                if not isinstance(t, dict):
-                    continue
-                buffer.push(
-                    AnchorTrace(
-                        entry_id=str(t.get("entry_id", entry_id)),
-                        turn_index=int(t.get("turn_index", 0)),
-                        decoded_calls=t.get("decoded_calls", []) if isinstance(t.get("decoded_calls", []), list) else [],
-                        anchor_type=str(t.get("anchor_type", "standard")),
-                    )
-                )
+                trace = trace_from_record(t, entry_id)
+                if trace is not None:
+                    buffer.push(trace)
         return buffer
 
     def save_to_file(self, file_path: str) -> None:
+        """以 JSON Lines（每行一条锚点）整体重写文件；先写临时文件再替换，中断时不会留下半个文件。"""
         p = Path(file_path)
         p.parent.mkdir(parents=True, exist_ok=True)
-        p.write_text(json.dumps(self.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+        temp_path = p.with_name(p.name + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for trace in self.iter_traces():
+                f.write(json.dumps(trace_to_record(trace), ensure_ascii=False) + "\n")
+        os.replace(temp_path, p)
 
     @classmethod
-    def load_from_file(cls, file_path: str) -> "AnchorReplayBuffer":
+    def load_from_file(cls, file_path: str, max_traces_per_turn: int = 4, max_entries: int = 0) -> "AnchorReplayBuffer":
+        """读取 JSON Lines 文件（按行回放 push，损坏的行跳过）；也兼容旧版整体写入的缩进 JSON。"""
         p = Path(file_path)
         if not p.exists():
-            return cls()
+            return cls(max_traces_per_turn=max_traces_per_turn, max_entries=max_entries)
         try:
-            payload = json.loads(p.read_text(encoding="utf-8"))
+            text = p.read_text(encoding="utf-8")
         except Exception:
-            return cls()
-        return cls.from_dict(payload)
+            return cls(max_traces_per_turn=max_traces_per_turn, max_entries=max_entries)
+
+        try:
+            payload = json.loads(text)
+        except ValueError:
+            payload = None
+        if isinstance(payload, dict) and payload and all(isinstance(v, list) for v in payload.values()):
+            # 旧版格式：{entry_id: [trace, ...]}
+            return cls.from_dict(payload, max_traces_per_turn, max_entries)
+
+        buffer = cls(max_traces_per_turn=max_traces_per_turn, max_entries=max_entries)
+        for line in text.splitlines():
+            try:
+                trace = trace_from_record(json.loads(line))
+            except Exception:
+                # 例如进程中断时写了一半的最后一行
+                continue
+            if trace is not None:
+                buffer.push(trace)
+        return buffer
+
+
+class AnchorReplayLog:
+    """
+    回放池的追加写持久化。
+
+    中文注释：append 只把记录放入队列，由后台线程按 flush_interval 秒批量追加到 JSON Lines 文件，不阻塞 rollout 事件循环；
+    日志行数超过存活锚点数的 compact_ratio 倍（且不少于 compact_min_lines）时，后台线程用回放池当前内容重写文件，
+    丢弃被覆盖或淘汰的旧锚点。进程退出时自动刷盘。
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        buffer: AnchorReplayBuffer,
+        flush_interval: float = 1.0,
+        compact_ratio: float = 4.0,
+        compact_min_lines: int = 1024,
+    ):
+        self.file_path = file_path
+        self.buffer = buffer
+        self.flush_interval = flush_interval
+        self.compact_ratio = compact_ratio
+        self.compact_min_lines = compact_min_lines
+        Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._pending: List[str] = []
+        self._num_lines = 0
+        self.num_flushes = 0
+        self.num_compactions = 0
+        if Path(file_path).exists():
+            # 启动时按回放池内容重写一次：旧版整体 JSON 文件转为 JSON Lines，超出容量的历史记录也一并丢弃
+            self.compact()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="anchor-replay-log", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def append(self, trace: AnchorTrace) -> None:
+        line = json.dumps(trace_to_record(trace), ensure_ascii=False) + "\n"
+        with self._condition:
+            self._pending.append(line)
+
+    def flush(self) -> None:
+        """把队列中的记录追加到文件，必要时压缩。"""
+        with self._condition:
+            lines, self._pending = self._pending, []
+        if lines:
+            try:
+                with open(self.file_path, "a", encoding="utf-8") as f:
+                    f.writelines(lines)
+            except OSError:
+                with self._condition:
+                    self._pending[:0] = lines
+                raise
+            self._num_lines += len(lines)
+            self.num_flushes += 1
+        if self._num_lines > max(self.compact_min_lines, self.compact_ratio * len(self.buffer)):
+            self.compact()
+
+    def compact(self) -> None:
+        """用回放池当前内容重写文件。在后台线程或 close 中调用，与 flush 不会并发。"""
+        self.buffer.save_to_file(self.file_path)
+        self._num_lines = len(self.buffer)
+        self.num_compactions += 1
+
+    def close(self) -> None:
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+        self.flush()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if self._closed:
+                    return
+                self._condition.wait(self.flush_interval)
+                if self._closed:
+                    return
+            try:
+                self.flush()
+            except OSError:
+                # 写失败（如磁盘暂时不可用）时记录留在队列中，下次刷盘重试
+                pass
+
+
+def trace_to_record(trace: AnchorTrace) -> Dict[str, Any]:
+    return {
+        "entry_id": trace.entry_id,
+        "turn_index": trace.turn_index,
+        "decoded_calls": [str(c) if isinstance(c, ToolCall) else c for c in trace.decoded_calls],
+        "anchor_type": trace.anchor_type,
+    }
+
+
+def trace_from_record(record: Any, entry_id: Optional[str] = None) -> Optional[AnchorTrace]:
+    if not isinstance(record, dict):
+        return None
+    decoded_calls = record.get("decoded_calls", [])
+    return AnchorTrace(
+        entry_id=str(record.get("entry_id", entry_id)),
+        turn_index=int(record.get("turn_index", 0)),
+        decoded_calls=decoded_calls if isinstance(decoded_calls, list) else [],
+        anchor_type=str(record.get("anchor_type", "standard")),
+    )
+
+
+class PeerAnchorBoard:
+    """
+    同组 rollout 之间的锚点公告板。
+
+    中文注释：同一条目（prompt）的一组 rollout 在同一次 _req_level_generate_sequences 中并发进行，
+    某个 rollout 在第 k 轮成功后把调用公布到 (条目, 轮次)，同组其他 rollout 在第 k 轮失败时即可把它作为 Peer 锚点。
+    rollout 开始时 join、释放时 leave；组内最后一个 rollout 离开后清空该条目的锚点，因此只保存当前在途的组。
+    """
+
+    def __init__(self):
+        # entry_id -> turn_index -> 发布者 instance_id -> 锚点（按发布先后排序）
+        self._anchors: Dict[str, Dict[int, "OrderedDict[str, AnchorTrace]"]] = {}
+        self._members: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def join(self, entry_id: str, instance_id: str) -> None:
+        with self._lock:
+            self._members.setdefault(entry_id, set()).add(instance_id)
+
+    def leave(self, entry_id: str, instance_id: str) -> None:
+        with self._lock:
+            members = self._members.get(entry_id)
+            if members is None:
+                return
+            members.discard(instance_id)
+            if not members:
+                del self._members[entry_id]
+                self._anchors.pop(entry_id, None)
+
+    def publish(self, instance_id: str, trace: AnchorTrace) -> None:
+        """公布 rollout 在某轮的成功调用；同一 rollout 在同一轮只保留最近一次。"""
+        with self._lock:
+            if trace.entry_id not in self._members:
+                return
+            turns = self._anchors.setdefault(trace.entry_id, {})
+            publishers = turns.get(trace.turn_index)
+            if publishers is None:
+                publishers = turns[trace.turn_index] = OrderedDict()
+            publishers.pop(instance_id, None)
+            publishers[instance_id] = trace
+
+    def get(self, entry_id: str, turn_index: int, instance_id: str) -> Optional[AnchorTrace]:
+        """返回同组其他 rollout 在该轮最近公布的锚点（不含自己公布的）。"""
+        with self._lock:
+            publishers = self._anchors.get(entry_id, {}).get(turn_index)
+            if not publishers:
+                return None
+            for publisher, trace in reversed(publishers.items()):
+                if publisher != instance_id:
+                    return replace(trace, anchor_type="peer")
+        return None
+
+    def __len__(self) -> int:
+        return len(self._members)
 
 
 class DynamicAnchorSelector:
     """按 SEET 优先级选择锚点：Peer > Historical > Induced。"""
 
-    def __init__(self, replay_buffer: AnchorReplayBuffer):
+    def __init__(
+        self,
+        replay_buffer: AnchorReplayBuffer,
+        anchor_store: Optional[Any] = None,
+        peer_board: Optional[PeerAnchorBoard] = None,
+    ):
         self.replay_buffer = replay_buffer
+        # 同组 rollout 的锚点公告板（可选）：未显式传入 peer_anchor 时按 instance_id 查询同组其他 rollout 的锚点
+        self.peer_board = peer_board
+        # 共享锚点库客户端（可选）：本进程回放池没有历史锚点时再查询其他工作进程的锚点
+        self.anchor_store = anchor_store
 
     def choose(
         self,
@@ -97,14 +326,19 @@ class DynamicAnchorSelector:
         turn_index: int,
         peer_anchor: Optional[AnchorTrace] = None,
         induced_anchor: Optional[AnchorTrace] = None,
+        instance_id: Optional[str] = None,
     ) -> Optional[AnchorTrace]:
         # Priority 1: Peer Anchor (Stage 3+)
+        if stage >= 3 and peer_anchor is None and self.peer_board is not None and instance_id is not None:
+            peer_anchor = self.peer_board.get(entry_id=entry_id, turn_index=turn_index, instance_id=instance_id)
         if stage >= 3 and peer_anchor is not None:
             return peer_anchor
 
         # Priority 2: Historical Self Anchor (Stage 3/4)
         if stage >= 3:
             historical = self.replay_buffer.latest(entry_id=entry_id, turn_index=turn_index)
+            if historical is None and self.anchor_store is not None:
+                historical = self.anchor_store.latest(entry_id=entry_id, turn_index=turn_index)
             if historical is not None:
                 return historical
 
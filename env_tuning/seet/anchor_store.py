@@ -0,0 +1,309 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from .anchor import AnchorReplayBuffer, AnchorReplayLog, AnchorTrace, trace_from_record, trace_to_record
+
+
+@dataclass
+class AnchorStoreConfig:
+    """跨 rollout 工作进程共享的锚点库配置（默认关闭，即每个进程只使用自己的回放池）。"""
+
+    enabled: bool = False
+    # ray：整个集群共享一个 Ray 命名 actor；local：进程内共享（单机调试与测试用的替身）
+    backend: str = "ray"
+    name: str = "seet_anchor_store"
+    namespace: str = "seet"
+    # 客户端后台线程的批处理间隔（秒）与单批最大记录数
+    flush_interval: float = 0.05
+    max_batch_size: int = 256
+    # 读穿缓存：条目的锚点在 cache_ttl 秒后过期并在后台刷新；查询从不等待服务端，缓存未命中时返回 None 并在后台拉取
+    cache_ttl: float = 30.0
+
+
+class AnchorStoreServer:
+    """
+    共享锚点库的服务端，持有全局回放池。
+
+    中文注释：所有工作进程的成功锚点批量汇总到这里，查询按条目返回每个轮次最近的锚点。
+    配置了 path 时只由服务端加载（persist 时还追加写）回放池文件，各工作进程不再读写同一文件，避免文件锁竞争。
+    """
+
+    def __init__(
+        self,
+        max_traces_per_turn: int = 4,
+        max_entries: int = 0,
+        path: str = "",
+        persist: bool = False,
+        flush_interval: float = 1.0,
+        compact_ratio: float = 4.0,
+    ):
+        buffer_caps = dict(max_traces_per_turn=max_traces_per_turn, max_entries=max_entries)
+        if path:
+            self.buffer = AnchorReplayBuffer.load_from_file(path, **buffer_caps)
+        else:
+            self.buffer = AnchorReplayBuffer(**buffer_caps)
+        self.log: Optional[AnchorReplayLog] = None
+        if path and persist:
+            self.log = AnchorReplayLog(path, self.buffer, flush_interval=flush_interval, compact_ratio=compact_ratio)
+        self.num_pushed = 0
+        self.num_push_batches = 0
+        self.num_lookups = 0
+        self.num_lookup_batches = 0
+
+    def push_batch(self, records: List[Dict[str, Any]]) -> int:
+        """写入一批锚点记录，返回写入条数。"""
+        num_pushed = 0
+        for record in records:
+            trace = trace_from_record(record)
+            if trace is None:
+                continue
+            self.buffer.push(trace)
+            if self.log is not None:
+                self.log.append(trace)
+            num_pushed += 1
+        self.num_pushed += num_pushed
+        self.num_push_batches += 1
+        return num_pushed
+
+    def lookup_batch(self, entry_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """按条目查询每个轮次最近的锚点记录；没有锚点的条目返回空列表。"""
+        self.num_lookups += len(entry_ids)
+        self.num_lookup_batches += 1
+        return {
+            entry_id: [trace_to_record(trace) for trace in self.buffer.latest_by_turn(entry_id).values()]
+            for entry_id in entry_ids
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "traces": len(self.buffer),
+            "entries": len(self.buffer.traces),
+            "pushed": self.num_pushed,
+            "push_batches": self.num_push_batches,
+            "lookups": self.num_lookups,
+            "lookup_batches": self.num_lookup_batches,
+        }
+
+    def close(self) -> None:
+        if self.log is not None:
+            self.log.close()
+
+
+# local 后端：同一进程内同名的客户端共享一个服务端
+_local_servers: Dict[str, AnchorStoreServer] = {}
+_local_servers_lock = threading.Lock()
+
+
+class LocalAnchorStore:
+    """进程内的共享锚点库，接口与 Ray 后端一致，用于单机调试与测试。"""
+
+    def __init__(self, name: str, **server_kwargs):
+        with _local_servers_lock:
+            server = _local_servers.get(name)
+            if server is None:
+                server = _local_servers[name] = AnchorStoreServer(**server_kwargs)
+        self.server = server
+
+    def push_batch(self, records: List[Dict[str, Any]]) -> int:
+        return self.server.push_batch(records)
+
+    def lookup_batch(self, entry_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        return self.server.lookup_batch(entry_ids)
+
+    def stats(self) -> Dict[str, Any]:
+        return self.server.stats()
+
+
+class RayAnchorStore:
+    """集群共享锚点库：第一个连接的进程创建 Ray 命名 actor，其余进程（跨 DP rank 与节点）按名字获取同一个 actor。"""
+
+    def __init__(self, name: str, namespace: str, **server_kwargs):
+        import ray
+
+        if not ray.is_initialized():
+            # 例如环境服务的子进程：连接到已有集群
+            ray.init(address="auto", namespace=namespace, ignore_reinit_error=True)
+        # 持有 actor 句柄，避免命名 actor 被回收
+        self.actor = (
+            ray.remote(AnchorStoreServer)
+            .options(name=name, namespace=namespace, get_if_exists=True, num_cpus=0)
+            .remote(**server_kwargs)
+        )
+        self._ray = ray
+
+    def push_batch(self, records: List[Dict[str, Any]]) -> int:
+        return self._ray.get(self.actor.push_batch.remote(records))
+
+    def lookup_batch(self, entry_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        return self._ray.get(self.actor.lookup_batch.remote(entry_ids))
+
+    def stats(self) -> Dict[str, Any]:
+        return self._ray.get(self.actor.stats.remote())
+
+
+class SharedAnchorClient:
+    """
+    共享锚点库的客户端（每个工作进程一个）。
+
+    中文注释：push 与缓存未命中的查询只放入队列，由后台线程按 flush_interval 合并为批次发给服务端，
+    不阻塞 rollout 事件循环。查询结果按条目缓存（读穿缓存），过期后继续返回旧值并在后台刷新；
+    latest 只读缓存，未命中时立即返回 None 并在后台拉取（交互步骤可能直接运行在 rollout 事件循环上，不能等待）；
+    prefetch 在交互开始时提前拉取条目的锚点，使后续重试提示通常直接命中缓存。
+    """
+
+    def __init__(
+        self,
+        store: Any,
+        flush_interval: float = 0.05,
+        max_batch_size: int = 256,
+        cache_ttl: float = 30.0,
+    ):
+        self.store = store
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+        self.cache_ttl = cache_ttl
+
+        # entry_id -> (拉取时间, turn_index -> 锚点)
+        self._cache: Dict[str, Tuple[float, Dict[int, AnchorTrace]]] = {}
+        self._pending_pushes: List[Dict[str, Any]] = []
+        # 待拉取的条目（按请求顺序，dict 当作有序集合使用）
+        self._pending_lookups: Dict[str, None] = {}
+        self._condition = threading.Condition()
+        self._closed = False
+
+        # 指标
+        self.num_hits = 0
+        self.num_misses = 0
+        self.num_errors = 0
+
+        self._thread = threading.Thread(target=self._run, name="seet-anchor-store-client", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def from_config(
+        cls, config: AnchorStoreConfig, server_kwargs: Optional[Dict[str, Any]] = None
+    ) -> Optional["SharedAnchorClient"]:
+        """按配置连接共享锚点库；未启用时返回 None。server_kwargs 仅在本进程创建服务端时生效。"""
+        if not config.enabled:
+            return None
+        server_kwargs = server_kwargs or {}
+        if config.backend == "local":
+            store = LocalAnchorStore(config.name, **server_kwargs)
+        elif config.backend == "ray":
+            store = RayAnchorStore(config.name, config.namespace, **server_kwargs)
+        else:
+            raise ValueError(f"Unknown anchor store backend: {config.backend}")
+        return cls(
+            store,
+            flush_interval=config.flush_interval,
+            max_batch_size=config.max_batch_size,
+            cache_ttl=config.cache_ttl,
+        )
+
+    def push(self, trace: AnchorTrace) -> None:
+        """异步写入一条锚点；本进程的缓存立即可见。"""
+        with self._condition:
+            self._pending_pushes.append(trace_to_record(trace))
+            cached = self._cache.get(trace.entry_id)
+            if cached is not None:
+                cached[1][trace.turn_index] = trace
+            if len(self._pending_pushes) == 1:
+                self._condition.notify()
+
+    def prefetch(self, entry_id: str) -> None:
+        """在后台拉取条目的锚点（已缓存且未过期时不拉取）。"""
+        with self._condition:
+            cached = self._cache.get(entry_id)
+            if cached is None or time.monotonic() - cached[0] > self.cache_ttl:
+                self._request_lookup(entry_id)
+
+    def latest(self, entry_id: str, turn_index: int) -> Optional[AnchorTrace]:
+        """
+        查询条目某轮次最近的锚点
+
+        Args:
+            entry_id: 条目ID
+            turn_index: 轮次
+
+        Returns:
+            Optional[AnchorTrace]: 缓存中的锚点；缓存未命中时返回 None（不等待，后台拉取后供之后的查询使用）
+        """
+        with self._condition:
+            cached = self._cache.get(entry_id)
+            if cached is None or time.monotonic() - cached[0] > self.cache_ttl:
+                self._request_lookup(entry_id)
+            if cached is None:
+                self.num_misses += 1
+                return None
+            self.num_hits += 1
+            return cached[1].get(turn_index)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "cached_entries": len(self._cache),
+            "hits": self.num_hits,
+            "misses": self.num_misses,
+            "errors": self.num_errors,
+        }
+
+    def flush(self) -> None:
+        """把队列中的写入与查询各合并为批次发给服务端。"""
+        with self._condition:
+            pushes = self._pending_pushes[: self.max_batch_size]
+            del self._pending_pushes[: len(pushes)]
+            lookups = list(self._pending_lookups)[: self.max_batch_size]
+            for entry_id in lookups:
+                del self._pending_lookups[entry_id]
+
+        if pushes:
+            try:
+                self.store.push_batch(pushes)
+            except Exception:
+                # 共享库暂时不可用时丢弃该批次：本进程的回放池中仍保留这些锚点
+                self.num_errors += 1
+        if lookups:
+            try:
+                results = self.store.lookup_batch(lookups)
+            except Exception:
+                self.num_errors += 1
+                results = {}
+            now = time.monotonic()
+            with self._condition:
+                for entry_id in lookups:
+                    if entry_id in results:
+                        turns = {}
+                        for record in results[entry_id]:
+                            trace = trace_from_record(record, entry_id)
+                            if trace is not None:
+                                turns[trace.turn_index] = trace
+                        self._cache[entry_id] = (now, turns)
+
+    def close(self) -> None:
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+        while self._pending_pushes:
+            self.flush()
+
+    def _request_lookup(self, entry_id: str) -> None:
+        # 调用方持有 self._condition
+        if entry_id not in self._pending_lookups:
+            self._pending_lookups[entry_id] = None
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if self._closed:
+                    return
+                if not self._pending_pushes and not self._pending_lookups:
+                    self._condition.wait()
+                    continue
+            # 等待一个批处理间隔，让同一时段的写入与查询合并
+            time.sleep(self.flush_interval)
+            self.flush()
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any, Dict
 
 
 @dataclass
@@ -18,10 +19,21 @@ class SeetConfig:
 
     # 课程机制开关
     enable_stage2_interception: bool = True
+    # Stage3+ 同组 rollout 之间交换 Peer 锚点
+    enable_peer_anchor: bool = True
 
-    # 回放池持久化（可选）
+    # 回放池持久化（可选）；启用环境服务时持久化需配合 Ray 共享锚点库，由其服务端独占写入文件
     replay_buffer_path: str = ""
     persist_replay_buffer_on_update: bool = False
+    # 回放池容量：每个 (条目, 轮次) 保留的锚点数，以及最多保留的条目数（0 表示不限，超出时淘汰最久未更新的条目）
+    replay_buffer_max_traces_per_turn: int = 4
+    replay_buffer_max_entries: int = 0
+    # 追加写持久化：后台刷盘间隔（秒），日志行数超过存活锚点数的该倍数时压缩重写
+    replay_buffer_flush_interval: float = 1.0
+    replay_buffer_compact_ratio: float = 4.0
+
+    # 跨 rollout 工作进程共享的锚点库（可选），字段见 AnchorStoreConfig：enabled / backend / name / cache_ttl 等
+    anchor_store: Dict[str, Any] = field(default_factory=dict)
 
     @property
     def use_augmented_env(self) -> bool:
@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 import ast
 
+from bfcl_env.tool_call import ToolCall
+
 
 @dataclass
 class ToolNode:
@@ -58,10 +60,14 @@ def _parse_call_string(call_str: str) -> ToolNode:
 
 def _normalize_step(step: Any) -> ToolNode:
     """
-    兼容两种调用表示：
-    1) 结构化 dict: {tool_name: {arg: value}}
-    2) 字符串: "tool_name(a=1)"
+    兼容三种调用表示：
+    1) ToolCall（交互主路径，已解码，无需再解析）
+    2) 结构化 dict: {tool_name: {arg: value}}
+    3) 字符串: "tool_name(a=1)"
     """
+    if isinstance(step, ToolCall):
+        return ToolNode(tool_name=step.name, arguments=step.arguments)
+
     if isinstance(step, str):
         return _parse_call_string(step)
 
@@ -2,7 +2,8 @@ import random
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
-from .anchor import AnchorReplayBuffer, AnchorTrace, DynamicAnchorSelector
+from .anchor import AnchorReplayBuffer, AnchorReplayLog, AnchorTrace, DynamicAnchorSelector, PeerAnchorBoard
+from .anchor_store import AnchorStoreConfig, SharedAnchorClient
 from .config import SeetConfig
 from .fpld import FPLDResult, first_logic_divergence
 
@@ -12,6 +13,8 @@ class RetryDecision:
     should_retry: bool
     hint_text: str = ""
     anchor_calls: Optional[List[Any]] = None
+    # 锚点来源：peer / standard / induced 等
+    anchor_type: Optional[str] = None
 
 
 class SeetRuntime:
@@ -22,11 +25,39 @@ class SeetRuntime:
     def __init__(self, config: SeetConfig):
         self.config = config
         # 中文注释：默认使用内存回放池；若配置了路径则在启动时尝试加载历史锚点。
-        if self.config.replay_buffer_path:
-            self.replay_buffer = AnchorReplayBuffer.load_from_file(self.config.replay_buffer_path)
+        buffer_caps = dict(
+            max_traces_per_turn=self.config.replay_buffer_max_traces_per_turn,
+            max_entries=self.config.replay_buffer_max_entries,
+        )
+        # 中文注释：启用共享锚点库时，回放池文件只由锚点库服务端加载与写入，本进程回放池从空开始。
+        self.anchor_store = SharedAnchorClient.from_config(
+            AnchorStoreConfig(**self.config.anchor_store),
+            server_kwargs=dict(
+                buffer_caps,
+                path=self.config.replay_buffer_path,
+                persist=self.config.persist_replay_buffer_on_update,
+                flush_interval=self.config.replay_buffer_flush_interval,
+                compact_ratio=self.config.replay_buffer_compact_ratio,
+            ),
+        )
+        if self.config.replay_buffer_path and self.anchor_store is None:
+            self.replay_buffer = AnchorReplayBuffer.load_from_file(self.config.replay_buffer_path, **buffer_caps)
         else:
-            self.replay_buffer = AnchorReplayBuffer()
-        self.selector = DynamicAnchorSelector(self.replay_buffer)
+            self.replay_buffer = AnchorReplayBuffer(**buffer_caps)
+        # 中文注释：开启持久化时，新锚点由后台线程追加写入文件，on_success 不做磁盘 IO。
+        self.replay_log: Optional[AnchorReplayLog] = None
+        if self.config.persist_replay_buffer_on_update and self.config.replay_buffer_path and self.anchor_store is None:
+            self.replay_log = AnchorReplayLog(
+                self.config.replay_buffer_path,
+                self.replay_buffer,
+                flush_interval=self.config.replay_buffer_flush_interval,
+                compact_ratio=self.config.replay_buffer_compact_ratio,
+            )
+        # 中文注释：同组 rollout 的 Peer 锚点公告板，仅在允许 Peer 锚点的阶段创建。
+        self.peer_board = (
+            PeerAnchorBoard() if self.config.enable_peer_anchor and self.config.allow_peer_anchor else None
+        )
+        self.selector = DynamicAnchorSelector(self.replay_buffer, self.anchor_store, self.peer_board)
 
     def _effective_retry_probability(self, turn_index: int = 0, total_turns: int = 1) -> float:
         """计算当前轮次有效重试概率。Stage3 使用线性退火，其余阶段使用固定概率。"""
@@ -45,40 +76,77 @@ class SeetRuntime:
             return False
         return random.random() <= self._effective_retry_probability(turn_index, total_turns)
 
-    def on_success(self, entry_id: str, turn_index: int, decoded_calls: List[Any], anchor_type: str) -> None:
-        """把成功轨迹注册为可复用锚点。"""
-        self.replay_buffer.push(
-            AnchorTrace(
-                entry_id=entry_id,
-                turn_index=turn_index,
-                decoded_calls=decoded_calls,
-                anchor_type=anchor_type,
-            )
+    def join_group(self, entry_id: str, instance_id: str) -> None:
+        """rollout 开始：加入同条目的 rollout 组，之后可使用组内 Peer 锚点。"""
+        if self.peer_board is not None:
+            self.peer_board.join(entry_id, instance_id)
+
+    def leave_group(self, entry_id: str, instance_id: str) -> None:
+        """rollout 结束：离开 rollout 组；组内全部离开后清空该组的 Peer 锚点。"""
+        if self.peer_board is not None:
+            self.peer_board.leave(entry_id, instance_id)
+
+    def on_success(
+        self,
+        entry_id: str,
+        turn_index: int,
+        decoded_calls: List[Any],
+        anchor_type: str,
+        instance_id: Optional[str] = None,
+    ) -> None:
+        """把成功轨迹注册为可复用锚点；给出 instance_id 时同时公布给同组其他 rollout。"""
+        trace = AnchorTrace(
+            entry_id=entry_id,
+            turn_index=turn_index,
+            decoded_calls=decoded_calls,
+            anchor_type=anchor_type,
         )
+        self.replay_buffer.push(trace)
 
-        if self.config.persist_replay_buffer_on_update and self.config.replay_buffer_path:
-            self.replay_buffer.save_to_file(self.config.replay_buffer_path)
+        if self.replay_log is not None:
+            self.replay_log.append(trace)
+        if self.anchor_store is not None:
+            self.anchor_store.push(trace)
+        if self.peer_board is not None and instance_id is not None:
+            self.peer_board.publish(instance_id, trace)
+
+    def prefetch_anchors(self, entry_id: str) -> None:
+        """交互开始时在后台拉取条目在共享锚点库中的历史锚点（仅在会使用历史锚点的阶段）。"""
+        if self.anchor_store is not None and self.config.allow_historical_anchor:
+            self.anchor_store.prefetch(entry_id)
 
     # 中文注释：按 Stage 策略选择锚点轨迹，作为失败样本的纠偏参考。
-    def choose_anchor_calls(
+    def choose_anchor(
         self,
         stage: int,
         entry_id: str,
         turn_index: int,
         induced_calls: Optional[List[Any]] = None,
-    ) -> Optional[List[Any]]:
+        instance_id: Optional[str] = None,
+    ) -> Optional[AnchorTrace]:
         induced_anchor = (
             AnchorTrace(entry_id=entry_id, turn_index=turn_index, decoded_calls=induced_calls or [], anchor_type="induced")
             if induced_calls
             else None
         )
-        chosen = self.selector.choose(
+        return self.selector.choose(
             stage=stage,
             entry_id=entry_id,
             turn_index=turn_index,
             peer_anchor=None,
             induced_anchor=induced_anchor,
+            instance_id=instance_id,
         )
+
+    def choose_anchor_calls(
+        self,
+        stage: int,
+        entry_id: str,
+        turn_index: int,
+        induced_calls: Optional[List[Any]] = None,
+        instance_id: Optional[str] = None,
+    ) -> Optional[List[Any]]:
+        chosen = self.choose_anchor(stage, entry_id, turn_index, induced_calls, instance_id)
         return chosen.decoded_calls if chosen else None
 
     def build_retry_hint(
@@ -88,9 +156,11 @@ class SeetRuntime:
         turn_index: int,
         fail_calls: Optional[List[Any]],
         induced_calls: Optional[List[Any]] = None,
+        instance_id: Optional[str] = None,
     ) -> RetryDecision:
-        """基于锚点和 FPLD 生成快通道提示。"""
-        anchor_calls = self.choose_anchor_calls(stage, entry_id, turn_index, induced_calls)
+        """基于锚点和 FPLD 生成快通道提示；给出 instance_id 时优先使用同组其他 rollout 的 Peer 锚点。"""
+        anchor = self.choose_anchor(stage, entry_id, turn_index, induced_calls, instance_id)
+        anchor_calls = anchor.decoded_calls if anchor else None
         if anchor_calls is None:
             return RetryDecision(False, "", None)
 
@@ -99,6 +169,7 @@ class SeetRuntime:
                 should_retry=True,
                 hint_text="[SEET] I could not find a valid tool call in the previous step. Please retry with a function call that matches the task goal and argument constraints.",
                 anchor_calls=anchor_calls,
+                anchor_type=anchor.anchor_type,
             )
 
         fpld: FPLDResult = first_logic_divergence(fail_calls, anchor_calls)
@@ -106,6 +177,7 @@ class SeetRuntime:
             should_retry=True,
             hint_text=f"[SEET-FPLD] {fpld.diagnosis}",
             anchor_calls=anchor_calls,
+            anchor_type=anchor.anchor_type,
         )
 
     # 中文注释：Slow Loop 核心数据结构，后续会被奖励函数或训练器消费。
@@ -113,8 +185,9 @@ class SeetRuntime:
         """构造慢通道反事实训练记录。"""
         fpld = first_logic_divergence(fail_calls, anchor_calls)
         return {
-            "fail_calls": fail_calls,
-            "anchor_calls": anchor_calls,
+            # 调用以字符串形式记录，便于日志与序列化
+            "fail_calls": [str(c) for c in fail_calls],
+            "anchor_calls": [str(c) for c in anchor_calls],
             "divergence_index": fpld.divergence_index,
             "diagnosis": fpld.diagnosis,
             "has_divergence": (fpld.divergence_index is not None and fpld.divergence_index >= 0),
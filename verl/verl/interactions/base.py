@@ -51,6 +51,16 @@ class BaseInteraction:
         additional_data: Dict[str, Any] = {}
         return should_terminate_sequence, response_content, current_turn_score, additional_data
 
+    def get_stop_sequences(self) -> Dict[str, List[Any]]:
+        """
+        Declares the stop conditions of the assistant turns generated in this interaction, which the rollout applies
+        to each engine call of a request with interaction kwargs.
+        Returns a dict with optional entries:
+        - stop (List[str]): Strings that end the generation. They are kept at the end of the generated text.
+        - stop_token_ids (List[int]): Token ids that end the generation.
+        """
+        return {}
+
     async def calculate_score(self) -> float:  # More clear score calculation method
         """
         Calculates a score for the interaction,
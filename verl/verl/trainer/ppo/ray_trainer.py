@@ -476,6 +476,8 @@ class RayPPOTrainer:
         # check multi_turn with tool config
         if config.actor_rollout_ref.rollout.multi_turn.enable:
             assert config.actor_rollout_ref.rollout.multi_turn.tool_config_path is not None or config.actor_rollout_ref.rollout.multi_turn.interaction_config_path is not None, "tool_config_path or interaction_config_path must be set when enabling multi_turn with tool, due to no role-playing support"
+            if config.actor_rollout_ref.rollout.multi_turn.get("partial_rollout", {}).get("enable", False):
+                assert config.algorithm.adv_estimator != AdvantageEstimator.REMAX, "partial_rollout does not support REMAX, whose greedy baseline is generated for the prompts of the current step only"
             assert config.algorithm.adv_estimator in [AdvantageEstimator.GRPO], "only GRPO is tested for multi-turn with tool"
 
         print("[validate_config] All configuration checks passed successfully!")
@@ -889,6 +891,53 @@ class RayPPOTrainer:
         else:
             print(f"Warning: No dataloader state found at {dataloader_local_path}, will start from scratch")
 
+    def _merge_partial_rollout(self, batch: DataProto, gen_batch_output: DataProto, metrics) -> DataProto:
+        """
+        Join the output of a partial rollout with the prompt-side data of its requests.
+
+        A partial rollout returns the requests completed in this step, whichever step their prompt came from, and keeps
+        the others for the next step. The prompt rows of the requests not returned yet are kept here until they are.
+        The batch is then cut to whole groups of n rows whose count is a multiple of the worker group size, since it is
+        split evenly across the workers; the groups cut off are trained on in the next step.
+        """
+        n = self.config.actor_rollout_ref.rollout.n
+        batch = batch.repeat(repeat_times=n, interleave=True)
+        batch.non_tensor_batch["rollout_offset"] = np.tile(np.arange(n, dtype=np.int64), len(batch) // n)
+        pending = batch if self._partial_rollout_pending is None else DataProto.concat([self._partial_rollout_pending, batch])
+
+        row_of_request = {key: i for i, key in enumerate(zip(pending.non_tensor_batch["uid"], pending.non_tensor_batch["rollout_offset"]))}
+        selected = np.array(
+            [row_of_request[key] for key in zip(gen_batch_output.non_tensor_batch["uid"], gen_batch_output.non_tensor_batch["rollout_offset"])],
+            dtype=np.int64,
+        )
+        remaining = np.setdiff1d(np.arange(len(pending), dtype=np.int64), selected)
+        self._partial_rollout_pending = pending.select_idxs(remaining) if len(remaining) > 0 else None
+
+        merged = pending.select_idxs(selected).union(gen_batch_output)
+        merged.non_tensor_batch.pop("rollout_offset")
+        if self._partial_rollout_held_back is not None:
+            merged = DataProto.concat([self._partial_rollout_held_back, merged])
+        # The rollout emits whole groups, so the rows of a group are never split between the kept and held back rows
+        group_rows = defaultdict(list)
+        for i, uid in enumerate(merged.non_tensor_batch["uid"]):
+            group_rows[uid].append(i)
+        kept, num_kept = [], 0
+        for rows in group_rows.values():
+            kept.extend(rows)
+            if len(kept) % self.actor_rollout_wg.world_size == 0:
+                num_kept = len(kept)
+        kept = np.array(kept[:num_kept], dtype=np.int64)
+        cut = np.setdiff1d(np.arange(len(merged), dtype=np.int64), kept)
+        self._partial_rollout_held_back = merged.select_idxs(cut) if len(cut) > 0 else None
+
+        metrics.update(
+            {
+                "rollout/partial/pending_rows": float(len(remaining)),
+                "rollout/partial/train_rows": float(num_kept),
+            }
+        )
+        return merged.select_idxs(kept) if len(cut) > 0 else merged
+
     def _balance_batch(self, batch: DataProto, metrics, logging_prefix="global_seqlen"):
         """Reorder the data on single controller such that each dp rank gets similar total tokens"""
         attention_mask = batch.batch["attention_mask"]
@@ -942,6 +991,12 @@ class RayPPOTrainer:
         self.global_steps += 1
         last_val_metrics = None
 
+        # With a partial rollout, the requests of a step may complete in a later step (see _merge_partial_rollout)
+        multi_turn_config = self.config.actor_rollout_ref.rollout.multi_turn
+        partial_rollout = multi_turn_config.enable and not self.async_rollout_mode and multi_turn_config.get("partial_rollout", {}).get("enable", False)
+        self._partial_rollout_pending: Optional[DataProto] = None
+        self._partial_rollout_held_back: Optional[DataProto] = None
+
         for epoch in range(self.config.trainer.total_epochs):
             for batch_dict in self.train_dataloader:
                 do_profile = self.global_steps in self.config.trainer.profile_steps if self.config.trainer.profile_steps is not None else False
@@ -973,6 +1028,10 @@ class RayPPOTrainer:
                     batch_keys=batch_keys_to_pop,
                     non_tensor_batch_keys=non_tensor_batch_keys_to_pop,
                 )
+                if partial_rollout:
+                    # The rollout labels its output with the uid of the prompt, which may be from an earlier step
+                    batch.non_tensor_batch["uid"] = np.array([str(uuid.uuid4()) for _ in range(len(batch.batch))], dtype=object)
+                    gen_batch.non_tensor_batch["uid"] = batch.non_tensor_batch["uid"]
 
                 is_last_step = self.global_steps >= self.total_training_steps
 
@@ -987,6 +1046,7 @@ class RayPPOTrainer:
                             self.async_rollout_manager.sleep()
                         timing_raw.update(gen_batch_output.meta_info["timing"])
                         gen_batch_output.meta_info.pop("timing", None)
+                        metrics.update(gen_batch_output.meta_info.pop("metrics", None) or {})
 
                     if self.config.algorithm.adv_estimator == AdvantageEstimator.REMAX:
                         with marked_timer("gen_max", timing_raw, color="purple"):
@@ -1004,10 +1064,13 @@ class RayPPOTrainer:
 
                             del gen_baseline_batch, gen_baseline_output
 
-                    batch.non_tensor_batch["uid"] = np.array([str(uuid.uuid4()) for _ in range(len(batch.batch))], dtype=object)
-                    # repeat to align with repeated responses in rollout
-                    batch = batch.repeat(repeat_times=self.config.actor_rollout_ref.rollout.n, interleave=True)
-                    batch = batch.union(gen_batch_output)
+                    if partial_rollout:
+                        batch = self._merge_partial_rollout(batch, gen_batch_output, metrics=metrics)
+                    else:
+                        batch.non_tensor_batch["uid"] = np.array([str(uuid.uuid4()) for _ in range(len(batch.batch))], dtype=object)
+                        # repeat to align with repeated responses in rollout
+                        batch = batch.repeat(repeat_times=self.config.actor_rollout_ref.rollout.n, interleave=True)
+                        batch = batch.union(gen_batch_output)
 
                     batch.batch["response_mask"] = compute_response_mask(batch)
                     # Balance the number of valid tokens across DP ranks.
@@ -1092,6 +1155,8 @@ class RayPPOTrainer:
 
                         if reward_extra_infos_dict:
                             batch.non_tensor_batch.update({k: np.array(v) for k, v in reward_extra_infos_dict.items()})
+                            # SEET counters (e.g. retries and turns saved by peer anchors) are reported as step totals
+                            metrics.update({f"seet/{k}": float(np.sum(v)) for k, v in reward_extra_infos_dict.items() if k.startswith("seet_") and k.endswith("_count")})
 
                         # compute rewards. apply_kl_penalty if available
                         if self.config.algorithm.use_kl_in_reward:
@@ -673,6 +673,9 @@ class ActorRolloutRefWorker(Worker, DistProfilerExtension):
         # to make sure meta_info["timing"] is the same
         timing_generate = reduce_timing(timing_generate)
         output.meta_info["timing"] = timing_generate
+        if output.meta_info.get("metrics"):
+            # Rollout metrics (e.g. admission queue wait) are averaged across all ranks, like the timing
+            output.meta_info["metrics"] = reduce_timing(output.meta_info["metrics"])
         output = output.to("cpu")
 
         # clear kv cache
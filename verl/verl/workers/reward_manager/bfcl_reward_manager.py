@@ -10,7 +10,7 @@ from verl.workers.reward_manager import register
 class BFCLRewardManager:
     """The reward manager."""
 
-    def __init__(self, tokenizer, num_examine, compute_score=None, reward_fn_key="data_source") -> None:
+    def __init__(self, tokenizer, num_examine, compute_score=None, reward_fn_key="data_source", batched=False) -> None:
         """
         Initialize the NaiveRewardManager instance.
 
@@ -19,11 +19,15 @@ class BFCLRewardManager:
             num_examine: The number of batches of decoded responses to print to the console for debugging purpose.
             compute_score: A function to compute the reward score. If None, `default_compute_score` will be used.
             reward_fn_key: The key used to access the data source in the non-tensor batch data. Defaults to "data_source".
+            batched: Whether `compute_score` scores the whole batch in one call (e.g. `compute_score_batch` of
+                `env_tuning/bfcl_reward.py`), taking the arrays of the batch and returning one score per sample.
+                Otherwise it is called once per sample. Set with `reward_model.reward_kwargs.batched`.
         """
         self.tokenizer = tokenizer  # Store the tokenizer for decoding token IDs
         self.num_examine = num_examine  # the number of batches of decoded responses to print to the console
         self.compute_score = compute_score
         self.reward_fn_key = reward_fn_key  # Store the key for accessing the data source
+        self.batched = batched
 
     def __call__(self, data: DataProto, return_dict=False):
         """We will expand this function gradually based on the available datasets"""
@@ -38,61 +42,49 @@ class BFCLRewardManager:
         reward_tensor = torch.zeros_like(data.batch["responses"], dtype=torch.float32)
         reward_extra_info = defaultdict(list)
 
-        already_print_data_sources = {}
-
-        for i in range(len(data)):
-            data_item = data[i]  # DataProtoItem
-
-            prompt_ids = data_item.batch["prompts"]
-
-            prompt_length = prompt_ids.shape[-1]
-
-            valid_prompt_length = data_item.batch["attention_mask"][:prompt_length].sum()
-            valid_prompt_ids = prompt_ids[-valid_prompt_length:]
-
-            response_ids = data_item.batch["responses"]
-            valid_response_length = data_item.batch["attention_mask"][prompt_length:].sum()
-            valid_response_ids = response_ids[:valid_response_length]
-
-            # decode
-            prompt_str = self.tokenizer.decode(valid_prompt_ids, skip_special_tokens=True)
-            response_str = self.tokenizer.decode(valid_response_ids, skip_special_tokens=True)
+        # Valid lengths of the whole batch at once, instead of slicing a DataProtoItem per sample
+        prompt_length = data.batch["prompts"].shape[-1]
+        attention_mask = data.batch["attention_mask"]
+        valid_prompt_lengths = attention_mask[:, :prompt_length].sum(dim=-1)
+        valid_response_lengths = attention_mask[:, prompt_length:].sum(dim=-1)
 
-            ground_truth = data_item.non_tensor_batch["reward_model"]["ground_truth"]
-            data_source = data_item.non_tensor_batch[self.reward_fn_key]
-            extra_info = data_item.non_tensor_batch.get("extra_info", None)
-            reward_scores = data_item.non_tensor_batch["reward_scores"]
-
-            score = self.compute_score(
-                data_source=data_source,
-                reward_scores=reward_scores,
-                ground_truth=ground_truth,
-                extra_info=extra_info,
-            )
+        # The score only depends on the rollout reward scores and the ground truth, so no text is decoded here
+        data_sources = data.non_tensor_batch[self.reward_fn_key]
+        ground_truths = [reward_model["ground_truth"] for reward_model in data.non_tensor_batch["reward_model"]]
+        extra_infos = data.non_tensor_batch.get("extra_info", [None] * len(data))
+        scores = self._compute_scores(data_sources, data.non_tensor_batch["reward_scores"], ground_truths, extra_infos)
 
+        rewards = []
+        for score in scores:
             if isinstance(score, dict):
-                reward = score["score"]
+                rewards.append(score["score"])
                 # Store the information including original reward
                 for key, value in score.items():
                     reward_extra_info[key].append(value)
             else:
-                reward = score
+                rewards.append(score)
 
-            reward_tensor[i, valid_response_length - 1] = reward
+        # The reward of a sample goes on its last valid response token
+        reward_tensor[torch.arange(len(data), device=reward_tensor.device), valid_response_lengths - 1] = torch.tensor(rewards, dtype=torch.float32, device=reward_tensor.device)
 
-            if data_source not in already_print_data_sources:
-                already_print_data_sources[data_source] = 0
-
-            if already_print_data_sources[data_source] < self.num_examine:
-                already_print_data_sources[data_source] += 1
-                print("[prompt]", prompt_str)
-                print("[response]", response_str)
-                print("[ground_truth]", ground_truth)
-                if isinstance(score, dict):
-                    for key, value in score.items():
-                        print(f"[{key}]", value)
-                else:
-                    print("[score]", score)
+        already_print_data_sources = {}
+        for i, data_source in enumerate(data_sources):
+            if already_print_data_sources.get(data_source, 0) >= self.num_examine:
+                continue
+            already_print_data_sources[data_source] = already_print_data_sources.get(data_source, 0) + 1
+
+            # Only the printed samples are decoded
+            valid_prompt_ids = data.batch["prompts"][i][-valid_prompt_lengths[i] :]
+            valid_response_ids = data.batch["responses"][i][: valid_response_lengths[i]]
+            print("[prompt]", self.tokenizer.decode(valid_prompt_ids, skip_special_tokens=True))
+            print("[response]", self.tokenizer.decode(valid_response_ids, skip_special_tokens=True))
+            print("[ground_truth]", ground_truths[i])
+            score = scores[i]
+            if isinstance(score, dict):
+                for key, value in score.items():
+                    print(f"[{key}]", value)
+            else:
+                print("[score]", score)
 
         if return_dict:
             return {
@@ -101,3 +93,22 @@ class BFCLRewardManager:
             }
         else:
             return reward_tensor
+
+    def _compute_scores(self, data_sources, reward_scores, ground_truths, extra_infos) -> list:
+        """Score every sample of the batch from its rollout reward scores and ground truth."""
+        if self.batched:
+            return self.compute_score(
+                data_sources=data_sources,
+                reward_scores=reward_scores,
+                ground_truths=ground_truths,
+                extra_infos=extra_infos,
+            )
+        return [
+            self.compute_score(
+                data_source=data_source,
+                reward_scores=sample_reward_scores,
+                ground_truth=ground_truth,
+                extra_info=extra_info,
+            )
+            for data_source, sample_reward_scores, ground_truth, extra_info in zip(data_sources, reward_scores, ground_truths, extra_infos)
+        ]
@@ -13,13 +13,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import difflib
+import functools
+import json
 import logging
 import os
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
 
 import torch
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, PrivateAttr, model_validator
 from transformers import PreTrainedTokenizer, PreTrainedTokenizerFast, ProcessorMixin
 
 from verl.tools.schemas import OpenAIFunctionToolCall, OpenAIFunctionToolSchema
@@ -30,6 +32,71 @@ logger.setLevel(os.getenv("VERL_LOGGING_LEVEL", "WARN"))
 
 BASE_CHAT_HISTORY = [{"role": "system", "content": "You are a helpful assistant."}, {"role": "user", "content": "I am a user."}]
 
+# Roles whose appended messages can be tokenized without rendering the chat template
+INCREMENTAL_ROLES = ("user", "assistant", "tool")
+_CONTENT_PLACEHOLDER = "VERL_CONTENT_PLACEHOLDER"
+# Contents rendered to check that the chat template inserts message contents verbatim
+_PROBE_CONTENTS = ("x", "  x \n\n", "<think>\nx\n</think>\n\ny", '<tool_call>\n{"name": "x"}\n</tool_call>')
+
+
+class ChatTemplateDelimiters(NamedTuple):
+    """The text a chat template puts around a message, see `get_chat_template_delimiters`."""
+
+    # role -> (anchor text, number of anchor tokens, text before the content, text after the content)
+    roles: Dict[str, Tuple[str, int, str, str]]
+    # Whether a whole conversation renders as the concatenation of its messages rendered one by one
+    history_stable: bool
+
+
+@functools.lru_cache(maxsize=16)
+def get_chat_template_delimiters(processing_class: Union[PreTrainedTokenizer, PreTrainedTokenizerFast], tools_json: Optional[str]) -> ChatTemplateDelimiters:
+    """Find, once per tokenizer and tool set, the per-role text the chat template puts around a message appended after BASE_CHAT_HISTORY.
+
+    A role is only listed when the template inserts the content verbatim between a fixed prefix and suffix, checked on
+    a few probe contents. An appended message is then tokenized as `anchor + prefix + content + suffix`, where the
+    anchor is the last message of BASE_CHAT_HISTORY (plus the generation prompt for assistant messages) whose tokens
+    are dropped. This gives the same ids as rendering BASE_CHAT_HISTORY with the message and slicing off the base
+    conversation, as long as the tokenizer does not merge tokens across the start of a message, which holds for
+    templates that open every message with a special token.
+    """
+    tools = json.loads(tools_json) if tools_json else None
+
+    def render(messages: List[Dict[str, Any]], add_generation_prompt: bool = False) -> str:
+        return processing_class.apply_chat_template(messages, tools=tools, add_generation_prompt=add_generation_prompt, tokenize=False)
+
+    base_text = render(BASE_CHAT_HISTORY)
+    base_with_gen_text = render(BASE_CHAT_HISTORY, add_generation_prompt=True)
+    if not base_with_gen_text.startswith(base_text):
+        return ChatTemplateDelimiters(roles={}, history_stable=False)
+    generation_prompt_text = base_with_gen_text[len(base_text) :]
+    # Only the last base message is tokenized again with every appended message
+    system_text = render(BASE_CHAT_HISTORY[:1])
+    anchor_text = base_text[len(system_text) :] if system_text and base_text.startswith(system_text) else base_text
+
+    roles = {}
+    for role in INCREMENTAL_ROLES:
+        # Assistant messages follow the generation prompt, which is already part of input_ids
+        role_base_text = base_with_gen_text if role == "assistant" else base_text
+        role_anchor_text = anchor_text + generation_prompt_text if role == "assistant" else anchor_text
+        rendered = render([*BASE_CHAT_HISTORY, {"role": role, "content": _CONTENT_PLACEHOLDER}])
+        if not rendered.startswith(role_base_text) or rendered.count(_CONTENT_PLACEHOLDER) != 1:
+            continue
+        prefix, suffix = rendered[len(role_base_text) :].split(_CONTENT_PLACEHOLDER)
+        if all(render([*BASE_CHAT_HISTORY, {"role": role, "content": content}]) == role_base_text + prefix + content + suffix for content in _PROBE_CONTENTS):
+            roles[role] = (role_anchor_text, len(processing_class.encode(role_anchor_text, add_special_tokens=False)), prefix, suffix)
+
+    history_stable = False
+    if len(roles) == len(INCREMENTAL_ROLES):
+        # Every probe content in every role and position, e.g. reasoning of earlier assistant turns must be kept
+        conversation = [{"role": role, "content": content} for content in _PROBE_CONTENTS for role in ("assistant", "tool", "assistant", "user")]
+        expected_text = base_text
+        for message in conversation:
+            _, _, prefix, suffix = roles[message["role"]]
+            expected_text += (generation_prompt_text if message["role"] == "assistant" else "") + prefix + message["content"] + suffix
+        history_stable = render([*BASE_CHAT_HISTORY, *conversation], add_generation_prompt=True) == expected_text + generation_prompt_text
+
+    return ChatTemplateDelimiters(roles=roles, history_stable=history_stable)
+
 
 class FinishReasonTypeEnum(str, Enum):
     """The enum for finish reason type."""
@@ -112,6 +179,10 @@ class AsyncRolloutRequest(BaseModel):
     base_conv_wo_gen_prompt_end_pos: int
     base_conv_with_gen_prompt_end_pos: int
 
+    # Whether input_ids equals the chat template applied to the whole conversation, see `get_generation_prompt_ids`
+    _incremental_history: bool = PrivateAttr(default=True)
+    _tools_json: Optional[str] = PrivateAttr(default=None)
+
     @model_validator(mode="before")
     @classmethod
     def initialize_request(cls, values):
@@ -156,6 +227,10 @@ class AsyncRolloutRequest(BaseModel):
 
         return values
 
+    def model_post_init(self, __context: Any) -> None:
+        self._incremental_history = all(isinstance(msg.content, str) and not msg.tool_calls for msg in self.messages)
+        self._tools_json = json.dumps([tool.model_dump() for tool in self.tool_schemas]) if self.tool_schemas else None
+
     @staticmethod
     def _handle_apply_chat_template(
         processing_class: Union[PreTrainedTokenizer, PreTrainedTokenizerFast, ProcessorMixin],
@@ -207,6 +282,9 @@ class AsyncRolloutRequest(BaseModel):
             self._update_input_ids(generation_prompt_ids, attention_mask=True, loss_mask=False)
 
         if self.use_inference_chat_template:
+            if self._incremental_history and self._get_chat_template_delimiters(processing_class).history_stable:
+                # Every message was tokenized on its own with a template that renders messages independently, so input_ids already is the templated conversation
+                return self.input_ids
             messages = [msg.model_dump() for msg in self.messages]
             tools = [tool.model_dump() for tool in self.tool_schemas] if self.tool_schemas else None
             generation_prompt_ids = self._handle_apply_chat_template(processing_class, messages, multi_modal_data=self.multi_modal_data, tools=tools, add_generation_prompt=True, tokenize=True)
@@ -220,11 +298,14 @@ class AsyncRolloutRequest(BaseModel):
         content: str,
     ) -> None:
         self.messages.append(Message(role="user", content=content))
-        messages = [*BASE_CHAT_HISTORY, self.messages[-1]]
-        tools = [tool.model_dump() for tool in self.tool_schemas] if self.tool_schemas else None
+        content_ids = self._tokenize_appended_message(processing_class, "user", content)
+        if content_ids is None:
+            self._incremental_history = False
+            messages = [*BASE_CHAT_HISTORY, self.messages[-1]]
+            tools = [tool.model_dump() for tool in self.tool_schemas] if self.tool_schemas else None
 
-        # We don't need to pass multi_modal_data here because we don't have any multi-modal data from Engine Inference, it is pure text.
-        content_ids = self._handle_apply_chat_template(processing_class, messages, multi_modal_data={}, tools=tools, add_generation_prompt=False, tokenize=True)[self.base_conv_wo_gen_prompt_end_pos :]
+            # We don't need to pass multi_modal_data here because we don't have any multi-modal data from Engine Inference, it is pure text.
+            content_ids = self._handle_apply_chat_template(processing_class, messages, multi_modal_data={}, tools=tools, add_generation_prompt=False, tokenize=True)[self.base_conv_wo_gen_prompt_end_pos :]
         self._update_input_ids(content_ids, attention_mask=True, loss_mask=False)
 
     def add_assistant_message(
@@ -235,11 +316,15 @@ class AsyncRolloutRequest(BaseModel):
     ) -> None:
         self.messages.append(Message(role="assistant", content=content, tool_calls=tool_calls))
 
-        messages = [*BASE_CHAT_HISTORY, self.messages[-1]]
-        tools = [tool.model_dump() for tool in self.tool_schemas] if self.tool_schemas else None
+        # Tool calls are rendered by the template, so they always go through it
+        content_ids = None if tool_calls else self._tokenize_appended_message(processing_class, "assistant", content)
+        if content_ids is None:
+            self._incremental_history = False
+            messages = [*BASE_CHAT_HISTORY, self.messages[-1]]
+            tools = [tool.model_dump() for tool in self.tool_schemas] if self.tool_schemas else None
 
-        # We don't need to pass multi_modal_data here because we don't have any multi-modal data from Engine Inference, it is pure text.
-        content_ids = self._handle_apply_chat_template(processing_class, messages, multi_modal_data={}, tools=tools, add_generation_prompt=False, tokenize=True)[self.base_conv_with_gen_prompt_end_pos :]
+            # We don't need to pass multi_modal_data here because we don't have any multi-modal data from Engine Inference, it is pure text.
+            content_ids = self._handle_apply_chat_template(processing_class, messages, multi_modal_data={}, tools=tools, add_generation_prompt=False, tokenize=True)[self.base_conv_with_gen_prompt_end_pos :]
         self._update_input_ids(content_ids, attention_mask=True, loss_mask=True)
 
     def add_tool_response_messages(self, processing_class: Union[PreTrainedTokenizer, PreTrainedTokenizerFast, ProcessorMixin], contents: list[str]) -> None:
@@ -248,13 +333,34 @@ class AsyncRolloutRequest(BaseModel):
 
         self.messages.extend([Message(role="tool", content=content) for content in contents])
 
-        messages = [*BASE_CHAT_HISTORY, *self.messages[-len(contents) :]]
-        tools = [tool.model_dump() for tool in self.tool_schemas] if self.tool_schemas else None
+        # Templates may group consecutive tool responses, so only a single response is tokenized on its own
+        content_ids = self._tokenize_appended_message(processing_class, "tool", contents[0]) if len(contents) == 1 else None
+        if content_ids is None:
+            self._incremental_history = False
+            messages = [*BASE_CHAT_HISTORY, *self.messages[-len(contents) :]]
+            tools = [tool.model_dump() for tool in self.tool_schemas] if self.tool_schemas else None
 
-        # Currently we don't support tool creates multi-modal data
-        content_ids = self._handle_apply_chat_template(processing_class, messages, multi_modal_data={}, tools=tools, add_generation_prompt=False, tokenize=True)[self.base_conv_wo_gen_prompt_end_pos :]
+            # Currently we don't support tool creates multi-modal data
+            content_ids = self._handle_apply_chat_template(processing_class, messages, multi_modal_data={}, tools=tools, add_generation_prompt=False, tokenize=True)[self.base_conv_wo_gen_prompt_end_pos :]
         self._update_input_ids(content_ids, attention_mask=True, loss_mask=False)
 
+    def _get_chat_template_delimiters(self, processing_class: Union[PreTrainedTokenizer, PreTrainedTokenizerFast, ProcessorMixin]) -> ChatTemplateDelimiters:
+        if not isinstance(processing_class, (PreTrainedTokenizer, PreTrainedTokenizerFast)):
+            return ChatTemplateDelimiters(roles={}, history_stable=False)
+        return get_chat_template_delimiters(processing_class, self._tools_json)
+
+    def _tokenize_appended_message(self, processing_class: Union[PreTrainedTokenizer, PreTrainedTokenizerFast, ProcessorMixin], role: str, content: Any) -> Optional[List[int]]:
+        """
+        Tokenize a message appended to the conversation from the cached delimiters of its role, without rendering the chat template.
+        The cost only depends on the length of the message. Returns None when the template does not allow it, in which case the
+        caller falls back to the template and input_ids may no longer match the templated conversation.
+        """
+        role_delimiters = self._get_chat_template_delimiters(processing_class).roles.get(role) if isinstance(content, str) else None
+        if role_delimiters is None:
+            return None
+        anchor_text, num_anchor_ids, prefix, suffix = role_delimiters
+        return processing_class.encode(anchor_text + prefix + content + suffix, add_special_tokens=False)[num_anchor_ids:]
+
     def update_metrics(self, metrics: Any, tool_id: str) -> None:
         """
         metrics: should be a dict of tools_name -> Any
@@ -0,0 +1,249 @@
+# Copyright 2025 ModelBest Inc. and/or its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Admission control for request-level multi-turn rollout.
+
+Launching every request of a batch at once makes all conversations contend for the KV cache, so the engine keeps
+preempting the long ones. The :class:`AdmissionController` bounds the number of requests in flight and the tokens
+they may occupy, and admits the waiting requests in the order chosen by an :class:`AdmissionPolicy`.
+"""
+
+import asyncio
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Type
+
+import numpy as np
+
+
+@dataclass
+class AdmissionTicket:
+    """A request waiting for, or holding, a slot of the controller."""
+
+    tokens: int
+    group: Any = None
+    seq: int = 0
+    enqueue_time: float = 0.0
+    admit_time: Optional[float] = None
+    future: Optional[asyncio.Future] = field(default=None, repr=False)
+
+
+class AdmissionPolicy:
+    """Chooses which waiting request to admit next. Subclasses override :meth:`select`."""
+
+    def select(self, waiting: List[AdmissionTicket], active_groups: Counter) -> int:
+        """
+        Args:
+            waiting: The waiting tickets, in arrival order (never empty).
+            active_groups: Number of admitted requests in flight, by group.
+
+        Returns:
+            The index in ``waiting`` of the ticket to admit next.
+        """
+        raise NotImplementedError
+
+
+ADMISSION_POLICIES: Dict[str, Type[AdmissionPolicy]] = {}
+
+
+def register_admission_policy(name: str) -> Callable[[Type[AdmissionPolicy]], Type[AdmissionPolicy]]:
+    """Register an admission policy under ``name``, to select it with ``multi_turn.admission.policy``."""
+
+    def decorator(cls: Type[AdmissionPolicy]) -> Type[AdmissionPolicy]:
+        ADMISSION_POLICIES[name] = cls
+        return cls
+
+    return decorator
+
+
+@register_admission_policy("fifo")
+class FifoPolicy(AdmissionPolicy):
+    """Admit the requests in arrival order."""
+
+    def select(self, waiting: List[AdmissionTicket], active_groups: Counter) -> int:
+        return 0
+
+
+@register_admission_policy("shortest_first")
+class ShortestFirstPolicy(AdmissionPolicy):
+    """Admit the request with the fewest reserved tokens first, which lowers the mean latency."""
+
+    def select(self, waiting: List[AdmissionTicket], active_groups: Counter) -> int:
+        return min(range(len(waiting)), key=lambda i: (waiting[i].tokens, waiting[i].seq))
+
+
+@register_admission_policy("longest_first")
+class LongestFirstPolicy(AdmissionPolicy):
+    """Admit the request with the most reserved tokens first, so the longest episodes do not finish last."""
+
+    def select(self, waiting: List[AdmissionTicket], active_groups: Counter) -> int:
+        return min(range(len(waiting)), key=lambda i: (-waiting[i].tokens, waiting[i].seq))
+
+
+@register_admission_policy("group_affinity")
+class GroupAffinityPolicy(AdmissionPolicy):
+    """
+    Admit the siblings of the groups already in flight first (e.g. the other rollouts of the same prompt), so they run
+    while the shared prompt prefix is still in the prefix cache. Falls back to arrival order.
+    """
+
+    def select(self, waiting: List[AdmissionTicket], active_groups: Counter) -> int:
+        for i, ticket in enumerate(waiting):
+            if ticket.group is not None and active_groups[ticket.group] > 0:
+                return i
+        return 0
+
+
+class AdmissionController:
+    """
+    Admits requests while the number of requests in flight and the tokens they reserve are within the limits.
+
+    A request that does not fit waits until enough admitted requests are released. A request larger than the token
+    budget is admitted alone once nothing else is in flight, so it can not block the batch forever. The policy chooses
+    the next request, and admission stops at the first one that does not fit, so a large request is not starved by
+    smaller ones behind it.
+
+    All methods must be called from the event loop thread.
+    """
+
+    def __init__(self, max_inflight_requests: int = 0, max_inflight_tokens: int = 0, policy: str = "fifo"):
+        """
+        Args:
+            max_inflight_requests: Maximum number of requests in flight (0 for no limit).
+            max_inflight_tokens: Maximum number of tokens reserved by the requests in flight (0 for no limit).
+            policy: Name of a registered admission policy, see ``ADMISSION_POLICIES``.
+        """
+        if policy not in ADMISSION_POLICIES:
+            raise ValueError(f"Unknown admission policy {policy!r}, expected one of {sorted(ADMISSION_POLICIES)}")
+        self.max_inflight_requests = max_inflight_requests
+        self.max_inflight_tokens = max_inflight_tokens
+        self.policy = ADMISSION_POLICIES[policy]()
+
+        self._waiting: List[AdmissionTicket] = []
+        self._active_groups: Counter = Counter()
+        self._seq = 0
+        self._dispatch_scheduled = False
+        self.inflight_requests = 0
+        self.inflight_tokens = 0
+
+        # Metrics
+        self.peak_inflight_requests = 0
+        self.peak_inflight_tokens = 0
+        self.peak_waiting = 0
+        self._wait_times: List[float] = []
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "AdmissionController":
+        """Build a controller from the ``multi_turn.admission`` config; a missing config admits every request at once."""
+        config = config or {}
+        return cls(
+            max_inflight_requests=config.get("max_inflight_requests", 0) or 0,
+            max_inflight_tokens=config.get("max_inflight_tokens", 0) or 0,
+            policy=config.get("policy", "fifo") or "fifo",
+        )
+
+    async def acquire(self, tokens: int, group: Any = None) -> AdmissionTicket:
+        """
+        Wait until the request is admitted.
+
+        Args:
+            tokens: Number of tokens the request may occupy in the KV cache.
+            group: Key of the group of the request, e.g. the prompt it was sampled from.
+
+        Returns:
+            The ticket of the request, to pass to :meth:`release`.
+        """
+        ticket = AdmissionTicket(tokens=tokens, group=group, seq=self._seq, enqueue_time=time.perf_counter())
+        self._seq += 1
+        ticket.future = asyncio.get_running_loop().create_future()
+        self._waiting.append(ticket)
+        self.peak_waiting = max(self.peak_waiting, len(self._waiting))
+        if not self._dispatch_scheduled:
+            # Requests submitted together (e.g. by one gather) are all queued before the policy orders them
+            self._dispatch_scheduled = True
+            asyncio.get_running_loop().call_soon(self._scheduled_dispatch)
+        try:
+            await ticket.future
+        except asyncio.CancelledError:
+            if ticket.admit_time is None:
+                self._waiting.remove(ticket)
+            else:
+                self.release(ticket)
+            raise
+        return ticket
+
+    def release(self, ticket: AdmissionTicket) -> None:
+        """Release the slot and tokens of an admitted request, and admit the waiting requests that now fit."""
+        self.inflight_requests -= 1
+        self.inflight_tokens -= ticket.tokens
+        self._active_groups[ticket.group] -= 1
+        if self._active_groups[ticket.group] <= 0:
+            del self._active_groups[ticket.group]
+        self._dispatch()
+
+    @asynccontextmanager
+    async def admit(self, tokens: int, group: Any = None) -> AsyncIterator[AdmissionTicket]:
+        """Hold a slot of the controller for the duration of the block."""
+        ticket = await self.acquire(tokens, group)
+        try:
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    def metrics(self, prefix: str = "rollout/admission") -> Dict[str, float]:
+        """Queue wait time of the admitted requests (in seconds) and the peak load, to tune the limits."""
+        wait_times = np.asarray(self._wait_times, dtype=np.float64)
+        has_waits = wait_times.size > 0
+        return {
+            f"{prefix}/admitted": float(wait_times.size),
+            f"{prefix}/queue_wait_mean": float(wait_times.mean()) if has_waits else 0.0,
+            f"{prefix}/queue_wait_p50": float(np.percentile(wait_times, 50)) if has_waits else 0.0,
+            f"{prefix}/queue_wait_p95": float(np.percentile(wait_times, 95)) if has_waits else 0.0,
+            f"{prefix}/queue_wait_max": float(wait_times.max()) if has_waits else 0.0,
+            f"{prefix}/peak_inflight_requests": float(self.peak_inflight_requests),
+            f"{prefix}/peak_inflight_tokens": float(self.peak_inflight_tokens),
+            f"{prefix}/peak_waiting": float(self.peak_waiting),
+        }
+
+    def _fits(self, ticket: AdmissionTicket) -> bool:
+        if self.inflight_requests == 0:
+            return True
+        if self.max_inflight_requests and self.inflight_requests >= self.max_inflight_requests:
+            return False
+        if self.max_inflight_tokens and self.inflight_tokens + ticket.tokens > self.max_inflight_tokens:
+            return False
+        return True
+
+    def _scheduled_dispatch(self) -> None:
+        self._dispatch_scheduled = False
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while self._waiting:
+            index = self.policy.select(self._waiting, self._active_groups)
+            ticket = self._waiting[index]
+            if not self._fits(ticket):
+                return
+            del self._waiting[index]
+            ticket.admit_time = time.perf_counter()
+            self._wait_times.append(ticket.admit_time - ticket.enqueue_time)
+            self.inflight_requests += 1
+            self.inflight_tokens += ticket.tokens
+            self._active_groups[ticket.group] += 1
+            self.peak_inflight_requests = max(self.peak_inflight_requests, self.inflight_requests)
+            self.peak_inflight_tokens = max(self.peak_inflight_tokens, self.inflight_tokens)
+            if not ticket.future.done():
+                ticket.future.set_result(None)
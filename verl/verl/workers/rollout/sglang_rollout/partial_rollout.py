@@ -0,0 +1,330 @@
+# Copyright 2025 ModelBest Inc. and/or its affiliates
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Partial rollout for request-level multi-turn rollout.
+
+A multi-turn step lasts as long as its slowest episode, and the engine runs almost empty while the last few
+stragglers wait on their environment. The :class:`PartialRolloutController` suspends the unfinished requests once
+enough prompts have completed all their rollouts (or a deadline has passed), keeps them with their progress, and
+resumes them in the next step, so the trainer proceeds with the completed prompts. The :class:`EngineIdleTracker`
+measures the time the engine has no request to serve.
+"""
+
+import asyncio
+import math
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Dict, Iterator, List, Optional, Tuple
+
+
+@dataclass
+class RolloutProgress:
+    """The loop state of a multi-turn request, saved when the request is suspended and restored when it resumes."""
+
+    current_turns: int = 0
+    user_turns: int = 0
+    user_turn_rewards: List[float] = field(default_factory=list)
+    interaction_turn_metrics: List[dict] = field(default_factory=list)
+    num_suspensions: int = 0
+
+
+@dataclass
+class SuspendedRollout:
+    """A request suspended before it completed, resumed in the next step."""
+
+    request: Any
+    progress: RolloutProgress
+
+
+class EngineIdleTracker:
+    """
+    Accumulates the time no engine call is in flight, i.e. the engine waits on tools, interactions, or the admission
+    queue. All methods must be called from the event loop thread.
+    """
+
+    def __init__(self):
+        self.idle_time = 0.0
+        self._inflight = 0
+        self._start_time: Optional[float] = None
+        self._end_time: Optional[float] = None
+        self._idle_since: Optional[float] = None
+
+    def start(self) -> None:
+        self._start_time = self._idle_since = time.perf_counter()
+
+    def stop(self) -> None:
+        self._end_time = time.perf_counter()
+        if self._idle_since is not None:
+            self.idle_time += self._end_time - self._idle_since
+            self._idle_since = None
+
+    @contextmanager
+    def busy(self) -> Iterator[None]:
+        """Mark the engine busy for the duration of the block."""
+        if self._inflight == 0 and self._idle_since is not None:
+            self.idle_time += time.perf_counter() - self._idle_since
+            self._idle_since = None
+        self._inflight += 1
+        try:
+            yield
+        finally:
+            self._inflight -= 1
+            # A call cancelled after stop() must not restart the idle clock
+            if self._inflight == 0 and self._end_time is None:
+                self._idle_since = time.perf_counter()
+
+    def metrics(self, prefix: str = "rollout") -> Dict[str, float]:
+        """Idle time of the engine (in seconds) and its share of the rollout wall time."""
+        end_time = self._end_time if self._end_time is not None else time.perf_counter()
+        wall_time = end_time - self._start_time if self._start_time is not None else 0.0
+        return {
+            f"{prefix}/gpu_idle_s": self.idle_time,
+            f"{prefix}/gpu_idle_ratio": self.idle_time / wall_time if wall_time > 0 else 0.0,
+        }
+
+
+class PartialRolloutController:
+    """
+    Suspends the unfinished requests of a step once a quota of prompts has completed, or once a deadline has passed,
+    and carries them over to the next step.
+
+    A prompt is completed once all its rollouts are, and only completed prompts are emitted, with all their rollouts,
+    so a GRPO group is never split across steps: the completed rollouts of a prompt with suspended rollouts are held
+    back until those complete.
+
+    A request is only suspended between two turns, or during a generation (the engine call is cancelled and the turn
+    is generated again on resume); a running interaction or tool call is never interrupted, so the interaction state
+    of the request stays consistent and is simply reused on resume. A request already suspended
+    ``max_carryover_steps`` times runs to completion, which bounds how stale a trajectory can get.
+
+    The controller lives as long as the rollout, so the suspended requests survive from one step to the next. All
+    methods except the constructor must be called from the event loop thread.
+    """
+
+    def __init__(self, completion_fraction: float = 1.0, deadline: float = 0.0, max_carryover_steps: int = 1):
+        """
+        Args:
+            completion_fraction: Fraction of the prompts of a step to complete before the unfinished requests are
+                suspended.
+            deadline: Seconds after the start of a step after which the unfinished requests are suspended (0 for no
+                deadline).
+            max_carryover_steps: Maximum number of times a request may be suspended.
+        """
+        if not 0.0 < completion_fraction <= 1.0:
+            raise ValueError(f"completion_fraction must be in (0, 1], got {completion_fraction}")
+        self.completion_fraction = completion_fraction
+        self.deadline = deadline
+        self.max_carryover_steps = max_carryover_steps
+
+        self.step = 0
+        self._suspended: List[SuspendedRollout] = []
+        # Completed requests held back until the other rollouts of their prompt complete, or to keep the output evenly
+        # divisible, emitted first in a later step
+        self._held_back: List[Any] = []
+        # request_id -> (step of its prompt, uid of its prompt)
+        self._origins: Dict[str, Tuple[int, Any]] = {}
+        # uid of a prompt not emitted yet -> number of its requests not completed yet
+        self._num_unfinished: Dict[Any, int] = {}
+
+        self._suspend_event: Optional[asyncio.Event] = None
+        self._deadline_handle: Optional[asyncio.TimerHandle] = None
+        self._deadline_passed = False
+        self._quota = 0
+        self._min_completed = 1
+        self._num_completed = 0
+        self._num_completed_groups = 0
+
+        # Metrics of the current step
+        self._num_new = 0
+        self._num_resumed = 0
+        self._num_suspended = 0
+        self._num_emitted = 0
+        self._suspend_time: Optional[float] = None
+        self._start_time = 0.0
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> Optional["PartialRolloutController"]:
+        """Build a controller from the ``multi_turn.partial_rollout`` config; returns None unless it is enabled."""
+        config = config or {}
+        if not config.get("enable", False):
+            return None
+        return cls(
+            completion_fraction=config.get("completion_fraction", 1.0) or 1.0,
+            deadline=config.get("deadline", 0) or 0.0,
+            max_carryover_steps=config.get("max_carryover_steps", 1) or 0,
+        )
+
+    def begin_step(
+        self, new_requests: List[Any], uids: List[Any], group_size: int = 1, multiple: int = 1
+    ) -> Tuple[List[SuspendedRollout], List[Any]]:
+        """
+        Start a step with the requests of its prompts.
+
+        Args:
+            new_requests: The requests created from the prompts of this step.
+            uids: The uid of the prompt of each new request.
+            group_size: Number of requests of each prompt.
+            multiple: The number of emitted requests must be a multiple of it, e.g. so the output can be split across
+                the tensor parallel ranks. Enough prompts complete before the others are suspended.
+
+        Returns:
+            The requests suspended in the previous step, to resume, and the completed requests held back.
+        """
+        self.step += 1
+        for req, uid in zip(new_requests, uids):
+            self._origins[req.request_id] = (self.step, uid)
+            self._num_unfinished[uid] = self._num_unfinished.get(uid, 0) + 1
+        suspended, self._suspended = self._suspended, []
+        held_back, self._held_back = self._held_back, []
+
+        # The prompts of the held back requests may be completed already
+        total = len(self._num_unfinished)
+        self._min_completed = min(total, multiple // math.gcd(multiple, group_size))
+        self._quota = max(math.ceil(self.completion_fraction * total), self._min_completed)
+        self._num_completed = 0
+        self._num_completed_groups = sum(1 for num_unfinished in self._num_unfinished.values() if num_unfinished == 0)
+        self._deadline_passed = False
+        self._suspend_event = asyncio.Event()
+        if self.deadline > 0:
+            self._deadline_handle = asyncio.get_event_loop().call_later(self.deadline, self._on_deadline)
+
+        self._num_new = len(new_requests)
+        self._num_resumed = len(suspended)
+        self._num_suspended = 0
+        self._num_emitted = 0
+        self._suspend_time = None
+        self._start_time = time.perf_counter()
+        return suspended, held_back
+
+    def end_step(self, completed: List[Any], multiple: int = 1) -> List[Any]:
+        """
+        End the step and choose the completed requests to emit.
+
+        Only the prompts whose requests all completed are emitted, with all their requests. The oldest prompts are
+        emitted first, as many as keep the number of emitted requests a multiple of ``multiple``; the other requests are
+        held back for a later step.
+
+        Returns:
+            The requests to emit, sorted by the step and position of their prompt.
+        """
+        if self._deadline_handle is not None:
+            self._deadline_handle.cancel()
+            self._deadline_handle = None
+        groups = defaultdict(list)
+        for req in sorted(completed, key=self.sort_key):
+            groups[self.group_key(req)].append(req)
+        completed_groups = [uid for uid in groups if self._num_unfinished[uid] == 0]
+
+        num_groups = num_emitted = 0
+        total = 0
+        for i, uid in enumerate(completed_groups):
+            total += len(groups[uid])
+            if total % multiple == 0:
+                num_groups, num_emitted = i + 1, total
+        if num_groups == 0:
+            # No number of completed prompts splits evenly across the ranks: emit them all rather than nothing
+            num_groups, num_emitted = len(completed_groups), total
+
+        emitted = []
+        for uid in completed_groups[:num_groups]:
+            emitted.extend(groups.pop(uid))
+            del self._num_unfinished[uid]
+        self._held_back = sorted((req for reqs in groups.values() for req in reqs), key=self.sort_key)
+        self._num_emitted = num_emitted
+        return emitted
+
+    def sort_key(self, req: Any) -> Tuple[int, int, int]:
+        step, _ = self._origins.get(req.request_id, (self.step, None))
+        return step, req.batch_data_id, req.rollout_offset
+
+    def group_key(self, req: Any) -> Any:
+        """
+        The uid of the prompt of a request. Unlike ``batch_data_id``, which is the index of the prompt in the batch of
+        its step, it tells apart the prompts of different steps.
+        """
+        return self._origins[req.request_id][1]
+
+    def pop_uid(self, req: Any) -> Any:
+        """The uid of the prompt of an emitted request, which the controller then forgets."""
+        return self._origins.pop(req.request_id)[1]
+
+    def can_suspend(self, progress: RolloutProgress) -> bool:
+        return progress.num_suspensions < self.max_carryover_steps
+
+    def should_suspend(self, progress: RolloutProgress) -> bool:
+        return self._suspend_event is not None and self._suspend_event.is_set() and self.can_suspend(progress)
+
+    async def run_interruptible(self, progress: RolloutProgress, coro: Awaitable[Any]) -> Optional[Any]:
+        """
+        Await an engine call, unless the request is suspended first.
+
+        Returns:
+            The result of the call, or None if it was cancelled because the request is suspended.
+        """
+        task = asyncio.ensure_future(coro)
+        if not self.can_suspend(progress):
+            return await task
+        waiter = asyncio.ensure_future(self._suspend_event.wait())
+        try:
+            await asyncio.wait({task, waiter}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            waiter.cancel()
+        if task.done():
+            return task.result()
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        return None
+
+    def suspend(self, req: Any, progress: RolloutProgress) -> None:
+        progress.num_suspensions += 1
+        self._suspended.append(SuspendedRollout(request=req, progress=progress))
+        self._num_suspended += 1
+
+    def on_completed(self, req: Any) -> None:
+        self._num_completed += 1
+        uid = self.group_key(req)
+        self._num_unfinished[uid] -= 1
+        if self._num_unfinished[uid] == 0:
+            self._num_completed_groups += 1
+            self._maybe_suspend()
+
+    def metrics(self, prefix: str = "rollout/partial") -> Dict[str, float]:
+        """Number of requests suspended, resumed and emitted in the step, and when the suspension started."""
+        return {
+            f"{prefix}/new": float(self._num_new),
+            f"{prefix}/resumed": float(self._num_resumed),
+            f"{prefix}/completed": float(self._num_completed),
+            f"{prefix}/completed_groups": float(self._num_completed_groups),
+            f"{prefix}/suspended": float(self._num_suspended),
+            f"{prefix}/emitted": float(self._num_emitted),
+            f"{prefix}/held_back": float(len(self._held_back)),
+            f"{prefix}/time_to_suspend_s": (self._suspend_time - self._start_time) if self._suspend_time is not None else 0.0,
+        }
+
+    def _on_deadline(self) -> None:
+        self._deadline_handle = None
+        self._deadline_passed = True
+        self._maybe_suspend()
+
+    def _maybe_suspend(self) -> None:
+        if self._suspend_event.is_set():
+            return
+        if self._num_completed_groups >= self._quota or (self._deadline_passed and self._num_completed_groups >= self._min_completed):
+            self._suspend_time = time.perf_counter()
+            self._suspend_event.set()
@@ -20,6 +20,7 @@ import logging
 import multiprocessing as mp
 import os
 import time
+from contextlib import nullcontext
 from copy import deepcopy
 from json import JSONDecodeError
 import json
@@ -70,6 +71,8 @@ from verl.workers.rollout.schemas import (
     FinishReasonTypeEnum,
     Message,
 )
+from verl.workers.rollout.sglang_rollout.admission import AdmissionController
+from verl.workers.rollout.sglang_rollout.partial_rollout import EngineIdleTracker, PartialRolloutController, RolloutProgress
 from verl.workers.rollout.sglang_rollout.utils import broadcast_pyobj
 
 try:
@@ -237,6 +240,20 @@ def get_tool_call_parser_type(processing_class: Union[PreTrainedTokenizer, PreTr
         raise ValueError(f"No tool call parser found for processing_class {processing_class}")
 
 
+def _merge_stop_params(sampling_params: dict, stop_params: dict) -> None:
+    """Add the stop strings and stop token ids declared by an interaction to the sampling params of an engine call."""
+    for key in ("stop", "stop_token_ids"):
+        if not stop_params.get(key):
+            continue
+        existing = sampling_params.get(key) or []
+        if isinstance(existing, (str, int)):
+            existing = [existing]
+        sampling_params[key] = list(dict.fromkeys([*existing, *stop_params[key]]))
+    if stop_params.get("stop"):
+        # The interaction parses the generated text, which must still end with the matched stop string
+        sampling_params["no_stop_trim"] = True
+
+
 class SGLangRollout(BaseRollout):
     def __init__(
         self,
@@ -284,6 +301,11 @@ class SGLangRollout(BaseRollout):
             self._function_call_parser,
         ) = self._initialize_tools(config, processing_class)
         self.interaction: dict[str, BaseInteraction] = self._intitalize_interaction(config)
+        # Stop conditions declared by the interaction, applied to the assistant turns of its requests
+        self._interaction_stop_params: dict = self.interaction.get_stop_sequences() if self.interaction is not None else {}
+        # Keeps the requests suspended by a partial rollout until the next step (None unless enabled)
+        self._partial_rollout: Optional[PartialRolloutController] = PartialRolloutController.from_config(config.multi_turn.get("partial_rollout", None))
+        self._engine_idle_tracker: Optional[EngineIdleTracker] = None
         # If turn on `free_cache_engine`, SGLang engine's KV cache
         # will be freed after each `generate_sequences` call.
         assert not (not config.enforce_eager and config.free_cache_engine), "disable CUDA graph (enforce_eager = False) if free cache engine"
@@ -731,10 +753,21 @@ class SGLangRollout(BaseRollout):
         req: AsyncRolloutRequest,
         do_sample: bool = True,
         is_validate: bool = False,
+        progress: Optional[RolloutProgress] = None,
+        partial: Optional[PartialRolloutController] = None,
         **kwargs,
-    ) -> AsyncRolloutRequest:
+    ) -> Optional[AsyncRolloutRequest]:
+        """
+        Roll out a request until it completes. With a partial rollout controller, the request may be suspended
+        instead, in which case it is handed to the controller and None is returned; it resumes from ``progress``.
+        """
         assert self._tp_rank == 0, "only the master process can call this function"
-        _req = deepcopy(req)
+        if progress is None:
+            _req = deepcopy(req)
+            progress = RolloutProgress()
+        else:
+            # A suspended request is owned by the controller, and continues where it stopped
+            _req = req
         finish_reason_type = None
         output = None
 
@@ -747,10 +780,15 @@ class SGLangRollout(BaseRollout):
                 video_data = _req.multi_modal_data["video"]
                 logger.warning("video support is not implemented yet, current length of video data is %d", len(video_data))
 
-        current_turns = 0
-        user_turns = 0
-        user_turn_rewards = []
-        interaction_turn_metrics = []
+        current_turns = progress.current_turns
+        user_turns = progress.user_turns
+        user_turn_rewards = progress.user_turn_rewards
+        interaction_turn_metrics = progress.interaction_turn_metrics
+
+        def suspend() -> None:
+            progress.current_turns = current_turns
+            progress.user_turns = user_turns
+            partial.suspend(_req, progress)
 
         # Create request-level sampling parameters
         request_sampling_params = self.sampling_params.copy()
@@ -785,6 +823,9 @@ class SGLangRollout(BaseRollout):
         request_sampling_params.update(kwargs)
 
         while current_turns < self.config.multi_turn.max_assistant_turns:
+            if partial is not None and _req.state in (AsyncRolloutRequestStateEnum.PENDING, AsyncRolloutRequestStateEnum.RUNNING) and partial.should_suspend(progress):
+                suspend()
+                return None
             if _req.state == AsyncRolloutRequestStateEnum.PENDING:
                 await self._handle_pending_state(_req)
                 _req.state = AsyncRolloutRequestStateEnum.RUNNING
@@ -817,7 +858,14 @@ class SGLangRollout(BaseRollout):
                     finish_reason_type = FinishReasonTypeEnum.LENGTH
                     break
                 # Video support is not implemented yet
-                output = await self._handle_engine_call(_req, request_sampling_params, image_data=image_data)
+                if partial is None:
+                    output = await self._handle_engine_call(_req, request_sampling_params, image_data=image_data)
+                else:
+                    output = await partial.run_interruptible(progress, self._handle_engine_call(_req, request_sampling_params, image_data=image_data))
+                    if output is None:
+                        # Cancelled mid-generation: the turn is generated again, from its prompt, on resume
+                        suspend()
+                        return None
                 content = output["text"]
                 finish_reason_type = FinishReasonTypeEnum.from_str(output["meta_info"]["finish_reason"]["type"])
                 current_turns += 1
@@ -902,8 +950,13 @@ class SGLangRollout(BaseRollout):
             tool_reward_tasks.append(calc_reward_and_release_fn(name, tool))
         tool_reward_scores = await asyncio.gather(*tool_reward_tasks)
         tool_reward_scores = dict(tool_reward_scores)
+        if _req.interaction_kwargs:
+            # Release the interaction state (and any environment it holds) of this request
+            await self.interaction.finalize_interaction(_req.request_id)
         all_rewards = {**tool_reward_scores, **{"user_turn_rewards": user_turn_rewards, "interaction_turn_metrics": interaction_turn_metrics}}
         _req.finalize(self.processing_class, all_rewards, finish_reason_type)
+        if partial is not None:
+            partial.on_completed(_req)
 
         return _req
 
@@ -913,12 +966,15 @@ class SGLangRollout(BaseRollout):
         kwargs = sampling_params.copy()
         kwargs["max_new_tokens"] = max_new_tokens
         kwargs["n"] = 1  # group size is supported in preprocess
-        output = await self._engine.async_generate(
-            input_ids=generation_prompt_ids,
-            sampling_params=kwargs,
-            return_logprob=False,
-            image_data=image_data,
-        )
+        if _req.interaction_kwargs and self._interaction_stop_params:
+            _merge_stop_params(kwargs, self._interaction_stop_params)
+        with self._engine_idle_tracker.busy() if self._engine_idle_tracker is not None else nullcontext():
+            output = await self._engine.async_generate(
+                input_ids=generation_prompt_ids,
+                sampling_params=kwargs,
+                return_logprob=False,
+                image_data=image_data,
+            )
         return output
 
     async def _handle_pending_state(self, _req: AsyncRolloutRequest) -> AsyncRolloutRequest:
@@ -955,19 +1011,41 @@ class SGLangRollout(BaseRollout):
                 prompts,
                 n=1 if is_validate else self.config.n,
             )
+            # Bound the requests contending for the KV cache at once (no limit unless configured)
+            admission = AdmissionController.from_config(self.config.multi_turn.get("admission", None))
+            # Validation always runs to completion, and the trainer only provides the prompt uids for training steps
+            partial = self._partial_rollout if not is_validate and "uid" in prompts.non_tensor_batch else None
             loop = asyncio.get_event_loop()
-            output_req_list = loop.run_until_complete(
-                asyncio.gather(
-                    *[self._async_rollout_a_request(req, do_sample, is_validate, **kwargs) for req in req_list],
-                )
-            )
-            sorted_output_req_list = sorted(output_req_list, key=lambda x: (x.batch_data_id, x.rollout_offset))
+            rollout_coros = [self._admit_and_rollout_a_request(admission, req, do_sample, is_validate, partial=partial, **kwargs) for req in req_list]
+            held_back = []
+            if partial is not None:
+                uids = [prompts.non_tensor_batch["uid"][req.batch_data_id] for req in req_list]
+                # Every tensor parallel rank gets an equal share of the output, made of whole groups of n requests
+                suspended, held_back = partial.begin_step(req_list, uids, group_size=self.config.n, multiple=self._tp_size)
+                # The resumed requests were admitted before the new ones, so they are queued first
+                rollout_coros = [self._admit_and_rollout_a_request(admission, s.request, do_sample, is_validate, progress=s.progress, partial=partial, **kwargs) for s in suspended] + rollout_coros
+            self._engine_idle_tracker = EngineIdleTracker()
+            self._engine_idle_tracker.start()
+            output_req_list = loop.run_until_complete(asyncio.gather(*rollout_coros))
+            self._engine_idle_tracker.stop()
+            rollout_metrics = {**admission.metrics(), **self._engine_idle_tracker.metrics()}
+            self._engine_idle_tracker = None
+            if partial is None:
+                sorted_output_req_list = sorted(output_req_list, key=lambda x: (x.batch_data_id, x.rollout_offset))
+                output_uids = None
+            else:
+                completed = held_back + [req for req in output_req_list if req is not None]
+                sorted_output_req_list = partial.end_step(completed, multiple=self._tp_size)
+                output_uids = [partial.pop_uid(req) for req in sorted_output_req_list]
+                rollout_metrics.update(partial.metrics())
         else:
             sorted_output_req_list = None
+            rollout_metrics = None
+            output_uids = None
 
         dist.barrier()
-        [sorted_output_req_list] = broadcast_pyobj(
-            data=[sorted_output_req_list],
+        [sorted_output_req_list, rollout_metrics, output_uids] = broadcast_pyobj(
+            data=[sorted_output_req_list, rollout_metrics, output_uids],
             rank=self._rank,
             dist_group=self._device_mesh_cpu["tp"].get_group(),
             src=self._device_mesh_cpu["tp"].mesh[0].item(),
@@ -1071,14 +1149,39 @@ class SGLangRollout(BaseRollout):
             loop = asyncio.get_event_loop()
             loop.run_until_complete(self._engine.flush_cache())
 
+        non_tensor_batch = {
+            "messages": np.array(messages),
+            "reward_scores": np.array(reward_scores),
+        }
+        if output_uids is not None:
+            # A partial rollout returns the completed requests of any step: the trainer matches them to their prompts
+            non_tensor_batch["uid"] = np.array(output_uids, dtype=object)
+            non_tensor_batch["rollout_offset"] = np.array([req.rollout_offset for req in sorted_output_req_list], dtype=np.int64)
+
         return DataProto(
             batch=batch,
-            non_tensor_batch={
-                "messages": np.array(messages),
-                "reward_scores": np.array(reward_scores),
-            },
+            non_tensor_batch=non_tensor_batch,
+            meta_info={"metrics": rollout_metrics},
         )
 
+    async def _admit_and_rollout_a_request(
+        self,
+        admission: AdmissionController,
+        req: AsyncRolloutRequest,
+        do_sample: bool = True,
+        is_validate: bool = False,
+        progress: Optional[RolloutProgress] = None,
+        partial: Optional[PartialRolloutController] = None,
+        **kwargs,
+    ) -> Optional[AsyncRolloutRequest]:
+        # A multi-turn request may grow up to its prompt plus the response budget shared by all its turns
+        tokens = min(req.max_model_len, len(req.input_ids) + self.config.response_length)
+        # The rollouts of a prompt share its prefix, which the group affinity policy keeps in the prefix cache.
+        # A request resumed by a partial rollout keeps the batch_data_id of an earlier step, so its prompt uid is used.
+        group = partial.group_key(req) if partial is not None else req.batch_data_id
+        async with admission.admit(tokens, group=group):
+            return await self._async_rollout_a_request(req, do_sample, is_validate, progress=progress, partial=partial, **kwargs)
+
     def _preprocess_prompt_to_async_rollout_requests(self, prompts: DataProto, n: int) -> list[AsyncRolloutRequest]:
         assert "raw_prompt" in prompts.non_tensor_batch, "need data.return_raw_chat=True, due to no official way do parse_messages"
         req_list = []